@@ -1,6 +1,10 @@
+import bisect
 import colorsys
 from fractions import Fraction
+import functools
+import heapq
 import itertools
+import math
 import random
 from typing import Iterable, Tuple
 import typing
@@ -10,6 +14,7 @@ import discord
 
 HSVTuple = Tuple[Fraction, Fraction, Fraction]
 RGBTuple = Tuple[float, float, float]
+LabTuple = Tuple[float, float, float]
 
 DEFAULT_COLORS = [
     (240, 248, 255),
@@ -199,31 +204,103 @@ def min_palette_diff(p):
         diff = color_diff(a, b)
         if min == None or diff < min:
             min = diff
-    return diff
+    return min
+
+
+@functools.lru_cache(maxsize=None)
+def distance_matrix(colors: typing.Tuple[RGBTuple, ...]) -> typing.List[typing.List[float]]:
+    """
+    Computes the pairwise `color_diff` between every color given, cached per set of colors.
+    """
+    return [[color_diff(a, b) for b in colors] for a in colors]
+
+
+def _select_palette(
+    dist: typing.List[typing.List[float]],
+    n: int,
+    rng: random.Random,
+    max_swaps: int,
+) -> typing.List[int]:
+    """
+    Greedily picks the `n` indices furthest from each other, then swaps out members of the
+    closest pair while doing so increases the palette's spread.
+    """
+    candidates = range(len(dist))
+    chosen = [rng.choice(candidates)]
+    taken = set(chosen)
+    nearest = list(dist[chosen[0]])
+
+    for _ in range(n - 1):
+        best = max(nearest[i] for i in candidates if i not in taken)
+        picked = rng.choice([i for i in candidates if i not in taken and nearest[i] == best])
+        chosen.append(picked)
+        taken.add(picked)
+        nearest = [min(a, b) for a, b in zip(nearest, dist[picked])]
+
+    for _ in range(max_swaps):
+        if len(chosen) < 2:
+            break
+
+        current, a, b = min(
+            (dist[a][b], a, b) for a, b in itertools.combinations(chosen, 2)
+        )
+        outside = [i for i in candidates if i not in taken]
+        swapped = False
+
+        for victim in (a, b):
+            rest = [i for i in chosen if i != victim]
+            spread, replacement = max(
+                ((min(dist[c][r] for r in rest), c) for c in outside), default=(current, victim)
+            )
+            if spread > current:
+                chosen[chosen.index(victim)] = replacement
+                taken.remove(victim)
+                taken.add(replacement)
+                swapped = True
+                break
+
+        if not swapped:
+            break
+
+    return chosen
 
 
 def get_palette(
-    n: int = 100, Lmin: int = 5, Lmax: int = 90, maxLoops: int = 100000
+    n: int = 100,
+    Lmin: int = 5,
+    Lmax: int = 90,
+    maxLoops: int = 100000,
+    *,
+    seed: typing.Optional[int] = None,
+    refine: bool = True,
 ) -> Iterable[RGBTuple]:
     """
     Obtains a palette based on the number of colors desired.
+
+    Colors are picked by farthest-point selection over the `DEFAULT_COLORS` distance matrix,
+    optionally refined by swapping out the closest pair for at most `maxLoops` passes.
+    Passing a `seed` makes the result reproducible.
     """
-    data = []
+    indices = []
 
-    for color in DEFAULT_COLORS:
+    for i, color in enumerate(DEFAULT_COLORS):
         hls = colorsys.rgb_to_hls(color[0] / 255, color[1] / 255, color[2] / 255)
         L = 100 * hls[1]
         if (L >= Lmin) and (L <= Lmax):
-            data.append(color)
+            indices.append(i)
+
+    if n < 0 or n > len(indices):
+        raise ValueError("Sample larger than population or is negative")
 
-    palettes = []
+    if n == 0:
+        return []
 
-    for i in range(0, maxLoops):
-        palettes.append(random.sample(data, k=n))
+    full = distance_matrix(tuple(DEFAULT_COLORS))
+    dist = [[full[a][b] for b in indices] for a in indices]
 
-    palettes.sort(key=min_palette_diff, reverse=True)
+    chosen = _select_palette(dist, n, random.Random(seed), maxLoops if refine else 0)
 
-    bestPalette = palettes[0]
+    bestPalette = [DEFAULT_COLORS[indices[i]] for i in chosen]
 
     bestPalette.sort(key=sort_palette)
 
@@ -252,3 +329,261 @@ def hex_to_rgb(h: str) -> Tuple[int, int, int]:
     h = h.replace("#", "").replace("0x", "").replace("0X", "")
     return tuple(int(h[i : i + 2], 16) for i in (0, 2, 4)) # type: ignore[return-value]
 
+
+def rgb_to_lab(rgb: typing.Union[RGBTuple, discord.Colour]) -> LabTuple:
+    """
+    Converts an sRGB color (0-255 channels) to CIELAB under a D65 white point.
+    """
+    if isinstance(rgb, discord.Colour):
+        rgb = (rgb.r, rgb.g, rgb.b)
+
+    def linear(c: float) -> float:
+        c = c / 255
+        return c / 12.92 if c <= 0.04045 else ((c + 0.055) / 1.055) ** 2.4
+
+    r, g, b = (linear(c) for c in rgb)
+
+    x = (r * 0.4124564 + g * 0.3575761 + b * 0.1804375) / 0.95047
+    y = r * 0.2126729 + g * 0.7151522 + b * 0.0721750
+    z = (r * 0.0193339 + g * 0.1191920 + b * 0.9503041) / 1.08883
+
+    def f(t: float) -> float:
+        return t ** (1 / 3) if t > 216 / 24389 else (24389 / 27 * t + 16) / 116
+
+    fx, fy, fz = f(x), f(y), f(z)
+
+    return (116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz))
+
+
+# The largest lightness weight S_L can take for L* in [0, 100]. The other CIEDE2000 terms form a
+# positive definite quadratic (|R_T| < 2), so ΔE2000 >= |ΔL*| / MAX_S_L for any pair of colors.
+MAX_S_L = 1 + (0.015 * 50**2) / math.sqrt(20 + 50**2)
+# The smallest eigenvalue of the chroma/hue quadratic, 1 - max|R_T| / 2 with max|R_T| = 2 * sin(60°).
+MIN_CH_WEIGHT = 1 - math.sin(math.radians(60))
+
+
+def _delta_e_bound(lab1: LabTuple, C1: float, lab2: LabTuple, C2: float) -> float:
+    # A cheap lower bound on ΔE2000. C' <= 1.5 * C* and S_H <= S_C, so S bounds both weights from above.
+    dL = (lab1[0] - lab2[0]) / MAX_S_L
+    S = 1 + 0.045 * 0.75 * (C1 + C2)
+    dab2 = (lab1[1] - lab2[1]) ** 2 + (lab1[2] - lab2[2]) ** 2
+    return math.sqrt(dL * dL + MIN_CH_WEIGHT * dab2 / (S * S))
+
+
+def delta_e(lab1: LabTuple, lab2: LabTuple) -> float:
+    """
+    Determines the perceptual distance between two CIELAB colors using CIEDE2000.
+    """
+    return _delta_e(lab1, math.hypot(lab1[1], lab1[2]), lab2, math.hypot(lab2[1], lab2[2]))
+
+
+def _delta_e(lab1: LabTuple, C1: float, lab2: LabTuple, C2: float) -> float:
+    L1, a1, b1 = lab1
+    L2, a2, b2 = lab2
+
+    C_bar = (C1 + C2) / 2
+    G = 0.5 * (1 - math.sqrt(C_bar**7 / (C_bar**7 + 25**7)))
+
+    a1p, a2p = a1 * (1 + G), a2 * (1 + G)
+    C1p, C2p = math.hypot(a1p, b1), math.hypot(a2p, b2)
+    h1p = math.degrees(math.atan2(b1, a1p)) % 360 if C1p else 0.0
+    h2p = math.degrees(math.atan2(b2, a2p)) % 360 if C2p else 0.0
+
+    dLp = L2 - L1
+    dCp = C2p - C1p
+
+    if C1p * C2p == 0:
+        dhp = 0.0
+    elif abs(h2p - h1p) <= 180:
+        dhp = h2p - h1p
+    elif h2p - h1p > 180:
+        dhp = h2p - h1p - 360
+    else:
+        dhp = h2p - h1p + 360
+
+    dHp = 2 * math.sqrt(C1p * C2p) * math.sin(math.radians(dhp / 2))
+
+    Lp_bar = (L1 + L2) / 2
+    Cp_bar = (C1p + C2p) / 2
+
+    if C1p * C2p == 0:
+        hp_bar = h1p + h2p
+    elif abs(h1p - h2p) <= 180:
+        hp_bar = (h1p + h2p) / 2
+    elif h1p + h2p < 360:
+        hp_bar = (h1p + h2p + 360) / 2
+    else:
+        hp_bar = (h1p + h2p - 360) / 2
+
+    T = (
+        1
+        - 0.17 * math.cos(math.radians(hp_bar - 30))
+        + 0.24 * math.cos(math.radians(2 * hp_bar))
+        + 0.32 * math.cos(math.radians(3 * hp_bar + 6))
+        - 0.20 * math.cos(math.radians(4 * hp_bar - 63))
+    )
+
+    S_L = 1 + (0.015 * (Lp_bar - 50) ** 2) / math.sqrt(20 + (Lp_bar - 50) ** 2)
+    S_C = 1 + 0.045 * Cp_bar
+    S_H = 1 + 0.015 * Cp_bar * T
+
+    d_theta = 30 * math.exp(-(((hp_bar - 275) / 25) ** 2))
+    R_C = 2 * math.sqrt(Cp_bar**7 / (Cp_bar**7 + 25**7))
+    R_T = -R_C * math.sin(math.radians(2 * d_theta))
+
+    return math.sqrt(
+        (dLp / S_L) ** 2
+        + (dCp / S_C) ** 2
+        + (dHp / S_H) ** 2
+        + R_T * (dCp / S_C) * (dHp / S_H)
+    )
+
+
+def discord_colour_names() -> typing.Dict[str, discord.Colour]:
+    """
+    Gets every named `discord.Colour` classmethod that `convert_color_name` can resolve.
+    """
+    names: typing.Dict[str, discord.Colour] = {}
+
+    for name, attr in discord.Colour.__dict__.items():
+        if not isinstance(attr, classmethod) or name == "random":
+            continue
+        try:
+            colour = attr.__func__(discord.Colour)
+        except TypeError:
+            continue
+        if isinstance(colour, discord.Colour):
+            names[name] = colour
+
+    return names
+
+
+class ColorMatch(typing.NamedTuple):
+    name: typing.Optional[str]
+    rgb: Tuple[int, int, int]
+    distance: float
+
+
+class ColorIndex:
+    """
+    Precomputed CIELAB lookup table for nearest-color and similarity queries.
+
+    Entries are kept sorted by lightness and searched outwards from the query's lightness, so
+    ΔE2000 is only computed for entries that cheap lower bounds can't already rule out.
+    """
+
+    def __init__(
+        self,
+        colors: Iterable[
+            typing.Tuple[typing.Optional[str], typing.Union[Tuple[int, int, int], discord.Colour]]
+        ],
+    ):
+        entries = []
+        for position, (name, color) in enumerate(colors):
+            if isinstance(color, discord.Colour):
+                color = (color.r, color.g, color.b)
+            lab = rgb_to_lab(color)
+            entries.append((lab[0], position, name, tuple(color), lab))
+        entries.sort()
+
+        self.positions: typing.List[int] = [entry[1] for entry in entries]
+        self.names: typing.List[typing.Optional[str]] = [entry[2] for entry in entries]
+        self.rgbs: typing.List[Tuple[int, int, int]] = [entry[3] for entry in entries]  # type: ignore[misc]
+        self.labs: typing.List[LabTuple] = [entry[4] for entry in entries]
+        self.lightness: typing.List[float] = [lab[0] for lab in self.labs]
+        self.chromas: typing.List[float] = [math.hypot(lab[1], lab[2]) for lab in self.labs]
+
+    def __len__(self) -> int:
+        return len(self.rgbs)
+
+    def _match(self, i: int, distance: float) -> ColorMatch:
+        return ColorMatch(self.names[i], self.rgbs[i], distance)
+
+    def _outwards(self, L: float) -> typing.Iterator[typing.Tuple[float, int]]:
+        # Yields (lightness lower bound, entry) in increasing order of the bound.
+        hi = bisect.bisect_left(self.lightness, L)
+        lo = hi - 1
+        while lo >= 0 or hi < len(self.lightness):
+            if hi >= len(self.lightness) or (lo >= 0 and L - self.lightness[lo] <= self.lightness[hi] - L):
+                yield (L - self.lightness[lo]) / MAX_S_L, lo
+                lo -= 1
+            else:
+                yield (self.lightness[hi] - L) / MAX_S_L, hi
+                hi += 1
+
+    def _nearest_lab(self, lab: LabTuple, C: float, k: int) -> typing.List[ColorMatch]:
+        labs, chromas, positions = self.labs, self.chromas, self.positions
+        # The heap's top is the worst match kept: the farthest, then the latest inserted.
+        best: typing.List[typing.Tuple[float, int, int]] = []
+        for bound, i in self._outwards(lab[0]):
+            if len(best) == k:
+                if bound > -best[0][0]:
+                    break
+                if _delta_e_bound(lab, C, labs[i], chromas[i]) > -best[0][0]:
+                    continue
+            distance = _delta_e(lab, C, labs[i], chromas[i])
+            entry = (-distance, -positions[i], i)
+            if len(best) < k:
+                heapq.heappush(best, entry)
+            elif entry > best[0]:
+                heapq.heapreplace(best, entry)
+        return [self._match(i, -negative) for negative, _, i in sorted(best, reverse=True)]
+
+    def nearest(
+        self, color: typing.Union[RGBTuple, discord.Colour], k: int = 1
+    ) -> typing.List[ColorMatch]:
+        """
+        Finds the `k` closest colors in the index, closest first.
+        """
+        if k <= 0:
+            return []
+        lab = rgb_to_lab(color)
+        return self._nearest_lab(lab, math.hypot(lab[1], lab[2]), k)
+
+    def within(
+        self, color: typing.Union[RGBTuple, discord.Colour], radius: float
+    ) -> typing.List[ColorMatch]:
+        """
+        Finds every color in the index within `radius` ΔE2000 of the given color, closest first.
+        """
+        lab = rgb_to_lab(color)
+        C = math.hypot(lab[1], lab[2])
+        lo = bisect.bisect_left(self.lightness, lab[0] - radius * MAX_S_L)
+        hi = bisect.bisect_right(self.lightness, lab[0] + radius * MAX_S_L)
+
+        matches = []
+        for i in range(lo, hi):
+            distance = _delta_e(lab, C, self.labs[i], self.chromas[i])
+            if distance <= radius:
+                matches.append((distance, self.positions[i], i))
+        return [self._match(i, distance) for distance, _, i in sorted(matches)]
+
+    def nearest_many(
+        self, colors: Iterable[typing.Union[RGBTuple, discord.Colour]], k: int = 1
+    ) -> typing.List[typing.List[ColorMatch]]:
+        """
+        Finds the `k` closest colors in the index for each of the given colors, searching each distinct color once.
+        """
+        results: typing.Dict[RGBTuple, typing.List[ColorMatch]] = {}
+        keys: typing.List[RGBTuple] = []
+        for color in colors:
+            key: RGBTuple = (color.r, color.g, color.b) if isinstance(color, discord.Colour) else (color[0], color[1], color[2])
+            keys.append(key)
+            if key not in results:
+                results[key] = self.nearest(key, k)
+        return [list(results[key]) for key in keys]
+
+
+@functools.lru_cache(maxsize=None)
+def get_color_index() -> ColorIndex:
+    """
+    Gets the shared index over the named `discord.Colour`s and `DEFAULT_COLORS`.
+    """
+    colors: typing.Dict[Tuple[int, int, int], typing.Optional[str]] = {}
+
+    for name, colour in discord_colour_names().items():
+        colors.setdefault((colour.r, colour.g, colour.b), name)
+    for color in DEFAULT_COLORS:
+        colors.setdefault(color, None)
+
+    return ColorIndex((name, rgb) for rgb, name in colors.items())
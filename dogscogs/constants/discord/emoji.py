@@ -1,3 +1,4 @@
 
 MIN_NAME_LENGTH = 2
-MAX_NAME_LENGTH = 32
\ No newline at end of file
+MAX_NAME_LENGTH = 32
+MAX_FILE_SIZE = 256 * 1024
\ No newline at end of file
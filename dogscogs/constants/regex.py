@@ -1,16 +1,48 @@
+import re
 import typing
 
 TRIGGER = r"[^a-z0-9\s@<>#]"
-IP_ADDRESS = r"(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
+IP_ADDRESS = r"(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
 PORT = r"""(?:
-  (?![7-9]\\d\\d\\d\\d) #Ignrore anything above 7....
-  (?!6[6-9]\\d\\d\\d)  #Ignore anything abovr 69...
-  (?!65[6-9]\\d\\d)   #etc...
-  (?!655[4-9]\\d)
+  (?![7-9]\d\d\d\d) #Ignrore anything above 7....
+  (?!6[6-9]\d\d\d)  #Ignore anything abovr 69...
+  (?!65[6-9]\d\d)   #etc...
+  (?!655[4-9]\d)
   (?!6553[6-9])
   (?!0+)            #ignore complete 0(s)
-  (?P<Port>\\d{1,5})
+  (?P<Port>\d{1,5})
 )"""
-IMAGE=r"(http)?s?:?(\\/\\/[^\"']*\\.(?:png|jpg|jpeg|gif|png|svg))"
+IMAGE=r"(http)?s?:?(\/\/[^\"']*\.(?:png|jpg|jpeg|gif|png|svg))"
 EMOJI_NAME = r"^[a-zA-Z0-9_]+$"
 EMOJI_URL = r"(http(s?):)([/|.|\w|\s|-])*\.(?:jpg|jpeg|gif|png)"
+CHANNEL_MENTION = r"^(?:<#(\d+)>|(\d+))$"
+USER_MENTION = r"^(?:<@!?(\d+)>|(\d+))$"
+MENTION = r"^(?:<#(\d+)>|<@!?(\d+)>|<@&(\d+)>|(\d{15,20}))$"
+CUSTOM_EMOJI = r"<(a?):(\w+):(\d+)>"
+_EMOJI_CHAR = r"[\u00A9\u00AE\u203C\u2049\u2122\u2139\u2194-\u21AA\u231A-\u23FF\u24C2\u25AA-\u27BF\u2934\u2935\u2B05-\u2B55\u3030\u303D\u3297\u3299\U0001F000-\U0001FAFF]\uFE0F?[\U0001F3FB-\U0001F3FF]?"
+UNICODE_EMOJI = (
+    r"[\U0001F1E6-\U0001F1FF]{2}"
+    r"|[0-9#*]\uFE0F?\u20E3"
+    rf"|{_EMOJI_CHAR}(?:\u200D{_EMOJI_CHAR})*(?:[\U000E0020-\U000E007E]+\U000E007F)?"
+)
+EMOJI = rf"{CUSTOM_EMOJI}|({UNICODE_EMOJI})"
+DURATION_CLOCK = r"^(?:(\d+):([0-5][0-9])|([0-5]?[0-9])):([0-5][0-9])$"
+DURATION_PART = r"\s*(\d+)\s*([a-z]+)\s*(?:,\s*)?(?:and\s+)?"
+NOT_RGB = r"[^0-9,]"
+
+# Compiled once at import, so hot paths don't go through `re`'s bounded internal cache.
+TRIGGER_REGEX = re.compile(TRIGGER)
+IP_ADDRESS_REGEX = re.compile(IP_ADDRESS)
+PORT_REGEX = re.compile(PORT, re.X)
+IMAGE_REGEX = re.compile(IMAGE)
+EMOJI_NAME_REGEX = re.compile(EMOJI_NAME)
+EMOJI_URL_REGEX = re.compile(EMOJI_URL)
+CHANNEL_MENTION_REGEX = re.compile(CHANNEL_MENTION)
+USER_MENTION_REGEX = re.compile(USER_MENTION)
+MENTION_REGEX = re.compile(MENTION)
+CUSTOM_EMOJI_REGEX = re.compile(CUSTOM_EMOJI)
+UNICODE_EMOJI_REGEX = re.compile(UNICODE_EMOJI)
+EMOJI_REGEX = re.compile(EMOJI)
+DURATION_CLOCK_REGEX = re.compile(DURATION_CLOCK)
+DURATION_PART_REGEX = re.compile(DURATION_PART, re.I)
+NOT_RGB_REGEX = re.compile(NOT_RGB)
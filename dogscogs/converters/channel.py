@@ -1,29 +1,38 @@
 import typing
 from redbot.core import commands
 
+from ..constants import regex
 from ..constants.discord.channel import TEXT_TYPES
 
-from ..core.converter import DogCogConverter
+from ..core.converter import CHANNEL_EVENTS, CacheScope, DogCogConverter
+
 
 class TextChannelList(DogCogConverter):
+    cache_scope: typing.ClassVar[typing.Optional[CacheScope]] = "guild"
+    invalidated_by: typing.ClassVar[typing.Tuple[str, ...]] = CHANNEL_EVENTS
+
     @staticmethod
     async def parse(ctx: commands.GuildContext, argument: str) -> typing.List[TEXT_TYPES]: # type:ignore[override]
-        channels = ctx.guild.channels
-        args = argument.split()
+        channel_list = []
+        seen: typing.Set[int] = set()
+        missing = []
+
+        for arg in argument.split():
+            match = regex.CHANNEL_MENTION_REGEX.match(arg)
+            channel = (
+                ctx.guild.get_channel_or_thread(int(match.group(1) or match.group(2)))
+                if match is not None
+                else None
+            )
 
-        channel_list = [
-            channel
-            for channel in channels
-            if channel.mention in args or channel.id in args
-        ]
-        args = [
-            arg
-            for arg in args
-            if not arg in [channel.mention for channel in channel_list]
-        ]
+            if channel is None:
+                missing.append(arg)
+            elif channel.id not in seen:
+                seen.add(channel.id)
+                channel_list.append(channel)
 
-        if len(args) > 0:
-            raise commands.BadArgument(f"No channels were found for: {','.join(args)}")
+        if len(missing) > 0:
+            raise commands.BadArgument(f"No channels were found for: {','.join(missing)}")
 
         bad_channels = [
             channel.mention
@@ -36,4 +45,4 @@ class TextChannelList(DogCogConverter):
                 f"Can't read messages for {','.join(bad_channels)}"
             )
 
-        return channel_list # type: ignore[return-value]
\ No newline at end of file
+        return channel_list # type: ignore[return-value]
@@ -1,9 +1,13 @@
+import calendar
 import datetime
+import functools
 from itertools import permutations
+import re
+import typing
 from redbot.core import commands
 
-from ..constants import TIMEZONE
 from ..core.converter import DogCogConverter
+from ..parsers.date import TimezoneResolver, resolve_timezone
 
 def date_formats():
     years = ("%Y", "%y")
@@ -24,14 +28,93 @@ def date_formats():
                         yield "/".join(combo).strip()
 
 
+# Mirrors the `strptime` directive patterns for each field `date_formats` uses.
+_FIELD_REGEXES = {
+    "%d": re.compile(r"3[01]|[12]\d|0[1-9]|[1-9]| [1-9]"),
+    "%m": re.compile(r"1[0-2]|0[1-9]|[1-9]"),
+    "%Y": re.compile(r"\d\d\d\d"),
+    "%y": re.compile(r"\d\d"),
+}
+_MONTH_NAMES = {
+    "%b": {calendar.month_abbr[i].lower(): i for i in range(1, 13)},
+    "%B": {calendar.month_name[i].lower(): i for i in range(1, 13)},
+}
+_DATE_REGEX = re.compile(
+    r"(?P<spaced>( ?[^\W_]+)\s+([^\W_]+)(?:\s+([^\W_]+))?)"
+    r"|(?P<slashed>( ?[^\W_]+)/( ?[^\W_]+)(?:/( ?[^\W_]+))?)"
+)
+
+def _date_shapes() -> typing.Dict[typing.Tuple[str, int], typing.List[typing.Tuple[str, ...]]]:
+    shapes: typing.Dict[typing.Tuple[str, int], typing.List[typing.Tuple[str, ...]]] = {}
+    for fmt in date_formats():
+        separator = "slashed" if "/" in fmt else "spaced"
+        fields = tuple(re.split(r"[ /]", fmt))
+        shapes.setdefault((separator, len(fields)), []).append(fields)
+    return shapes
+
+_DATE_SHAPES = _date_shapes()
+
+def _parse_field(directive: str, token: str) -> typing.Optional[int]:
+    if directive in _MONTH_NAMES:
+        return _MONTH_NAMES[directive].get(token.lower())
+    if _FIELD_REGEXES[directive].fullmatch(token) is None:
+        return None
+    value = int(token)
+    if directive == "%y":
+        value += 2000 if value < 69 else 1900
+    return value
+
+@functools.lru_cache(maxsize=1024)
+def parse_month_day(argument: str) -> typing.Optional[typing.Tuple[int, int]]:
+    """Parses a date string accepted by any of `date_formats` into its month and day.
+
+    Formats are tried in the same order as `date_formats`, and the first one that yields
+    a real calendar date wins, exactly as `datetime.strptime` would.
+
+    Args:
+        argument (str): The date string.
+
+    Returns:
+        typing.Optional[typing.Tuple[int, int]]: The month and day, or None if the date is not recognized.
+    """
+    match = _DATE_REGEX.fullmatch(argument)
+    if match is None:
+        return None
+
+    separator = "spaced" if match.group("spaced") is not None else "slashed"
+    start = 2 if separator == "spaced" else 6
+    tokens = [token for token in match.group(start, start + 1, start + 2) if token is not None]
+
+    for fields in _DATE_SHAPES[(separator, len(tokens))]:
+        values: typing.Dict[str, int] = {}
+
+        for directive, token in zip(fields, tokens):
+            value = _parse_field(directive, token)
+            if value is None:
+                break
+            values[directive[1].lower()] = value
+        else:
+            year = values.get("y", 1900)
+            month = values.get("m", values.get("b"))
+            day = values["d"]
+            if 1 <= year and day <= calendar.monthrange(year, month)[1]:  # type: ignore[arg-type]
+                return month, day  # type: ignore[return-value]
+
+    return None
+
+
 class BirthdayConverter(DogCogConverter):
     """Returns a datetime object ignoring the birthday for a birthday string.
+
+    The datetime is midnight in the timezone from `timezone_resolver`, which subclasses can set
+    to look up a guild's or user's timezone. Defaults to `TIMEZONE_ID`.
     """
-    @staticmethod
-    async def parse(_ctx: commands.Context, argument: str) -> datetime.datetime:
-        for fmt in date_formats():
-            try:
-                return datetime.datetime.strptime(argument, fmt).replace(year=1980).astimezone(tz=TIMEZONE)
-            except ValueError:
-                pass
-        raise ValueError(f"{argument} is not a recognized date.")
\ No newline at end of file
+    timezone_resolver: typing.ClassVar[typing.Optional[TimezoneResolver]] = None
+
+    @classmethod
+    async def parse(cls, ctx: commands.Context, argument: str) -> datetime.datetime: # type: ignore[override]
+        month_day = parse_month_day(argument)
+        if month_day is None:
+            raise ValueError(f"{argument} is not a recognized date.")
+        timezone = await resolve_timezone(ctx, cls.timezone_resolver)
+        return datetime.datetime(1980, *month_day, tzinfo=timezone)
@@ -1,21 +1,20 @@
-import d20
+import typing
 from redbot.core import commands
 
-from ..core.converter import DogCogConverter
+from ..core.converter import CacheScope, DogCogConverter
+from ..parsers.dice import CompiledRoll, compile_dice
 
 class DiceRoll(DogCogConverter):
+    cache_scope: typing.ClassVar[typing.Optional[CacheScope]] = "pure"
+
     @staticmethod
-    async def parse(_ctx: commands.Context, input: str) -> str:
-        """Converts a string to a float or a d20 roll.
+    async def parse(_ctx: commands.Context, input: str) -> CompiledRoll:
+        """Converts a string to a compiled d20 roll.
 
         Args:
             input (str): The string argument input.
 
         Returns:
-            typing.Union[float, str]: A float if it's a percentage, or a string if it's a d20 roll.
+            CompiledRoll: The normalized roll string, which can be rolled without parsing it again.
         """
-        try:
-            d20.parse(input)
-            return input
-        except d20.RollSyntaxError:
-            raise commands.BadArgument("Invalid dice roll.")
+        return compile_dice(input)
@@ -1,31 +1,83 @@
 import typing
 import discord
 from redbot.core import commands
-from ..core.converter import DogCogConverter
 
-class Mention(DogCogConverter):
-    @staticmethod
-    async def parse(ctx: commands.Context, input: str) -> typing.Union[discord.TextChannel, discord.Member, discord.Role]:
-        converter: typing.Union[
-            commands.TextChannelConverter,
-            commands.MemberConverter,
-            commands.RoleConverter,
-        ]
+from ..constants import regex
+from ..core.converter import CHANNEL_EVENTS, MEMBER_EVENTS, ROLE_EVENTS, CacheScope, DogCogConverter
 
-        try:
-            converter = commands.TextChannelConverter()
-            return await converter.convert(ctx, input)
-        except:
-            pass
+MentionTarget = typing.Union[discord.TextChannel, discord.Member, discord.Role]
 
+
+async def _fetch_member(ctx: commands.Context, input: str) -> typing.Optional[discord.Member]:
+    try:
+        return await commands.MemberConverter().convert(ctx, input)
+    except commands.BadArgument:
+        return None
+
+
+async def _try_all(ctx: commands.Context, input: str) -> MentionTarget:
+    converters: typing.Tuple[commands.Converter, ...] = (
+        commands.TextChannelConverter(),
+        commands.MemberConverter(),
+        commands.RoleConverter(),
+    )
+    for converter in converters:
         try:
-            converter = commands.MemberConverter()
             return await converter.convert(ctx, input)
-        except:
+        except commands.BadArgument:
             pass
+    raise commands.BadArgument("Not a valid mention.")
 
-        try:
-            converter = commands.RoleConverter()
-            return await converter.convert(ctx, input)
-        except:
+
+class Mention(DogCogConverter):
+    """A text channel, member, or role.
+
+    Mentions and ids go straight to the guild's cache by their syntax; only plain names are
+    searched, and only members missing from the cache are fetched.
+    """
+
+    cache_scope: typing.ClassVar[typing.Optional[CacheScope]] = "guild"
+    invalidated_by: typing.ClassVar[typing.Tuple[str, ...]] = (*CHANNEL_EVENTS, *MEMBER_EVENTS, *ROLE_EVENTS)
+
+    @staticmethod
+    async def parse(ctx: commands.Context, input: str) -> MentionTarget:
+        guild = ctx.guild
+        if guild is None:
+            return await _try_all(ctx, input)
+
+        result: typing.Optional[MentionTarget] = None
+        match = regex.MENTION_REGEX.match(input)
+
+        if match is None:
+            channel = discord.utils.get(guild.text_channels, name=input)
+            result = (
+                channel
+                or guild.get_member_named(input)
+                or discord.utils.get(guild.roles, name=input)
+            )
+            if result is None and not guild.chunked:
+                result = await _fetch_member(ctx, input)
+        else:
+            channel_id, user_id, role_id, raw_id = match.groups()
+
+            if channel_id is not None:
+                found = guild.get_channel(int(channel_id))
+                result = found if isinstance(found, discord.TextChannel) else None
+            elif user_id is not None:
+                result = guild.get_member(int(user_id)) or await _fetch_member(ctx, input)
+            elif role_id is not None:
+                result = guild.get_role(int(role_id))
+            else:
+                id = int(raw_id)
+                found = guild.get_channel(id)
+                result = (
+                    (found if isinstance(found, discord.TextChannel) else None)
+                    or guild.get_member(id)
+                    or guild.get_role(id)
+                )
+                if result is None:
+                    result = await _fetch_member(ctx, input)
+
+        if result is None:
             raise commands.BadArgument("Not a valid mention.")
+        return result
@@ -1,8 +1,11 @@
+import typing
 from redbot.core import commands
 
-from ..core.converter import DogCogConverter
+from ..core.converter import CacheScope, DogCogConverter
 
 class Percent(DogCogConverter):
+    cache_scope: typing.ClassVar[typing.Optional[CacheScope]] = "pure"
+
     @staticmethod
     async def parse(ctx: commands.Context, input: str) -> float:
         try:
@@ -1,31 +1,98 @@
+import asyncio
 import typing
 import discord
+from redbot.core.bot import Red
 from redbot.core.commands import commands, GuildContext
 
-from ..core.converter import DogCogConverter
+from ..constants import regex
+from ..core.converter import MEMBER_EVENTS, CacheScope, DogCogConverter
+
+QUERY_CHUNK_SIZE = 100
+
+async def resolve_users(
+    bot: Red,
+    guild: typing.Optional[discord.Guild],
+    user_ids: typing.Iterable[int],
+    *,
+    concurrency: int = 5,
+) -> typing.Tuple[typing.Dict[int, discord.User], typing.List[int]]:
+    """Resolves many user ids at once, hitting the API only for users that aren't cached.
+
+    Users are looked up in the guild and bot caches first, then queried from the guild gateway
+    in chunks of 100, and finally fetched individually with at most `concurrency` requests in flight.
+
+    Args:
+        bot (Red): The bot to resolve users with.
+        guild (typing.Optional[discord.Guild]): The guild to check for members.
+        user_ids (typing.Iterable[int]): The ids to resolve.
+        concurrency (int, optional): The most `fetch_user` calls to run at once. Defaults to 5.
+
+    Returns:
+        typing.Tuple[typing.Dict[int, discord.User], typing.List[int]]: The resolved users by id, and every id that could not be resolved.
+    """
+    found : typing.Dict[int, discord.User] = {}
+    remaining : typing.List[int] = []
+
+    for user_id in dict.fromkeys(user_ids):
+        member = guild.get_member(user_id) if guild is not None else None
+        user = member._user if member is not None else bot.get_user(user_id)
+        if user is not None:
+            found[user_id] = user
+        else:
+            remaining.append(user_id)
+
+    if guild is not None and len(remaining) > 0:
+        for i in range(0, len(remaining), QUERY_CHUNK_SIZE):
+            chunk = remaining[i:i + QUERY_CHUNK_SIZE]
+            try:
+                members = await guild.query_members(user_ids=chunk, limit=len(chunk), cache=False)
+            except (discord.ClientException, asyncio.TimeoutError):
+                break
+            for member in members:
+                found[member.id] = member._user
+
+        remaining = [user_id for user_id in remaining if user_id not in found]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(user_id: int) -> typing.Optional[discord.User]:
+        async with semaphore:
+            try:
+                return await bot.fetch_user(user_id)
+            except discord.HTTPException:
+                return None
+
+    fetched = await asyncio.gather(*(fetch(user_id) for user_id in remaining))
+
+    missing : typing.List[int] = []
+    for user_id, user in zip(remaining, fetched):
+        if user is not None:
+            found[user_id] = user
+        else:
+            missing.append(user_id)
+
+    return found, missing
 
 class UserList(DogCogConverter):
+    cache_scope: typing.ClassVar[typing.Optional[CacheScope]] = "guild"
+    invalidated_by: typing.ClassVar[typing.Tuple[str, ...]] = MEMBER_EVENTS
+
     @staticmethod
     async def parse(ctx: GuildContext, argument: str) -> typing.List[discord.User]: # type:ignore[override]
-        members = ctx.guild.members
-        args = argument.split()
-
-        user_list : typing.List[discord.User] = [member._user for member in members if member.mention in args or member.id in args]
-        args = [arg for arg in args if not arg in [user.mention for user in user_list]]
-
-        if len(args) > 0:
-            pruned_args = [
-                id.replace("<", "").replace(">", "").replace("@", "") for id in args
-            ]
+        user_ids : typing.List[int] = []
+        invalid : typing.List[str] = []
 
-            extra_users : typing.List[discord.User] = []
+        for arg in argument.split():
+            match = regex.USER_MENTION_REGEX.match(arg)
+            if match is None:
+                invalid.append(arg)
+            else:
+                user_ids.append(int(match.group(1) or match.group(2)))
 
-            for arg in pruned_args:
-                try:
-                    extra_users.append(await ctx.bot.fetch_user(int(arg)))
-                except:
-                    raise commands.BadArgument(f"No user was found for: {arg}")
+        found, missing = await resolve_users(ctx.bot, ctx.guild, user_ids)
 
-            user_list.extend(extra_users)
+        unresolved = invalid + [str(user_id) for user_id in missing]
+        if len(unresolved) > 0:
+            raise commands.BadArgument(f"No user was found for: {','.join(unresolved)}")
 
-        return user_list
\ No newline at end of file
+        return [found[user_id] for user_id in dict.fromkeys(user_ids)]
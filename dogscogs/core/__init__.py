@@ -1,7 +1,9 @@
-from datetime import datetime, timedelta
 import typing
 import discord
-import pytz
+
+from .audit_log import AuditLogResolver
+
+audit_log_resolver = AuditLogResolver()
 
 
 async def get_audit_log_reason(
@@ -12,14 +14,14 @@ async def get_audit_log_reason(
     perp = None
     reason = None
     if guild.me.guild_permissions.view_audit_log:
-        async for log in guild.audit_logs(limit=5, action=action):
-            if (
-                log.target
-                and log.target.id == target.id
-                and (log.created_at > (datetime.now(tz=pytz.timezone("UTC")) - timedelta(0, 5)))
-            ):
-                perp = log.user
-                if log.reason:
-                    reason = log.reason
-                break
+        perp, reason = await audit_log_resolver.resolve(guild, target, action)
     return perp, reason
+
+
+def record_audit_log_entry(entry: discord.AuditLogEntry) -> None:
+    """Feeds an entry from `on_audit_log_entry_create` to the resolver behind `get_audit_log_reason`.
+
+    Args:
+        entry (discord.AuditLogEntry): The newly created entry.
+    """
+    audit_log_resolver.record(entry)
@@ -0,0 +1,204 @@
+import asyncio
+from collections import deque
+from datetime import timedelta
+import typing
+import discord
+
+AuditLogKey = typing.Tuple[discord.AuditLogAction, int]
+
+
+class GuildAuditLog:
+    """A bounded ring buffer of a guild's recent audit log entries, indexed by (action, target id)."""
+
+    def __init__(self, size: int):
+        self.entries: typing.Deque[typing.Tuple[AuditLogKey, discord.AuditLogEntry]] = deque()
+        self.ids: typing.Set[int] = set()
+        self.index: typing.Dict[AuditLogKey, discord.AuditLogEntry] = {}
+        self.size = size
+
+    def add(self, entry: discord.AuditLogEntry) -> None:
+        target_id = getattr(entry.target, "id", None)
+        if not isinstance(target_id, int) or entry.id in self.ids:
+            return
+
+        if len(self.entries) >= self.size:
+            evicted_key, evicted = self.entries.popleft()
+            self.ids.discard(evicted.id)
+            if self.index.get(evicted_key) is evicted:
+                del self.index[evicted_key]
+
+        key = (entry.action, target_id)
+        self.entries.append((key, entry))
+        self.ids.add(entry.id)
+
+        current = self.index.get(key)
+        if current is None or current.id < entry.id:
+            self.index[key] = entry
+
+    def get(self, action: discord.AuditLogAction, target_id: int) -> typing.Optional[discord.AuditLogEntry]:
+        return self.index.get((action, target_id))
+
+
+class PendingFetch:
+    """A shared audit log fetch, and the targets of every caller waiting on it."""
+
+    def __init__(self):
+        self.targets: typing.Set[int] = set()
+        self.started = False
+        self.future: asyncio.Future
+
+
+class AuditLogResolver:
+    """Resolves who performed an action from audit log entries pushed by `on_audit_log_entry_create`.
+
+    Lookups that miss the buffer fall back to fetching the audit log, with concurrent misses
+    for the same guild and action sharing a single fetch sized to the number of waiters.
+    """
+
+    def __init__(
+        self,
+        *,
+        size: int = 100,
+        max_age: timedelta = timedelta(seconds=5),
+        fetch_limit: int = 5,
+        coalesce_delay: float = 0.5,
+    ):
+        self.size = size
+        self.max_age = max_age
+        self.fetch_limit = fetch_limit
+        self.coalesce_delay = coalesce_delay
+        self.guilds: typing.Dict[int, GuildAuditLog] = {}
+        self.pending: typing.Dict[typing.Tuple[int, discord.AuditLogAction], PendingFetch] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+
+    def record(self, entry: discord.AuditLogEntry) -> None:
+        """Stores an audit log entry. Call this from `on_audit_log_entry_create`.
+
+        Args:
+            entry (discord.AuditLogEntry): The newly created entry.
+        """
+        log = self.guilds.get(entry.guild.id)
+        if log is None:
+            log = self.guilds[entry.guild.id] = GuildAuditLog(self.size)
+        log.add(entry)
+
+    def lookup(
+        self,
+        guild: discord.Guild,
+        target_id: int,
+        action: discord.AuditLogAction,
+    ) -> typing.Optional[discord.AuditLogEntry]:
+        """Finds a buffered entry for the target that is no older than `max_age`.
+
+        Returns:
+            typing.Optional[discord.AuditLogEntry]: The most recent matching entry, if any.
+        """
+        log = self.guilds.get(guild.id)
+        if log is None:
+            return None
+
+        entry = log.get(action, target_id)
+        if entry is None or entry.created_at <= discord.utils.utcnow() - self.max_age:
+            return None
+        return entry
+
+    async def _fetch(
+        self,
+        guild: discord.Guild,
+        action: discord.AuditLogAction,
+        pending: "PendingFetch",
+    ) -> None:
+        await asyncio.sleep(self.coalesce_delay)
+        pending.started = True
+
+        remaining = {
+            target_id
+            for target_id in pending.targets
+            if self.lookup(guild, target_id, action) is None
+        }
+        if not remaining:
+            return
+
+        self.fetches += 1
+        cutoff = discord.utils.utcnow() - self.max_age
+        limit = max(self.fetch_limit, len(pending.targets))
+
+        async for entry in guild.audit_logs(limit=limit, action=action):
+            if entry.created_at <= cutoff:
+                break
+            self.record(entry)
+            remaining.discard(getattr(entry.target, "id", None))  # type: ignore[arg-type]
+            if not remaining:
+                break
+
+    async def fetch(
+        self,
+        guild: discord.Guild,
+        action: discord.AuditLogAction,
+        target_id: int,
+    ) -> None:
+        """Fetches recent audit log entries into the buffer, joining any fetch still gathering callers.
+
+        Callers that miss within `coalesce_delay` of each other share one request, sized to fit
+        all of their targets.
+
+        Args:
+            guild (discord.Guild): The guild to fetch from.
+            action (discord.AuditLogAction): The action to filter by.
+            target_id (int): The id of the target the caller is looking for.
+        """
+        key = (guild.id, action)
+        pending = self.pending.get(key)
+
+        if pending is None or pending.started:
+            pending = PendingFetch()
+            pending.future = asyncio.ensure_future(self._fetch(guild, action, pending))
+            self.pending[key] = pending
+
+            def done(_: asyncio.Future, pending: PendingFetch = pending) -> None:
+                if self.pending.get(key) is pending:
+                    del self.pending[key]
+
+            pending.future.add_done_callback(done)
+
+        pending.targets.add(target_id)
+        await asyncio.shield(pending.future)
+
+    async def resolve(
+        self,
+        guild: discord.Guild,
+        target: typing.Union[discord.abc.GuildChannel, discord.Member, discord.Role],
+        action: discord.AuditLogAction,
+    ) -> typing.Tuple[typing.Optional[discord.abc.User], typing.Optional[str]]:
+        """Gets the user responsible for an action on the target, and their reason.
+
+        Returns:
+            typing.Tuple[typing.Optional[discord.abc.User], typing.Optional[str]]: The perpetrator and reason, if found.
+        """
+        entry = self.lookup(guild, target.id, action)
+
+        if entry is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            await self.fetch(guild, action, target.id)
+            entry = self.lookup(guild, target.id, action)
+
+        if entry is None:
+            return None, None
+
+        perp = entry.user
+        if perp is None and entry.user_id is not None:
+            perp = guild.get_member(entry.user_id)
+        return perp, entry.reason or None
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Gets the hit, miss, and fetch counters.
+
+        Returns:
+            typing.Dict[str, int]: The counters by name.
+        """
+        return {"hits": self.hits, "misses": self.misses, "fetches": self.fetches}
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+import time
+import typing
+
+K = typing.TypeVar("K")
+V = typing.TypeVar("V")
+
+
+class TTLCache(typing.Generic[K, V]):
+    """A least-recently-used cache whose entries optionally expire after `ttl` seconds."""
+
+    def __init__(self, *, maxsize: int = 128, ttl: typing.Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries: "OrderedDict[K, typing.Tuple[float, V]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: K) -> bool:
+        # Membership tests don't count as hits or misses, or mark the entry as recently used.
+        entry = self.entries.get(key)
+        return entry is not None and (self.ttl is None or entry[0] > time.monotonic())
+
+    def get(self, key: K, default: typing.Optional[V] = None) -> typing.Optional[V]:
+        """Gets a value, counting a hit or miss and marking it as recently used.
+
+        Args:
+            key (K): The key to look up.
+            default (typing.Optional[V], optional): Returned if the key is missing or expired. Defaults to None.
+
+        Returns:
+            typing.Optional[V]: The cached value, or the default.
+        """
+        entry = self.entries.get(key)
+
+        if entry is not None and (self.ttl is None or entry[0] > time.monotonic()):
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        if entry is not None:
+            del self.entries[key]
+        self.misses += 1
+        return default
+
+    def set(self, key: K, value: V) -> None:
+        """Stores a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (K): The key to store under.
+            value (V): The value to store.
+        """
+        expires = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        self.entries[key] = (expires, value)
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Removes a key if it is cached.
+
+        Args:
+            key (K): The key to remove.
+        """
+        self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        self.entries.clear()
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Gets the hit and miss counters, and the current size.
+
+        Returns:
+            typing.Dict[str, int]: The counters by name.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries)}
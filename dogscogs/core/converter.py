@@ -1,17 +1,149 @@
 from abc import abstractmethod, ABC
+import discord
 from redbot.core import commands
+from redbot.core.bot import Red
 import typing
 
+from .cache import TTLCache
+
+CacheScope = typing.Literal["pure", "guild"]
+ConverterCacheKey = typing.Tuple[typing.Type["DogCogConverter"], typing.Optional[int], str]
+ConverterListener = typing.Callable[..., typing.Coroutine[typing.Any, typing.Any, None]]
+
+CHANNEL_EVENTS = (
+    "on_guild_channel_create",
+    "on_guild_channel_delete",
+    "on_guild_channel_update",
+    "on_thread_create",
+    "on_thread_delete",
+    "on_thread_update",
+)
+MEMBER_EVENTS = ("on_member_join", "on_member_remove", "on_member_update")
+ROLE_EVENTS = ("on_guild_role_create", "on_guild_role_delete", "on_guild_role_update")
+
+_MISSING = object()
+
+
+class ConverterCache:
+    """Caches converter results by (converter, guild id, argument).
+
+    Only converters that set `cache_scope` are cached. `pure` results depend on the argument
+    alone and are shared between guilds; `guild` results are dropped when one of the
+    converter's `invalidated_by` events fires in that guild, so they are only cached while the
+    cache is attached to a bot.
+    """
+
+    def __init__(self, *, maxsize: int = 1024, ttl: typing.Optional[float] = 300):
+        self.cache: TTLCache[ConverterCacheKey, typing.Any] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.invalidations = 0
+        self.listeners: typing.Dict[str, ConverterListener] = {}
+        self.attached = 0
+
+    async def parse(
+        self,
+        converter: typing.Type["DogCogConverter"],
+        ctx: commands.Context,
+        argument: str,
+    ) -> typing.Any:
+        """Parses an argument with a converter, reusing a cached result if the converter allows it.
+
+        Args:
+            converter (typing.Type[DogCogConverter]): The converter class.
+            ctx (commands.Context): The invocation context.
+            argument (str): The argument to convert.
+
+        Returns:
+            typing.Any: The converted value.
+        """
+        if converter.cache_scope is None or (converter.cache_scope == "guild" and self.attached == 0):
+            return await converter.parse(ctx, argument)
+
+        guild = getattr(ctx, "guild", None)
+        key = (converter, guild.id if converter.cache_scope == "guild" and guild is not None else None, argument)
+
+        result = self.cache.get(key, _MISSING)
+        if result is _MISSING:
+            result = await converter.parse(ctx, argument)
+            self.cache.set(key, result)
+
+        return list(result) if isinstance(result, list) else result
+
+    def invalidate(
+        self,
+        guild_id: typing.Optional[int] = None,
+        *,
+        event: typing.Optional[str] = None,
+        converter: typing.Optional[typing.Type["DogCogConverter"]] = None,
+    ) -> None:
+        """Drops cached results. With no arguments, drops everything.
+
+        Args:
+            guild_id (typing.Optional[int], optional): Only drop results from this guild.
+            event (typing.Optional[str], optional): Only drop results from converters invalidated by this event.
+            converter (typing.Optional[typing.Type[DogCogConverter]], optional): Only drop results from this converter.
+        """
+        for key in list(self.cache.entries):
+            cls, key_guild_id, _ = key
+            if guild_id is not None and key_guild_id != guild_id:
+                continue
+            if event is not None and event not in cls.invalidated_by:
+                continue
+            if converter is not None and cls is not converter:
+                continue
+            self.cache.pop(key)
+            self.invalidations += 1
+
+    def _listener(self, event: str) -> ConverterListener:
+        async def listener(target: typing.Any, *_: typing.Any) -> None:
+            guild = target if isinstance(target, discord.Guild) else getattr(target, "guild", None)
+            if guild is not None:
+                self.invalidate(guild.id, event=None if event == "on_guild_remove" else event)
+
+        return listener
+
+    def attach(self, bot: Red) -> None:
+        """Starts invalidating guild results on gateway events. Call this in `cog_load`; it is reference counted."""
+        self.attached += 1
+        if self.attached > 1:
+            return
+        for event in (*CHANNEL_EVENTS, *MEMBER_EVENTS, *ROLE_EVENTS, "on_guild_remove"):
+            self.listeners[event] = self._listener(event)
+            bot.add_listener(self.listeners[event], event)
+
+    def detach(self, bot: Red) -> None:
+        """Stops invalidating on gateway events once every `attach` has been matched. Call this in `cog_unload`."""
+        self.attached = max(self.attached - 1, 0)
+        if self.attached > 0:
+            return
+        for event, listener in self.listeners.items():
+            bot.remove_listener(listener, event)
+        self.listeners.clear()
+        self.invalidate()
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Gets the hit, miss, and invalidation counters, and the current size.
+
+        Returns:
+            typing.Dict[str, int]: The counters by name.
+        """
+        return {**self.cache.stats(), "invalidations": self.invalidations}
+
+
+converter_cache = ConverterCache()
+
 
 class DogCogConverter(ABC, commands.Converter):
+    cache_scope: typing.ClassVar[typing.Optional[CacheScope]] = None
+    invalidated_by: typing.ClassVar[typing.Tuple[str, ...]] = ()
+
     @staticmethod
     @abstractmethod
     async def parse(ctx: commands.Context, input: str) -> typing.Any:
         pass
 
     async def convert(self, ctx: commands.Context, argument: str):  # type: ignore[override]
-        try: 
-            return await self.__class__.parse(ctx, argument)
+        try:
+            return await converter_cache.parse(self.__class__, ctx, argument)
         except commands.BadArgument as ba:
             await ctx.send(str(ba))
-            raise ba
\ No newline at end of file
+            raise ba
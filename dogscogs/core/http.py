@@ -0,0 +1,29 @@
+import typing
+import aiohttp
+
+USER_AGENT = "Mozilla/5.0 (compatible; DiscordBot/1.0)"
+
+_session: typing.Optional[aiohttp.ClientSession] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Gets the pooled session shared by every dogscogs HTTP helper, creating it if needed.
+
+    Returns:
+        aiohttp.ClientSession: The shared session.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+            headers={"User-Agent": USER_AGENT},
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Closes the shared session, e.g. when unloading the last cog that uses it."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -1,8 +1,31 @@
-from datetime import datetime
+import calendar
+from datetime import datetime, tzinfo
+import functools
 from itertools import permutations
-import re
-from time import strptime
-from redbot.core.commands import commands
+import typing
+import zoneinfo
+from redbot.core import commands
+
+from ..constants import TIMEZONE_ID, regex
+
+TimezoneResolver = typing.Callable[[commands.Context], typing.Awaitable[typing.Optional[str]]]
+K = typing.TypeVar("K")
+
+_DURATION_UNIT_SIZES = (
+    ("week", "w", 7 * 24 * 60 * 60),
+    ("day", "d", 24 * 60 * 60),
+    ("hour", "h", 60 * 60),
+    ("minute", "m", 60),
+    ("second", "s", 1),
+)
+_DURATION_UNITS = {
+    alias: size
+    for (name, letter, size), extra in zip(
+        _DURATION_UNIT_SIZES,
+        (("wk", "wks"), (), ("hr", "hrs"), ("min", "mins"), ("sec", "secs")),
+    )
+    for alias in (letter, name, f"{name}s", *extra)
+}
 
 
 def duration_string(hours: int, minutes: int, seconds: int) -> str:
@@ -33,21 +56,154 @@ def duration_string(hours: int, minutes: int, seconds: int) -> str:
     return f"{hour_string}{minute_string}{second_string}"
 
 
+def humanize_duration(seconds: int, *, short: bool = False, max_units: typing.Optional[int] = None) -> str:
+    """Converts a number of seconds into a multi-unit duration, e.g. `2 days, 4 hours and 30 seconds`.
+
+    Args:
+        seconds (int): Integer number of seconds.
+        short (bool, optional): Whether to use unit letters, e.g. `2d 4h 30s`. Defaults to False.
+        max_units (typing.Optional[int], optional): The most units to show, largest first. Defaults to all of them.
+
+    Raises:
+        ValueError: If `seconds` is negative.
+
+    Returns:
+        str: The completed string composing of the duration.
+    """
+    if seconds < 0:
+        raise ValueError("Duration cannot be negative.")
+
+    parts = []
+    remaining = seconds
+    for name, letter, size in _DURATION_UNIT_SIZES:
+        count, remaining = divmod(remaining, size)
+        if count > 0:
+            parts.append(f"{count}{letter}" if short else f"{count} {name}{'' if count == 1 else 's'}")
+
+    if not parts:
+        return "0s" if short else "0 seconds"
+    if max_units is not None:
+        parts = parts[:max_units]
+    if short:
+        return " ".join(parts)
+    if len(parts) == 1:
+        return parts[0]
+    return f"{', '.join(parts[:-1])} and {parts[-1]}"
+
+
 def parse_duration_string(input: str) -> int:
     """Parses a duration string into the number of seconds it composes.
 
+    Accepts clock forms (`H:MM:SS`, `MM:SS`) and unit forms (`90s`, `1h30m`, `2d 4h`, `1 hour and 5 minutes`).
+
     Args:
         input (str): The input string to parse.
 
+    Raises:
+        commands.BadArgument: If the string isn't a duration.
+
     Returns:
         int: The number of seconds in duration that string is.
     """
-    if(re.match("^[\\d]+:[0-5][0-9]:[0-5][0-9]$", input)):
-        hours, rest = input.split(':', 1)
-        t = strptime(rest, "%M:%S")
-        return int(hours) * 60 * 60 + t.tm_min * 60 + t.tm_sec
-    elif(re.match("^[0-9]?[0-9]:[0-5][0-9]$", input)):
-        t = strptime(input, "%M:%S")
-        return t.tm_min * 60 + t.tm_sec
-    else:
-        raise commands.BadArgument("Could not parse the duration.")
\ No newline at end of file
+    clock = regex.DURATION_CLOCK_REGEX.match(input)
+    if clock is not None:
+        hours, minutes_with_hours, minutes, seconds = clock.groups()
+        if hours is not None:
+            return int(hours) * 60 * 60 + int(minutes_with_hours) * 60 + int(seconds)
+        return int(minutes) * 60 + int(seconds)
+
+    total = 0
+    position = 0
+    end = len(input.rstrip())
+    while position < end:
+        part = regex.DURATION_PART_REGEX.match(input, position)
+        size = _DURATION_UNITS.get(part.group(2).lower()) if part is not None else None
+        if part is None or size is None:
+            raise commands.BadArgument("Could not parse the duration.")
+        total += int(part.group(1)) * size
+        position = part.end()
+
+    if position == 0:
+        raise commands.BadArgument("Could not parse the duration.")
+    return total
+
+
+@functools.lru_cache(maxsize=None)
+def get_timezone(name: str) -> zoneinfo.ZoneInfo:
+    """Gets a cached timezone by its IANA name.
+
+    Args:
+        name (str): The timezone name, e.g. `US/Eastern`.
+
+    Raises:
+        zoneinfo.ZoneInfoNotFoundError: If the timezone doesn't exist.
+
+    Returns:
+        zoneinfo.ZoneInfo: The timezone.
+    """
+    return zoneinfo.ZoneInfo(name)
+
+
+async def resolve_timezone(
+    ctx: typing.Optional[commands.Context],
+    resolver: typing.Optional[TimezoneResolver] = None,
+) -> zoneinfo.ZoneInfo:
+    """Resolves the timezone for a guild or user, falling back to `TIMEZONE_ID`.
+
+    Args:
+        ctx (typing.Optional[commands.Context]): The context to resolve for.
+        resolver (typing.Optional[TimezoneResolver], optional): Returns the timezone name for a context, if one is set. Defaults to None.
+
+    Returns:
+        zoneinfo.ZoneInfo: The resolved timezone.
+    """
+    name = await resolver(ctx) if resolver is not None and ctx is not None else None
+
+    if name is not None:
+        try:
+            return get_timezone(name)
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            pass
+
+    return get_timezone(TIMEZONE_ID)
+
+
+def birthdays_today(
+    birthdays: typing.Mapping[K, datetime],
+    *,
+    now: typing.Optional[datetime] = None,
+) -> typing.List[K]:
+    """Finds every birthday that falls on today's date in its own timezone.
+
+    Today's date is computed once per distinct timezone. Naive birthdays use `TIMEZONE_ID`,
+    and February 29th birthdays fall on February 28th in non-leap years.
+
+    Args:
+        birthdays (typing.Mapping[K, datetime]): The stored birthdays by key, e.g. member id.
+        now (typing.Optional[datetime], optional): The current time. Defaults to now.
+
+    Returns:
+        typing.List[K]: The keys whose birthday is today.
+    """
+    if now is None:
+        now = datetime.now(tz=get_timezone(TIMEZONE_ID))
+
+    default: tzinfo = get_timezone(TIMEZONE_ID)
+    today_by_zone: typing.Dict[tzinfo, typing.Set[typing.Tuple[int, int]]] = {}
+    result: typing.List[K] = []
+
+    for key, birthday in birthdays.items():
+        zone = birthday.tzinfo or default
+        today = today_by_zone.get(zone)
+
+        if today is None:
+            local = now.astimezone(zone)
+            today = {(local.month, local.day)}
+            if (local.month, local.day) == (2, 28) and not calendar.isleap(local.year):
+                today.add((2, 29))
+            today_by_zone[zone] = today
+
+        if (birthday.month, birthday.day) in today:
+            result.append(key)
+
+    return result
@@ -0,0 +1,99 @@
+import functools
+import typing
+import d20
+from redbot.core import commands
+
+MAX_EXPRESSION_LENGTH = 256
+MAX_DICE = 1000
+MAX_DEPTH = 32
+
+
+class CompiledRoll(str):
+    """A validated dice expression that keeps its parsed tree, so rolling it never parses again.
+
+    It is still the normalized expression string, so it can be stored or passed to `d20.roll` as-is.
+    """
+
+    ast: d20.ast.Expression
+    dice: int
+    depth: int
+
+    def __new__(cls, expression: str, ast: d20.ast.Expression, dice: int, depth: int) -> "CompiledRoll":
+        compiled = super().__new__(cls, expression)
+        compiled.ast = ast
+        compiled.dice = dice
+        compiled.depth = depth
+        return compiled
+
+    def roll(
+        self,
+        *,
+        advantage: d20.AdvType = d20.AdvType.NONE,
+        stringifier: typing.Optional[d20.Stringifier] = None,
+    ) -> d20.RollResult:
+        """Rolls the expression from its parsed tree.
+
+        Args:
+            advantage (d20.AdvType, optional): Rolls the leftmost 1d20 with advantage or disadvantage. Defaults to neither.
+            stringifier (typing.Optional[d20.Stringifier], optional): Formats the result. Defaults to d20's markdown.
+
+        Returns:
+            d20.RollResult: The result.
+        """
+        return d20.roll(self.ast, stringifier=stringifier, advantage=advantage)
+
+
+def _measure(ast: d20.ast.Expression) -> typing.Tuple[int, int]:
+    dice = 0
+    depth = 0
+    stack: typing.List[typing.Tuple[d20.ast.ChildMixin, int]] = [(ast, 1)]
+
+    while stack:
+        node, node_depth = stack.pop()
+        depth = max(depth, node_depth)
+        if isinstance(node, d20.ast.Dice):
+            dice += node.num
+        stack.extend((child, node_depth + 1) for child in node.children)
+
+    return dice, depth
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(expression: str, max_dice: int, max_depth: int) -> CompiledRoll:
+    try:
+        ast = d20.parse(expression)
+    except d20.RollError:
+        raise commands.BadArgument("Invalid dice roll.")
+
+    dice, depth = _measure(ast)
+    if dice > max_dice:
+        raise commands.BadArgument(f"Too many dice, at most {max_dice} can be rolled.")
+    if depth > max_depth:
+        raise commands.BadArgument("Dice roll is too complex.")
+
+    return CompiledRoll(expression, ast, dice, depth)
+
+
+def compile_dice(
+    expression: str,
+    *,
+    max_dice: int = MAX_DICE,
+    max_depth: int = MAX_DEPTH,
+) -> CompiledRoll:
+    """Parses a dice expression once, enforcing complexity limits, and caches the result.
+
+    Args:
+        expression (str): The dice expression, e.g. `4d6kh3 + 2`.
+        max_dice (int, optional): The most dice the expression may roll. Defaults to MAX_DICE.
+        max_depth (int, optional): The deepest the parsed tree may nest. Defaults to MAX_DEPTH.
+
+    Raises:
+        commands.BadArgument: If the expression is invalid or over the limits.
+
+    Returns:
+        CompiledRoll: The compiled expression.
+    """
+    normalized = expression.strip()
+    if not normalized or len(normalized) > MAX_EXPRESSION_LENGTH:
+        raise commands.BadArgument("Invalid dice roll.")
+    return _compile(normalized, max_dice, max_depth)
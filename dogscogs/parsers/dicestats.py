@@ -0,0 +1,349 @@
+from collections import Counter
+import bisect
+from fractions import Fraction
+import functools
+import math
+import random
+import typing
+import d20
+
+from .dice import CompiledRoll, compile_dice
+
+# Rough number of big integer operations allowed when building an exact distribution. Each costs
+# about 400ns in CPython, so the slowest distribution allowed takes around 30ms.
+EXACT_WORK_LIMIT = 64_000
+# Below this many rolls, simulating the dice is cheaper than building the exact distribution.
+EXACT_SAMPLE_THRESHOLD = 1000
+# Rough number of dice `distribution` may roll when sampling. Each costs about 350ns through a plan,
+# so the slowest sampled distribution takes around 0.2s however large the expression is.
+SAMPLE_WORK_LIMIT = 500_000
+# The fixed cost of one roll through a plan, and how much slower d20 is per die, in plan dice.
+_ROLL_COST = 8
+_D20_COST = 12
+
+_random = random.Random()
+
+
+class DiceTerm(typing.NamedTuple):
+    dice: int
+    sides: int
+    keep: typing.Optional[typing.Literal["h", "l"]]
+    kept: int
+    sign: int
+
+
+class DicePlan(typing.NamedTuple):
+    """A dice expression reduced to dice terms and a flat modifier, e.g. `4d6kh3 - 1d4 + 2`."""
+
+    terms: typing.Tuple[DiceTerm, ...]
+    modifier: int
+
+    def roll(self, rng: random.Random) -> int:
+        total = self.modifier
+        for term in self.terms:
+            faces = range(1, term.sides + 1)
+            rolled = rng.choices(faces, k=term.dice)
+            if term.keep == "h":
+                rolled = sorted(rolled)[term.dice - term.kept:]
+            elif term.keep == "l":
+                rolled = sorted(rolled)[:term.kept]
+            total += term.sign * sum(rolled)
+        return total
+
+
+def _dice_term(node: typing.Any, sign: int) -> typing.Optional[DiceTerm]:
+    keep: typing.Optional[typing.Literal["h", "l"]] = None
+    kept = 0
+
+    if isinstance(node, d20.ast.OperatedDice):
+        if len(node.operations) > 1:
+            return None
+        if node.operations:
+            operation = node.operations[0]
+            if operation.op != "k" or len(operation.sels) != 1 or operation.sels[0].cat not in ("h", "l"):
+                return None
+            keep = operation.sels[0].cat
+            kept = operation.sels[0].num
+        node = node.value
+
+    if not isinstance(node, d20.ast.Dice) or not isinstance(node.size, int) or node.size < 1:
+        return None
+    if keep is not None and kept >= node.num:
+        keep = None
+    return DiceTerm(node.num, node.size, keep, kept if keep is not None else node.num, sign)
+
+
+def compile_plan(roll: CompiledRoll) -> typing.Optional[DicePlan]:
+    """Reduces a compiled roll to dice terms and a modifier, if it only adds and subtracts dice, keeps, and integers.
+
+    Args:
+        roll (CompiledRoll): The compiled roll.
+
+    Returns:
+        typing.Optional[DicePlan]: The plan, or None if the roll needs d20 to evaluate it.
+    """
+    terms: typing.List[DiceTerm] = []
+    modifier = 0
+    stack: typing.List[typing.Tuple[typing.Any, int]] = [(roll.ast.roll, 1)]
+
+    while stack:
+        node, sign = stack.pop()
+        if isinstance(node, (d20.ast.Parenthetical, d20.ast.AnnotatedNumber)):
+            stack.append((node.value, sign))
+        elif isinstance(node, d20.ast.BinOp) and node.op in ("+", "-"):
+            stack.append((node.left, sign))
+            stack.append((node.right, sign if node.op == "+" else -sign))
+        elif isinstance(node, d20.ast.UnOp) and node.op in ("+", "-"):
+            stack.append((node.value, sign if node.op == "+" else -sign))
+        elif isinstance(node, d20.ast.Literal):
+            if not isinstance(node.value, int):
+                return None
+            modifier += sign * node.value
+        else:
+            term = _dice_term(node, sign)
+            if term is None:
+                return None
+            terms.append(term)
+
+    return DicePlan(tuple(terms), modifier)
+
+
+def _sum_counts(dice: int, sides: int) -> typing.Dict[int, int]:
+    ways = [1]
+    for _ in range(dice):
+        prefix = [0]
+        for way in ways:
+            prefix.append(prefix[-1] + way)
+        ways = [
+            prefix[min(i, len(ways) - 1) + 1] - prefix[max(0, i - sides + 1)]
+            for i in range(len(ways) + sides - 1)
+        ]
+    return {dice + i: way for i, way in enumerate(ways)}
+
+
+def _keep_counts(term: DiceTerm) -> typing.Dict[int, int]:
+    # Assign dice to faces from the kept end inwards; the first `kept` dice placed are the ones kept.
+    faces = range(term.sides, 0, -1) if term.keep == "h" else range(1, term.sides + 1)
+    states: typing.Dict[typing.Tuple[int, int], int] = {(0, 0): 1}
+
+    for face in faces:
+        next_states: typing.Dict[typing.Tuple[int, int], int] = {}
+        for (placed, kept_sum), ways in states.items():
+            remaining = term.dice - placed
+            for dice in range(remaining + 1):
+                kept = min(dice, max(0, term.kept - placed))
+                key = (placed + dice, kept_sum + kept * face)
+                next_states[key] = next_states.get(key, 0) + ways * math.comb(remaining, dice)
+        states = next_states
+
+    return {kept_sum: ways for (placed, kept_sum), ways in states.items() if placed == term.dice}
+
+
+def _term_work(term: DiceTerm) -> int:
+    if term.keep is None:
+        return term.dice * term.dice * term.sides
+    return term.sides * term.dice * term.dice * (term.kept * term.sides + 1)
+
+
+def _plan_work(plan: DicePlan) -> int:
+    work = 0
+    width = 1
+    for term in plan.terms:
+        term_width = term.kept * (term.sides - 1) + 1
+        work += _term_work(term) + width * term_width
+        width += term_width - 1
+    return work
+
+
+def _convolve(left: typing.Dict[int, int], right: typing.Dict[int, int]) -> typing.Dict[int, int]:
+    result: typing.Dict[int, int] = {}
+    for left_value, left_ways in left.items():
+        for right_value, right_ways in right.items():
+            value = left_value + right_value
+            result[value] = result.get(value, 0) + left_ways * right_ways
+    return result
+
+
+class DiceDistribution:
+    """The distribution of a dice expression's totals, as counts of outcomes.
+
+    Exact distributions count every equally likely outcome; sampled ones count rolls.
+    """
+
+    def __init__(self, counts: typing.Mapping[int, int], *, exact: bool):
+        self.values = sorted(counts)
+        self.counts = [counts[value] for value in self.values]
+        self.total = sum(self.counts)
+        self.exact = exact
+
+        self.cumulative: typing.List[int] = []
+        running = 0
+        for count in self.counts:
+            running += count
+            self.cumulative.append(running)
+        # True division of two ints rounds correctly even when the total is too large for a float.
+        self.cumulative_probabilities = [count / self.total for count in self.cumulative]
+
+    @property
+    def minimum(self) -> int:
+        return self.values[0]
+
+    @property
+    def maximum(self) -> int:
+        return self.values[-1]
+
+    @property
+    def mean(self) -> float:
+        return sum(value * count for value, count in zip(self.values, self.counts)) / self.total
+
+    @property
+    def stdev(self) -> float:
+        mean = self.mean
+        return math.sqrt(sum((value - mean) ** 2 * (count / self.total) for value, count in zip(self.values, self.counts)))
+
+    def probability(self, value: int) -> float:
+        """Gets the chance of rolling exactly `value`."""
+        index = bisect.bisect_left(self.values, value)
+        if index == len(self.values) or self.values[index] != value:
+            return 0.0
+        return self.counts[index] / self.total
+
+    def probability_at_least(self, value: int) -> float:
+        """Gets the chance of rolling `value` or higher."""
+        index = bisect.bisect_left(self.values, value)
+        below = self.cumulative[index - 1] if index > 0 else 0
+        return (self.total - below) / self.total
+
+    def percentile(self, percent: float) -> int:
+        """Gets the lowest total that at least `percent` percent of rolls are at or below.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+
+        Returns:
+            int: The total.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Percentile must be between 0 and 100.")
+        index = bisect.bisect_left(self.cumulative, self.total * Fraction(percent) / 100)
+        return self.values[min(index, len(self.values) - 1)]
+
+    def sample(self, n: int, *, rng: typing.Optional[random.Random] = None) -> typing.List[int]:
+        """Draws totals from the distribution.
+
+        Args:
+            n (int): How many totals to draw.
+            rng (typing.Optional[random.Random], optional): The random generator. Defaults to a shared one.
+
+        Returns:
+            typing.List[int]: The totals.
+        """
+        return (rng or _random).choices(self.values, cum_weights=self.cumulative_probabilities, k=n)
+
+
+def _to_roll(expression: typing.Union[str, CompiledRoll]) -> CompiledRoll:
+    return expression if isinstance(expression, CompiledRoll) else compile_dice(expression)
+
+
+@functools.lru_cache(maxsize=128)
+def _exact_distribution(roll: CompiledRoll) -> typing.Optional[DiceDistribution]:
+    plan = compile_plan(roll)
+    if plan is None or _plan_work(plan) > EXACT_WORK_LIMIT:
+        return None
+
+    counts = {plan.modifier: 1}
+    for term in plan.terms:
+        term_counts = _sum_counts(term.dice, term.sides) if term.keep is None else _keep_counts(term)
+        counts = _convolve(counts, {term.sign * value: ways for value, ways in term_counts.items()})
+
+    return DiceDistribution(counts, exact=True)
+
+
+def exact_distribution(expression: typing.Union[str, CompiledRoll]) -> typing.Optional[DiceDistribution]:
+    """Computes the exact distribution of a dice expression made of dice, keep highest/lowest, and integers.
+
+    Args:
+        expression (typing.Union[str, CompiledRoll]): The dice expression.
+
+    Raises:
+        commands.BadArgument: If the expression is invalid.
+
+    Returns:
+        typing.Optional[DiceDistribution]: The distribution, or None if the expression is unsupported or too large.
+    """
+    return _exact_distribution(_to_roll(expression))
+
+
+def roll_many(
+    expression: typing.Union[str, CompiledRoll],
+    n: int,
+    *,
+    rng: typing.Optional[random.Random] = None,
+) -> typing.List[int]:
+    """Rolls a dice expression many times.
+
+    At least `EXACT_SAMPLE_THRESHOLD` rolls are drawn from the exact distribution when there is
+    one. Fewer rolls, or expressions too large to compute exactly, are simulated from the dice,
+    and anything else is left to d20.
+
+    Args:
+        expression (typing.Union[str, CompiledRoll]): The dice expression.
+        n (int): How many times to roll.
+        rng (typing.Optional[random.Random], optional): The random generator. Defaults to a shared one. d20 rolls ignore it.
+
+    Raises:
+        commands.BadArgument: If the expression is invalid.
+
+    Returns:
+        typing.List[int]: The totals.
+    """
+    roll = _to_roll(expression)
+    rng = rng or _random
+
+    if n >= EXACT_SAMPLE_THRESHOLD:
+        exact = _exact_distribution(roll)
+        if exact is not None:
+            return exact.sample(n, rng=rng)
+
+    plan = compile_plan(roll)
+    if plan is not None:
+        return [plan.roll(rng) for _ in range(n)]
+
+    return [int(roll.roll().total) for _ in range(n)]
+
+
+def _sample_cost(roll: CompiledRoll, plan: typing.Optional[DicePlan]) -> int:
+    if plan is not None:
+        return sum(term.dice for term in plan.terms) + _ROLL_COST
+    return (roll.dice + _ROLL_COST) * _D20_COST
+
+
+def distribution(
+    expression: typing.Union[str, CompiledRoll],
+    *,
+    samples: int = 100_000,
+    rng: typing.Optional[random.Random] = None,
+) -> DiceDistribution:
+    """Gets the distribution of a dice expression, exactly if possible, otherwise from up to `samples` rolls.
+
+    Sampling rolls fewer times for larger expressions, so it never rolls more than about
+    `SAMPLE_WORK_LIMIT` dice in total.
+
+    Args:
+        expression (typing.Union[str, CompiledRoll]): The dice expression.
+        samples (int, optional): The most rolls to sample if it can't be computed exactly. Defaults to 100,000.
+        rng (typing.Optional[random.Random], optional): The random generator. Defaults to a shared one.
+
+    Raises:
+        commands.BadArgument: If the expression is invalid.
+
+    Returns:
+        DiceDistribution: The distribution. Check `exact` to see how it was made.
+    """
+    roll = _to_roll(expression)
+    exact = _exact_distribution(roll)
+    if exact is not None:
+        return exact
+
+    samples = max(1, min(samples, SAMPLE_WORK_LIMIT // _sample_cost(roll, compile_plan(roll))))
+    return DiceDistribution(Counter(roll_many(roll, samples, rng=rng)), exact=False)
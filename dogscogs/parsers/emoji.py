@@ -1,6 +1,41 @@
-import re
+from collections import Counter
 import typing
 
+from ..constants import regex
+
+
+class CustomEmoji(typing.NamedTuple):
+    animated: bool
+    name: str
+    id: int
+
+
+def iter_custom_emojis(content: str) -> typing.Iterator[CustomEmoji]:
+    """Lazily parses custom emojis, static `<:name:id>` and animated `<a:name:id>`, from a string.
+
+    Args:
+        content (str): The string content to parse emojis from.
+
+    Yields:
+        CustomEmoji: Each emoji, in the order it appears.
+    """
+    for match in regex.CUSTOM_EMOJI_REGEX.finditer(content):
+        animated, name, id = match.groups()
+        yield CustomEmoji(animated == "a", name, int(id))
+
+
+def parse_custom_emojis(content: str) -> typing.List[CustomEmoji]:
+    """Parses custom emojis from a string.
+
+    Args:
+        content (str): The string content to parse emojis from.
+
+    Returns:
+        typing.List[CustomEmoji]: A list of emojis.
+    """
+    return list(iter_custom_emojis(content))
+
+
 def parse_emoji_ids(content: str) -> typing.List[int]:
     """Parses emoji ID's from a string.
 
@@ -8,8 +43,27 @@ def parse_emoji_ids(content: str) -> typing.List[int]:
         content (str): The string content to parse emojis from.
 
     Returns:
-        typing.List[str]: A list of emojis.
+        typing.List[int]: A list of emoji ids.
+    """
+    return [int(match.group(3)) for match in regex.CUSTOM_EMOJI_REGEX.finditer(content)]
+
+
+def count_emoji_ids(
+    contents: typing.Iterable[str],
+    counter: typing.Optional[typing.Counter[int]] = None,
+) -> typing.Counter[int]:
+    """Counts how often each custom emoji is used across many strings.
+
+    Args:
+        contents (typing.Iterable[str]): The strings to scan, e.g. message contents.
+        counter (typing.Optional[typing.Counter[int]], optional): A counter to add to. Defaults to a new one.
+
+    Returns:
+        typing.Counter[int]: The number of uses by emoji id.
     """
-    found_emojis : typing.List[str] = re.findall(r'<:\w*:\d*>', content)
-    result = [e.split(':')[2].replace('>', '') for e in found_emojis]
-    return [int(r) for r in result]
\ No newline at end of file
+    if counter is None:
+        counter = Counter()
+    finditer = regex.CUSTOM_EMOJI_REGEX.finditer
+    for content in contents:
+        counter.update(int(match.group(3)) for match in finditer(content))
+    return counter
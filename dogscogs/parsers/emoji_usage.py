@@ -0,0 +1,116 @@
+from collections import Counter
+import typing
+import discord
+
+from ..constants import regex
+
+
+class EmojiUsage(typing.NamedTuple):
+    custom: typing.Dict[int, int]
+    unicode: typing.Dict[str, int]
+    messages: int
+    checkpoint: typing.Optional[int]
+
+
+EmojiUsageSink = typing.Callable[[EmojiUsage], typing.Awaitable[None]]
+
+
+class EmojiUsageAggregator:
+    """Counts custom and unicode emoji usage over a stream of messages, flushing counts to a sink.
+
+    Each flush hands the sink the counts since the previous flush, along with the newest message
+    id counted so far. Storing that id and passing it back as `checkpoint` resumes a scan without
+    counting any message twice. Messages may arrive in any order, but an interrupted scan only
+    resumes without gaps if they arrived oldest first.
+    """
+
+    def __init__(
+        self,
+        sink: EmojiUsageSink,
+        *,
+        checkpoint: typing.Optional[int] = None,
+        flush_every: int = 1000,
+    ):
+        self.sink = sink
+        self.start = checkpoint
+        self.checkpoint = checkpoint
+        self.flush_every = flush_every
+
+        self.custom: typing.Counter[int] = Counter()
+        self.unicode: typing.Counter[str] = Counter()
+        self.pending = 0
+        self.total = 0
+
+    def add(self, message: discord.Message) -> bool:
+        """Counts the emojis in a message's content.
+
+        Args:
+            message (discord.Message): The message to count.
+
+        Returns:
+            bool: Whether the message was counted, rather than skipped for being at or before the starting checkpoint.
+        """
+        if self.start is not None and message.id <= self.start:
+            return False
+
+        for match in regex.EMOJI_REGEX.finditer(message.content):
+            unicode = match.group(4)
+            if unicode is not None:
+                self.unicode[unicode] += 1
+            else:
+                self.custom[int(match.group(3))] += 1
+
+        self.checkpoint = max(self.checkpoint or 0, message.id)
+        self.pending += 1
+        self.total += 1
+        return True
+
+    async def flush(self) -> None:
+        """Sends the counts since the last flush to the sink, then resets them."""
+        if self.pending == 0:
+            return
+
+        usage = EmojiUsage(dict(self.custom), dict(self.unicode), self.pending, self.checkpoint)
+        self.custom.clear()
+        self.unicode.clear()
+        self.pending = 0
+        await self.sink(usage)
+
+    async def consume(self, messages: typing.AsyncIterator[discord.Message]) -> int:
+        """Counts every message from an async iterator, flushing every `flush_every` messages and at the end.
+
+        Args:
+            messages (typing.AsyncIterator[discord.Message]): The messages, oldest first, e.g. `channel.history(oldest_first=True)`.
+
+        Returns:
+            int: The number of messages counted.
+        """
+        counted = 0
+        try:
+            async for message in messages:
+                if self.add(message):
+                    counted += 1
+                    if self.pending >= self.flush_every:
+                        await self.flush()
+        finally:
+            await self.flush()
+        return counted
+
+    async def scan(
+        self,
+        channel: discord.abc.Messageable,
+        *,
+        limit: typing.Optional[int] = None,
+    ) -> int:
+        """Counts a channel's history, starting after the checkpoint.
+
+        Args:
+            channel (discord.abc.Messageable): The channel to scan.
+            limit (typing.Optional[int], optional): The most messages to read. Defaults to all of them.
+
+        Returns:
+            int: The number of messages counted.
+        """
+        self.start = self.checkpoint
+        after = discord.Object(id=self.checkpoint) if self.checkpoint is not None else None
+        return await self.consume(channel.history(limit=limit, after=after, oldest_first=True))
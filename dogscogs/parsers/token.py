@@ -1,11 +1,13 @@
-from contextlib import suppress
 from datetime import datetime, timedelta
 from enum import UNIQUE, StrEnum, verify
+import functools
 import re
 import typing
 import discord
 import pytz
 
+from ..core.cache import TTLCache
+
 
 @verify(UNIQUE)
 class Token(StrEnum):
@@ -26,6 +28,215 @@ class MessageOptions(typing.TypedDict, total=False):
     embed: typing.Optional[discord.Embed]
     reactions: typing.Optional[typing.List[typing.Union[discord.Emoji, str]]]
 
+class EmojiSegment(typing.NamedTuple):
+    name: str
+
+TemplateSegment = typing.Union[str, Token, EmojiSegment]
+
+class CompiledTemplate(typing.NamedTuple):
+    segments: typing.Tuple[TemplateSegment, ...]
+    reactions: typing.Tuple[str, ...]
+    weights: typing.Tuple[str, ...]
+
+_SUBSTITUTED_TOKENS = (
+    Token.MemberName,
+    Token.ServerName,
+    Token.MemberCount,
+    Token.Action,
+    Token.InstigatorName,
+    Token.Context,
+)
+_EMOJI_PATTERN = r"[:][a-zA-Z0-9_]+[:]"
+_SEGMENT_REGEX = re.compile(
+    "|".join(re.escape(token.value) for token in _SUBSTITUTED_TOKENS) + "|" + _EMOJI_PATTERN
+)
+_REACT_REGEX = re.compile(r"react\(([^()]*)\)")
+_WEIGHT_REGEX = re.compile(r"weight\(([^()]*)\)")
+
+@functools.lru_cache(maxsize=1024)
+def compile_template(text: str) -> CompiledTemplate:
+    """Parses a template string once into literal, token, and emoji segments.
+
+    Args:
+        text (str): The template string.
+
+    Returns:
+        CompiledTemplate: The parsed segments, along with any react(...) and weight(...) params.
+    """
+    segments: typing.List[TemplateSegment] = []
+    position = 0
+
+    for match in _SEGMENT_REGEX.finditer(text):
+        if match.start() > position:
+            segments.append(text[position:match.start()])
+        value = match.group()
+        if value.startswith(":"):
+            segments.append(EmojiSegment(value[1:-1]))
+        else:
+            segments.append(Token(value))
+        position = match.end()
+
+    if position < len(text):
+        segments.append(text[position:])
+
+    return CompiledTemplate(
+        segments=tuple(segments),
+        reactions=tuple(_REACT_REGEX.findall(text)),
+        weights=tuple(_WEIGHT_REGEX.findall(text)),
+    )
+
+# Bounded so guilds the bot has left are eventually evicted.
+_emoji_cache: TTLCache[int, typing.Tuple[typing.Sequence[discord.Emoji], typing.Dict[str, discord.Emoji]]] = TTLCache(maxsize=1024)
+
+def get_emoji_map(guild: discord.Guild) -> typing.Dict[str, discord.Emoji]:
+    """Gets a cached name to emoji lookup for a guild.
+
+    Args:
+        guild (discord.Guild): The guild to look up emojis for.
+
+    Returns:
+        typing.Dict[str, discord.Emoji]: The first emoji for each name, matching `discord.utils.get`.
+    """
+    cached = _emoji_cache.get(guild.id)
+    if cached is not None and cached[0] is guild.emojis:
+        return cached[1]
+
+    emoji_map = {emoji.name: emoji for emoji in reversed(guild.emojis)}
+    _emoji_cache.set(guild.id, (guild.emojis, emoji_map))
+    return emoji_map
+
+def invalidate_emoji_map(guild: discord.Guild) -> None:
+    """Drops the cached emoji lookup for a guild. Call this from `on_guild_emojis_update` and `on_guild_remove`.
+
+    Args:
+        guild (discord.Guild): The guild whose emojis changed.
+    """
+    _emoji_cache.pop(guild.id)
+
+def _token_values(
+    *,
+    member: typing.Optional[discord.Member],
+    guild: typing.Optional[discord.Guild],
+    action: typing.Optional[ActionType],
+    instigator: typing.Optional[discord.Member],
+    context: typing.Optional[str],
+    use_mentions: typing.Optional[bool],
+) -> typing.Dict[Token, str]:
+    values: typing.Dict[Token, str] = {}
+
+    if member is not None:
+        values[Token.MemberName] = member.display_name if not use_mentions else member.mention
+    if guild is not None:
+        values[Token.ServerName] = guild.name
+        values[Token.MemberCount] = str(guild.member_count)
+    if action is not None:
+        values[Token.Action] = action
+    if instigator is not None:
+        values[Token.InstigatorName] = instigator.display_name if not use_mentions else instigator.mention
+    if context is not None:
+        values[Token.Context] = context
+
+    return values
+
+def _render_segment(
+    segment: TemplateSegment,
+    values: typing.Dict[Token, str],
+    emoji_map: typing.Dict[str, discord.Emoji],
+) -> str:
+    if isinstance(segment, Token):
+        return values.get(segment, segment.value)
+    if isinstance(segment, EmojiSegment):
+        emoji = emoji_map.get(segment.name)
+        return str(emoji) if emoji is not None else f":{segment.name}:"
+    return segment
+
+def render_template(
+    template: CompiledTemplate,
+    *,
+    member: typing.Optional[discord.Member] = None,
+    guild: typing.Optional[discord.Guild] = None,
+    action: typing.Optional[ActionType] = None,
+    instigator: typing.Optional[discord.Member] = None,
+    context: typing.Optional[str] = None,
+    use_mentions: typing.Optional[bool] = False,
+) -> str:
+    """Renders a compiled template in a single pass. Unresolved tokens are left as-is.
+
+    Args:
+        template (CompiledTemplate): The template from `compile_template`.
+
+    Returns:
+        str: The rendered text.
+    """
+    values = _token_values(
+        member=member,
+        guild=guild,
+        action=action,
+        instigator=instigator,
+        context=context,
+        use_mentions=use_mentions,
+    )
+    emoji_map = get_emoji_map(guild) if guild is not None else {}
+
+    return "".join(_render_segment(segment, values, emoji_map) for segment in template.segments)
+
+def render_many(
+    template: typing.Union[str, CompiledTemplate],
+    *,
+    members: typing.Iterable[discord.Member],
+    guild: typing.Optional[discord.Guild] = None,
+    action: typing.Optional[ActionType] = None,
+    instigator: typing.Optional[discord.Member] = None,
+    context: typing.Optional[str] = None,
+    use_mentions: typing.Optional[bool] = False,
+) -> typing.Iterator[MessageOptions]:
+    """Renders one template for many members, resolving everything but the member once.
+
+    Each result's content is identical to calling `replace_tokens` for that member.
+
+    Args:
+        template (typing.Union[str, CompiledTemplate]): The template string or compiled template.
+        members (typing.Iterable[discord.Member]): The members to render for, in order.
+
+    Yields:
+        MessageOptions: The rendered message for each member.
+    """
+    if isinstance(template, str):
+        template = compile_template(template)
+
+    values = _token_values(
+        member=None,
+        guild=guild,
+        action=action,
+        instigator=instigator,
+        context=context,
+        use_mentions=use_mentions,
+    )
+    emoji_map = get_emoji_map(guild) if guild is not None else {}
+
+    parts: typing.List[str] = []
+    literal: typing.List[str] = []
+
+    for segment in template.segments:
+        if segment is Token.MemberName:
+            parts.append("".join(literal))
+            parts.append(Token.MemberName)
+            literal = []
+        else:
+            literal.append(_render_segment(segment, values, emoji_map))
+    parts.append("".join(literal))
+
+    if len(parts) == 1:
+        for _ in members:
+            yield MessageOptions(content=parts[0])
+        return
+
+    for member in members:
+        name = member.display_name if not use_mentions else member.mention
+        yield MessageOptions(
+            content="".join(name if part is Token.MemberName else part for part in parts)
+        )
+
 def replace_tokens(
     text: str,
     *,
@@ -36,31 +247,12 @@ def replace_tokens(
     context: typing.Optional[str] = None,
     use_mentions: typing.Optional[bool] = False,
 ):
-    if member is not None:
-        text = text.replace(
-                Token.MemberName.value,
-                member.display_name if not use_mentions else member.mention,
-            )
-    if guild is not None:
-        text = text.replace(Token.ServerName.value, guild.name)
-        text = text.replace(Token.MemberCount.value, str(guild.member_count))
-        emoji_matches = re.findall(r"[:][a-zA-Z0-9_]+[:]", text)
-
-        for match in emoji_matches:
-            emoji_name = match[1:-1]
-            with suppress(discord.errors.HTTPException):
-                emoji = discord.utils.get(guild.emojis, name=emoji_name)
-                if emoji is not None:
-                    text = text.replace(match, str(emoji))
-        
-    if action is not None:
-        text = text.replace(Token.Action.value, action)
-    if instigator is not None:
-        text = text.replace(
-            Token.InstigatorName.value,
-            instigator.display_name if not use_mentions else instigator.mention,
-        )
-    if context is not None:
-        text = text.replace(Token.Context.value, context)
-
-    return text
\ No newline at end of file
+    return render_template(
+        compile_template(text),
+        member=member,
+        guild=guild,
+        action=action,
+        instigator=instigator,
+        context=context,
+        use_mentions=use_mentions,
+    )
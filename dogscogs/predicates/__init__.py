@@ -1,11 +1,10 @@
-import re
 import typing
 import discord
 from redbot.core import Config
 
-from ..converters.diceroll import DiceRoll
 from ..converters.percent import Percent
 from ..constants import regex
+from ..parsers.dice import compile_dice
 
 async def validate_true(str: str, interaction: discord.Interaction):
     return True
@@ -16,7 +15,7 @@ async def validate_number_or_diceroll(input: str, interaction: discord.Interacti
         return True
     except:
         try:
-            await DiceRoll.parse(None, input) # type: ignore[arg-type]
+            compile_dice(input)
             return True
         except:
             return False
@@ -27,7 +26,7 @@ async def validate_percent_or_diceroll(input: str, interaction: discord.Interact
         return True
     except:
         try:
-            await DiceRoll.parse(None, input) # type: ignore[arg-type]
+            compile_dice(input)
             return True
         except:
             return False
@@ -36,7 +35,7 @@ async def validate_not_in_list(list: typing.List[str], input: str, interaction:
     return input.lower() not in list
 
 async def validate_image(input: str, _interaction: discord.Interaction):
-    return input == "" or re.match(regex.IMAGE, input) is not None
+    return input == "" or regex.IMAGE_REGEX.match(input) is not None
 
 async def validate_length(length: int, input: str, interaction: discord.Interaction):
     return len(input) <= length
\ No newline at end of file
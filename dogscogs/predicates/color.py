@@ -1,6 +1,7 @@
-import re
 import discord
 
+from ..constants import regex
+
 
 def convert_color_name(input: str) -> discord.Color:
     return discord.Colour.__dict__[input.lower().replace(' ', '_')].__func__(discord.Colour)
@@ -9,7 +10,7 @@ def convert_hex_code(input: str) -> discord.Color:
     return discord.Color.from_str(input)
 
 def convert_color_tuple(input: str) -> discord.Color:
-    return discord.Color.from_rgb(*map(int, re.sub(r"[^0-9,]", "", input).split(',')))
+    return discord.Color.from_rgb(*map(int, regex.NOT_RGB_REGEX.sub("", input).split(',')))
 
 def convert_to_color(input: str):
     try:
@@ -0,0 +1,286 @@
+import asyncio
+import typing
+import aiohttp
+
+from ..constants.discord import emoji
+from ..core.cache import TTLCache
+from ..core.http import USER_AGENT, get_session
+
+REFUSED_HEAD_STATUSES = (403, 405, 501)
+TRANSIENT_STATUSES = (408, 429)
+_UNCACHED = object()
+
+content_type_cache : TTLCache[str, typing.Optional[str]] = TTLCache(maxsize=512, ttl=10 * 60)
+
+def is_definitive_status(status: int) -> bool:
+    """Checks whether a response status is a lasting answer worth caching, rather than a server or rate limit failure.
+
+    Args:
+        status (int): The HTTP status code.
+
+    Returns:
+        bool: Whether the status is a success or a client error other than a timeout or rate limit.
+    """
+    return status < 500 and status not in TRANSIENT_STATUSES
+
+def image_content_types(extensions: typing.Iterable[str]) -> typing.Set[str]:
+    """Gets the image MIME types allowed for a list of file extensions.
+
+    Args:
+        extensions (typing.Iterable[str]): File extensions, e.g. `png` or `jpg`.
+
+    Returns:
+        typing.Set[str]: The matching `image/*` content types.
+    """
+    content_types = {f"image/{ext.lower()}" for ext in extensions}
+    if "image/jpg" in content_types:
+        content_types.add("image/jpeg")
+    return content_types
+
+async def fetch_content_type(
+    url: str,
+    *,
+    session: typing.Optional[aiohttp.ClientSession] = None,
+    timeout: float = 10,
+) -> typing.Optional[str]:
+    """Gets the content type a URL serves, without downloading its body.
+
+    Sends a HEAD request following redirects, and falls back to a one-byte range GET for servers that refuse HEAD.
+    Results are cached by URL, except for timeouts, connection errors, and 5xx or rate limited responses.
+
+    Args:
+        url (str): The URL to check.
+        session (typing.Optional[aiohttp.ClientSession], optional): The session to use. Defaults to the shared session.
+        timeout (float, optional): Seconds to wait for each request. Defaults to 10.
+
+    Returns:
+        typing.Optional[str]: The lowercase content type without parameters, or None if the URL couldn't be reached.
+    """
+    cached = content_type_cache.get(url, _UNCACHED)  # type: ignore[arg-type]
+    if cached is not _UNCACHED:
+        return cached
+
+    if session is None:
+        session = await get_session()
+
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    content_type = None
+    definitive = False
+
+    try:
+        async with session.head(
+            url, allow_redirects=True, timeout=client_timeout, headers={"User-Agent": USER_AGENT}
+        ) as response:
+            status = response.status
+            content_type = response.headers.get("content-type")
+
+        if status in REFUSED_HEAD_STATUSES:
+            async with session.get(
+                url,
+                allow_redirects=True,
+                timeout=client_timeout,
+                headers={"User-Agent": USER_AGENT, "Range": "bytes=0-0"},
+            ) as response:
+                status = response.status
+                content_type = response.headers.get("content-type")
+
+        definitive = is_definitive_status(status)
+        if status >= 400:
+            content_type = None
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        content_type = None
+
+    if content_type is not None:
+        content_type = content_type.split(";")[0].strip().lower()
+
+    if definitive:
+        content_type_cache.set(url, content_type)
+    return content_type
+
+async def validate_image_url(
+    url: str,
+    valid_extensions: typing.Iterable[str] = ("png", "jpg", "jpeg", "gif"),
+    *,
+    session: typing.Optional[aiohttp.ClientSession] = None,
+) -> bool:
+    """Checks that a URL serves an image of one of the given types.
+
+    Args:
+        url (str): The URL to check.
+        valid_extensions (typing.Iterable[str], optional): The allowed image extensions. Defaults to png, jpg, jpeg, and gif.
+        session (typing.Optional[aiohttp.ClientSession], optional): The session to use. Defaults to the shared session.
+
+    Returns:
+        bool: Whether the URL serves an allowed image type.
+    """
+    return await fetch_content_type(url, session=session) in image_content_types(valid_extensions)
+
+class ImageProbe(typing.NamedTuple):
+    format: typing.Optional[str]
+    width: typing.Optional[int]
+    height: typing.Optional[int]
+    size: typing.Optional[int]
+    content_type: typing.Optional[str]
+
+def _sniff_png(data: bytes) -> typing.Optional[typing.Tuple[int, int]]:
+    if len(data) < 24 or data[12:16] != b"IHDR":
+        return None
+    return int.from_bytes(data[16:20], "big"), int.from_bytes(data[20:24], "big")
+
+def _sniff_gif(data: bytes) -> typing.Optional[typing.Tuple[int, int]]:
+    if len(data) < 10:
+        return None
+    return int.from_bytes(data[6:8], "little"), int.from_bytes(data[8:10], "little")
+
+def _sniff_webp(data: bytes) -> typing.Optional[typing.Tuple[int, int]]:
+    chunk = data[12:16]
+    if chunk == b"VP8X" and len(data) >= 30:
+        return int.from_bytes(data[24:27], "little") + 1, int.from_bytes(data[27:30], "little") + 1
+    if chunk == b"VP8 " and len(data) >= 30:
+        return (
+            int.from_bytes(data[26:28], "little") & 0x3FFF,
+            int.from_bytes(data[28:30], "little") & 0x3FFF,
+        )
+    if chunk == b"VP8L" and len(data) >= 25:
+        bits = int.from_bytes(data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    return None
+
+def _sniff_jpeg(data: bytes) -> typing.Optional[typing.Tuple[int, int]]:
+    i = 2
+    while i + 9 < len(data):
+        if data[i] != 0xFF:
+            return None
+        marker = data[i + 1]
+        if marker == 0xFF:
+            i += 1
+            continue
+        if 0xD0 <= marker <= 0xD9 or marker == 0x01:
+            i += 2
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            return int.from_bytes(data[i + 7:i + 9], "big"), int.from_bytes(data[i + 5:i + 7], "big")
+        i += 2 + int.from_bytes(data[i + 2:i + 4], "big")
+    return None
+
+IMAGE_SIGNATURES : typing.List[typing.Tuple[str, typing.Callable[[bytes], bool], typing.Callable[[bytes], typing.Optional[typing.Tuple[int, int]]]]] = [
+    ("png", lambda data: data.startswith(b"\x89PNG\r\n\x1a\n"), _sniff_png),
+    ("gif", lambda data: data[:6] in (b"GIF87a", b"GIF89a"), _sniff_gif),
+    ("jpeg", lambda data: data.startswith(b"\xff\xd8\xff"), _sniff_jpeg),
+    ("webp", lambda data: data[:4] == b"RIFF" and data[8:12] == b"WEBP", _sniff_webp),
+]
+
+def sniff_image(data: bytes) -> typing.Tuple[typing.Optional[str], typing.Optional[typing.Tuple[int, int]]]:
+    """Identifies an image's format and dimensions from the first bytes of the file.
+
+    Args:
+        data (bytes): The start of the file.
+
+    Returns:
+        typing.Tuple[typing.Optional[str], typing.Optional[typing.Tuple[int, int]]]: The format (png, gif, jpeg or webp) and the (width, height), if found.
+    """
+    for name, matches, dimensions in IMAGE_SIGNATURES:
+        if matches(data):
+            return name, dimensions(data)
+    return None, None
+
+image_probe_cache : TTLCache[str, typing.Optional[ImageProbe]] = TTLCache(maxsize=512, ttl=10 * 60)
+
+async def probe_image(
+    url: str,
+    *,
+    session: typing.Optional[aiohttp.ClientSession] = None,
+    read_limit: int = 64 * 1024,
+    timeout: float = 10,
+) -> typing.Optional[ImageProbe]:
+    """Gets an image's real format, dimensions, and file size while downloading as little as possible.
+
+    Only the first few KB are requested, and reading stops as soon as the header is parsed or the
+    bytes turn out not to be an image. Results are cached by URL, except for timeouts, connection
+    errors, and 5xx or rate limited responses.
+
+    Args:
+        url (str): The URL of the image.
+        session (typing.Optional[aiohttp.ClientSession], optional): The session to use. Defaults to the shared session.
+        read_limit (int, optional): The most bytes to read looking for the header. Defaults to 64 KB.
+        timeout (float, optional): Seconds to wait for the request. Defaults to 10.
+
+    Returns:
+        typing.Optional[ImageProbe]: The probe result, or None if the URL couldn't be reached.
+    """
+    cached = image_probe_cache.get(url, _UNCACHED)  # type: ignore[arg-type]
+    if cached is not _UNCACHED:
+        return cached
+
+    if session is None:
+        session = await get_session()
+
+    probe = None
+    definitive = False
+
+    try:
+        async with session.get(
+            url,
+            allow_redirects=True,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            headers={"User-Agent": USER_AGENT, "Range": f"bytes=0-{read_limit - 1}"},
+        ) as response:
+            definitive = is_definitive_status(response.status)
+            if response.status < 400:
+                size = response.content_length
+                content_range = response.headers.get("content-range", "")
+                if response.status == 206 and "/" in content_range:
+                    total = content_range.rsplit("/", 1)[1]
+                    size = int(total) if total.isdigit() else None
+
+                content_type = response.headers.get("content-type")
+                if content_type is not None:
+                    content_type = content_type.split(";")[0].strip().lower()
+
+                image_format, dimensions = None, None
+                data = b""
+                while len(data) < read_limit:
+                    chunk = await response.content.read(min(4096, read_limit - len(data)))
+                    if not chunk:
+                        break
+                    data += chunk
+                    image_format, dimensions = sniff_image(data)
+                    if dimensions is not None or (len(data) >= 16 and image_format is None):
+                        break
+
+                probe = ImageProbe(
+                    format=image_format,
+                    width=dimensions[0] if dimensions is not None else None,
+                    height=dimensions[1] if dimensions is not None else None,
+                    size=size,
+                    content_type=content_type,
+                )
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        probe = None
+        definitive = False
+
+    if definitive:
+        image_probe_cache.set(url, probe)
+    return probe
+
+async def validate_emoji_image(
+    url: str,
+    *,
+    session: typing.Optional[aiohttp.ClientSession] = None,
+) -> bool:
+    """Checks that a URL is an image Discord will accept as an emoji, without downloading it.
+
+    Args:
+        url (str): The URL of the image.
+        session (typing.Optional[aiohttp.ClientSession], optional): The session to use. Defaults to the shared session.
+
+    Returns:
+        bool: Whether the image is a known format with a known size within `emoji.MAX_FILE_SIZE`.
+    """
+    probe = await probe_image(url, session=session)
+    return (
+        probe is not None
+        and probe.format is not None
+        and probe.size is not None
+        and probe.size <= emoji.MAX_FILE_SIZE
+    )
@@ -1,9 +1,12 @@
+import discord
+import typing
 from _typeshed import Incomplete
 from fractions import Fraction
 from typing import Iterable
 
 HSVTuple = tuple[Fraction, Fraction, Fraction]
 RGBTuple = tuple[float, float, float]
+LabTuple = tuple[float, float, float]
 DEFAULT_COLORS: Incomplete
 
 def color_diff(rgb1, rgb2):
@@ -22,11 +25,73 @@ def min_palette_diff(p):
     """
     Finds the smallest distance between two elements of a palette.
     """
-def get_palette(n: int = 100, Lmin: int = 5, Lmax: int = 90, maxLoops: int = 100000) -> Iterable[RGBTuple]:
+def distance_matrix(colors: tuple[RGBTuple, ...]) -> list[list[float]]:
+    """
+    Computes the pairwise `color_diff` between every color given, cached per set of colors.
+    """
+def get_palette(n: int = 100, Lmin: int = 5, Lmax: int = 90, maxLoops: int = 100000, *, seed: int | None = None, refine: bool = True) -> Iterable[RGBTuple]:
     """
     Obtains a palette based on the number of colors desired.
+
+    Colors are picked by farthest-point selection over the `DEFAULT_COLORS` distance matrix,
+    optionally refined by swapping out the closest pair for at most `maxLoops` passes.
+    Passing a `seed` makes the result reproducible.
     """
 def hex_to_rgb(h: str) -> tuple[int, int, int]:
     """
     Converts a hex value to 3 rgb values.
     """
+def rgb_to_lab(rgb: RGBTuple | discord.Colour) -> LabTuple:
+    """
+    Converts an sRGB color (0-255 channels) to CIELAB under a D65 white point.
+    """
+
+MAX_S_L: Incomplete
+MIN_CH_WEIGHT: Incomplete
+
+def delta_e(lab1: LabTuple, lab2: LabTuple) -> float:
+    """
+    Determines the perceptual distance between two CIELAB colors using CIEDE2000.
+    """
+def discord_colour_names() -> dict[str, discord.Colour]:
+    """
+    Gets every named `discord.Colour` classmethod that `convert_color_name` can resolve.
+    """
+
+class ColorMatch(typing.NamedTuple):
+    name: str | None
+    rgb: tuple[int, int, int]
+    distance: float
+
+class ColorIndex:
+    """
+    Precomputed CIELAB lookup table for nearest-color and similarity queries.
+
+    Entries are kept sorted by lightness and searched outwards from the query's lightness, so
+    ΔE2000 is only computed for entries that cheap lower bounds can't already rule out.
+    """
+    positions: list[int]
+    names: list[str | None]
+    rgbs: list[tuple[int, int, int]]
+    labs: list[LabTuple]
+    lightness: list[float]
+    chromas: list[float]
+    def __init__(self, colors: Iterable[tuple[str | None, tuple[int, int, int] | discord.Colour]]) -> None: ...
+    def __len__(self) -> int: ...
+    def nearest(self, color: RGBTuple | discord.Colour, k: int = 1) -> list[ColorMatch]:
+        """
+        Finds the `k` closest colors in the index, closest first.
+        """
+    def within(self, color: RGBTuple | discord.Colour, radius: float) -> list[ColorMatch]:
+        """
+        Finds every color in the index within `radius` ΔE2000 of the given color, closest first.
+        """
+    def nearest_many(self, colors: Iterable[RGBTuple | discord.Colour], k: int = 1) -> list[list[ColorMatch]]:
+        """
+        Finds the `k` closest colors in the index for each of the given colors, searching each distinct color once.
+        """
+
+def get_color_index() -> ColorIndex:
+    """
+    Gets the shared index over the named `discord.Colour`s and `DEFAULT_COLORS`.
+    """
@@ -1,2 +1,5 @@
+from _typeshed import Incomplete
+
 MIN_NAME_LENGTH: int
 MAX_NAME_LENGTH: int
+MAX_FILE_SIZE: Incomplete
@@ -1,6 +1,32 @@
+from _typeshed import Incomplete
+
 TRIGGER: str
 IP_ADDRESS: str
 PORT: str
 IMAGE: str
 EMOJI_NAME: str
 EMOJI_URL: str
+CHANNEL_MENTION: str
+USER_MENTION: str
+MENTION: str
+CUSTOM_EMOJI: str
+UNICODE_EMOJI: Incomplete
+EMOJI: Incomplete
+DURATION_CLOCK: str
+DURATION_PART: str
+NOT_RGB: str
+TRIGGER_REGEX: Incomplete
+IP_ADDRESS_REGEX: Incomplete
+PORT_REGEX: Incomplete
+IMAGE_REGEX: Incomplete
+EMOJI_NAME_REGEX: Incomplete
+EMOJI_URL_REGEX: Incomplete
+CHANNEL_MENTION_REGEX: Incomplete
+USER_MENTION_REGEX: Incomplete
+MENTION_REGEX: Incomplete
+CUSTOM_EMOJI_REGEX: Incomplete
+UNICODE_EMOJI_REGEX: Incomplete
+EMOJI_REGEX: Incomplete
+DURATION_CLOCK_REGEX: Incomplete
+DURATION_PART_REGEX: Incomplete
+NOT_RGB_REGEX: Incomplete
@@ -1,7 +1,11 @@
+import typing
+from ..constants import regex as regex
 from ..constants.discord.channel import TEXT_TYPES as TEXT_TYPES
-from ..core.converter import DogCogConverter as DogCogConverter
+from ..core.converter import CHANNEL_EVENTS as CHANNEL_EVENTS, CacheScope as CacheScope, DogCogConverter as DogCogConverter
 from redbot.core import commands
 
 class TextChannelList(DogCogConverter):
+    cache_scope: typing.ClassVar[CacheScope | None]
+    invalidated_by: typing.ClassVar[tuple[str, ...]]
     @staticmethod
     async def parse(ctx: commands.GuildContext, argument: str) -> list[TEXT_TYPES]: ...
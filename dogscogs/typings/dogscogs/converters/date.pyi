@@ -1,14 +1,31 @@
 import datetime
-from ..constants import TIMEZONE as TIMEZONE
+import typing
 from ..core.converter import DogCogConverter as DogCogConverter
+from ..parsers.date import TimezoneResolver as TimezoneResolver, resolve_timezone as resolve_timezone
 from _typeshed import Incomplete
 from collections.abc import Generator
 from redbot.core import commands as commands
 
 def date_formats() -> Generator[Incomplete]: ...
+def parse_month_day(argument: str) -> tuple[int, int] | None:
+    """Parses a date string accepted by any of `date_formats` into its month and day.
+
+    Formats are tried in the same order as `date_formats`, and the first one that yields
+    a real calendar date wins, exactly as `datetime.strptime` would.
+
+    Args:
+        argument (str): The date string.
+
+    Returns:
+        typing.Optional[typing.Tuple[int, int]]: The month and day, or None if the date is not recognized.
+    """
 
 class BirthdayConverter(DogCogConverter):
     """Returns a datetime object ignoring the birthday for a birthday string.
+
+    The datetime is midnight in the timezone from `timezone_resolver`, which subclasses can set
+    to look up a guild's or user's timezone. Defaults to `TIMEZONE_ID`.
     """
-    @staticmethod
-    async def parse(_ctx: commands.Context, argument: str) -> datetime.datetime: ...
+    timezone_resolver: typing.ClassVar[TimezoneResolver | None]
+    @classmethod
+    async def parse(cls, ctx: commands.Context, argument: str) -> datetime.datetime: ...
@@ -1,14 +1,17 @@
-from ..core.converter import DogCogConverter as DogCogConverter
-from redbot.core import commands
+import typing
+from ..core.converter import CacheScope as CacheScope, DogCogConverter as DogCogConverter
+from ..parsers.dice import CompiledRoll as CompiledRoll, compile_dice as compile_dice
+from redbot.core import commands as commands
 
 class DiceRoll(DogCogConverter):
+    cache_scope: typing.ClassVar[CacheScope | None]
     @staticmethod
-    async def parse(_ctx: commands.Context, input: str) -> str:
-        """Converts a string to a float or a d20 roll.
+    async def parse(_ctx: commands.Context, input: str) -> CompiledRoll:
+        """Converts a string to a compiled d20 roll.
 
         Args:
             input (str): The string argument input.
 
         Returns:
-            typing.Union[float, str]: A float if it's a percentage, or a string if it's a d20 roll.
+            CompiledRoll: The normalized roll string, which can be rolled without parsing it again.
         """
@@ -1,7 +1,18 @@
-import discord
-from ..core.converter import DogCogConverter as DogCogConverter
+import typing
+from ..constants import regex as regex
+from ..core.converter import CHANNEL_EVENTS as CHANNEL_EVENTS, CacheScope as CacheScope, DogCogConverter as DogCogConverter, MEMBER_EVENTS as MEMBER_EVENTS, ROLE_EVENTS as ROLE_EVENTS
+from _typeshed import Incomplete
 from redbot.core import commands
 
+MentionTarget: Incomplete
+
 class Mention(DogCogConverter):
+    """A text channel, member, or role.
+
+    Mentions and ids go straight to the guild's cache by their syntax; only plain names are
+    searched, and only members missing from the cache are fetched.
+    """
+    cache_scope: typing.ClassVar[CacheScope | None]
+    invalidated_by: typing.ClassVar[tuple[str, ...]]
     @staticmethod
-    async def parse(ctx: commands.Context, input: str) -> discord.TextChannel | discord.Member | discord.Role: ...
+    async def parse(ctx: commands.Context, input: str) -> MentionTarget: ...
@@ -1,6 +1,8 @@
-from ..core.converter import DogCogConverter as DogCogConverter
+import typing
+from ..core.converter import CacheScope as CacheScope, DogCogConverter as DogCogConverter
 from redbot.core import commands
 
 class Percent(DogCogConverter):
+    cache_scope: typing.ClassVar[CacheScope | None]
     @staticmethod
     async def parse(ctx: commands.Context, input: str) -> float: ...
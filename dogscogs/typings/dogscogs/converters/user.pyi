@@ -1,7 +1,30 @@
 import discord
-from ..core.converter import DogCogConverter as DogCogConverter
+import typing
+from ..constants import regex as regex
+from ..core.converter import CacheScope as CacheScope, DogCogConverter as DogCogConverter, MEMBER_EVENTS as MEMBER_EVENTS
+from redbot.core.bot import Red as Red
 from redbot.core.commands import GuildContext as GuildContext
 
+QUERY_CHUNK_SIZE: int
+
+async def resolve_users(bot: Red, guild: discord.Guild | None, user_ids: typing.Iterable[int], *, concurrency: int = 5) -> tuple[dict[int, discord.User], list[int]]:
+    """Resolves many user ids at once, hitting the API only for users that aren't cached.
+
+    Users are looked up in the guild and bot caches first, then queried from the guild gateway
+    in chunks of 100, and finally fetched individually with at most `concurrency` requests in flight.
+
+    Args:
+        bot (Red): The bot to resolve users with.
+        guild (typing.Optional[discord.Guild]): The guild to check for members.
+        user_ids (typing.Iterable[int]): The ids to resolve.
+        concurrency (int, optional): The most `fetch_user` calls to run at once. Defaults to 5.
+
+    Returns:
+        typing.Tuple[typing.Dict[int, discord.User], typing.List[int]]: The resolved users by id, and every id that could not be resolved.
+    """
+
 class UserList(DogCogConverter):
+    cache_scope: typing.ClassVar[CacheScope | None]
+    invalidated_by: typing.ClassVar[tuple[str, ...]]
     @staticmethod
     async def parse(ctx: GuildContext, argument: str) -> list[discord.User]: ...
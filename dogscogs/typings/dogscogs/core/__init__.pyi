@@ -1,3 +1,13 @@
 import discord
+from .audit_log import AuditLogResolver as AuditLogResolver
+from _typeshed import Incomplete
+
+audit_log_resolver: Incomplete
 
 async def get_audit_log_reason(guild: discord.Guild, target: discord.abc.GuildChannel | discord.Member | discord.Role, action: discord.AuditLogAction) -> tuple[discord.abc.User | None, str | None]: ...
+def record_audit_log_entry(entry: discord.AuditLogEntry) -> None:
+    """Feeds an entry from `on_audit_log_entry_create` to the resolver behind `get_audit_log_reason`.
+
+    Args:
+        entry (discord.AuditLogEntry): The newly created entry.
+    """
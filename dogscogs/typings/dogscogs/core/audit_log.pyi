@@ -0,0 +1,76 @@
+import asyncio
+import discord
+import typing
+from _typeshed import Incomplete
+from datetime import timedelta
+
+AuditLogKey: Incomplete
+
+class GuildAuditLog:
+    """A bounded ring buffer of a guild's recent audit log entries, indexed by (action, target id)."""
+    entries: typing.Deque[tuple[AuditLogKey, discord.AuditLogEntry]]
+    ids: set[int]
+    index: dict[AuditLogKey, discord.AuditLogEntry]
+    size: Incomplete
+    def __init__(self, size: int) -> None: ...
+    def add(self, entry: discord.AuditLogEntry) -> None: ...
+    def get(self, action: discord.AuditLogAction, target_id: int) -> discord.AuditLogEntry | None: ...
+
+class PendingFetch:
+    """A shared audit log fetch, and the targets of every caller waiting on it."""
+    targets: set[int]
+    started: bool
+    future: asyncio.Future
+    def __init__(self) -> None: ...
+
+class AuditLogResolver:
+    """Resolves who performed an action from audit log entries pushed by `on_audit_log_entry_create`.
+
+    Lookups that miss the buffer fall back to fetching the audit log, with concurrent misses
+    for the same guild and action sharing a single fetch sized to the number of waiters.
+    """
+    size: Incomplete
+    max_age: Incomplete
+    fetch_limit: Incomplete
+    coalesce_delay: Incomplete
+    guilds: dict[int, GuildAuditLog]
+    pending: dict[tuple[int, discord.AuditLogAction], PendingFetch]
+    hits: int
+    misses: int
+    fetches: int
+    def __init__(self, *, size: int = 100, max_age: timedelta = ..., fetch_limit: int = 5, coalesce_delay: float = 0.5) -> None: ...
+    def record(self, entry: discord.AuditLogEntry) -> None:
+        """Stores an audit log entry. Call this from `on_audit_log_entry_create`.
+
+        Args:
+            entry (discord.AuditLogEntry): The newly created entry.
+        """
+    def lookup(self, guild: discord.Guild, target_id: int, action: discord.AuditLogAction) -> discord.AuditLogEntry | None:
+        """Finds a buffered entry for the target that is no older than `max_age`.
+
+        Returns:
+            typing.Optional[discord.AuditLogEntry]: The most recent matching entry, if any.
+        """
+    async def fetch(self, guild: discord.Guild, action: discord.AuditLogAction, target_id: int) -> None:
+        """Fetches recent audit log entries into the buffer, joining any fetch still gathering callers.
+
+        Callers that miss within `coalesce_delay` of each other share one request, sized to fit
+        all of their targets.
+
+        Args:
+            guild (discord.Guild): The guild to fetch from.
+            action (discord.AuditLogAction): The action to filter by.
+            target_id (int): The id of the target the caller is looking for.
+        """
+    async def resolve(self, guild: discord.Guild, target: discord.abc.GuildChannel | discord.Member | discord.Role, action: discord.AuditLogAction) -> tuple[discord.abc.User | None, str | None]:
+        """Gets the user responsible for an action on the target, and their reason.
+
+        Returns:
+            typing.Tuple[typing.Optional[discord.abc.User], typing.Optional[str]]: The perpetrator and reason, if found.
+        """
+    def stats(self) -> dict[str, int]:
+        """Gets the hit, miss, and fetch counters.
+
+        Returns:
+            typing.Dict[str, int]: The counters by name.
+        """
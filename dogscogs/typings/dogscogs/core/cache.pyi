@@ -0,0 +1,48 @@
+import typing
+from _typeshed import Incomplete
+from collections import OrderedDict
+
+K = typing.TypeVar('K')
+V = typing.TypeVar('V')
+
+class TTLCache(typing.Generic[K, V]):
+    """A least-recently-used cache whose entries optionally expire after `ttl` seconds."""
+    maxsize: Incomplete
+    ttl: Incomplete
+    entries: OrderedDict[K, tuple[float, V]]
+    hits: int
+    misses: int
+    def __init__(self, *, maxsize: int = 128, ttl: float | None = None) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, key: K) -> bool: ...
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Gets a value, counting a hit or miss and marking it as recently used.
+
+        Args:
+            key (K): The key to look up.
+            default (typing.Optional[V], optional): Returned if the key is missing or expired. Defaults to None.
+
+        Returns:
+            typing.Optional[V]: The cached value, or the default.
+        """
+    def set(self, key: K, value: V) -> None:
+        """Stores a value, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (K): The key to store under.
+            value (V): The value to store.
+        """
+    def pop(self, key: K) -> None:
+        """Removes a key if it is cached.
+
+        Args:
+            key (K): The key to remove.
+        """
+    def clear(self) -> None:
+        """Removes every entry."""
+    def stats(self) -> dict[str, int]:
+        """Gets the hit and miss counters, and the current size.
+
+        Returns:
+            typing.Dict[str, int]: The counters by name.
+        """
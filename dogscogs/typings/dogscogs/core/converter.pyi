@@ -1,9 +1,66 @@
 import abc
 import typing
+from .cache import TTLCache as TTLCache
+from _typeshed import Incomplete
 from abc import ABC, abstractmethod
 from redbot.core import commands
+from redbot.core.bot import Red as Red
+
+CacheScope: Incomplete
+ConverterCacheKey: Incomplete
+ConverterListener = typing.Callable[..., typing.Coroutine[typing.Any, typing.Any, None]]
+CHANNEL_EVENTS: Incomplete
+MEMBER_EVENTS: Incomplete
+ROLE_EVENTS: Incomplete
+
+class ConverterCache:
+    """Caches converter results by (converter, guild id, argument).
+
+    Only converters that set `cache_scope` are cached. `pure` results depend on the argument
+    alone and are shared between guilds; `guild` results are dropped when one of the
+    converter's `invalidated_by` events fires in that guild, so they are only cached while the
+    cache is attached to a bot.
+    """
+    cache: TTLCache[ConverterCacheKey, typing.Any]
+    invalidations: int
+    listeners: dict[str, ConverterListener]
+    attached: int
+    def __init__(self, *, maxsize: int = 1024, ttl: float | None = 300) -> None: ...
+    async def parse(self, converter: type['DogCogConverter'], ctx: commands.Context, argument: str) -> typing.Any:
+        """Parses an argument with a converter, reusing a cached result if the converter allows it.
+
+        Args:
+            converter (typing.Type[DogCogConverter]): The converter class.
+            ctx (commands.Context): The invocation context.
+            argument (str): The argument to convert.
+
+        Returns:
+            typing.Any: The converted value.
+        """
+    def invalidate(self, guild_id: int | None = None, *, event: str | None = None, converter: type['DogCogConverter'] | None = None) -> None:
+        """Drops cached results. With no arguments, drops everything.
+
+        Args:
+            guild_id (typing.Optional[int], optional): Only drop results from this guild.
+            event (typing.Optional[str], optional): Only drop results from converters invalidated by this event.
+            converter (typing.Optional[typing.Type[DogCogConverter]], optional): Only drop results from this converter.
+        """
+    def attach(self, bot: Red) -> None:
+        """Starts invalidating guild results on gateway events. Call this in `cog_load`; it is reference counted."""
+    def detach(self, bot: Red) -> None:
+        """Stops invalidating on gateway events once every `attach` has been matched. Call this in `cog_unload`."""
+    def stats(self) -> dict[str, int]:
+        """Gets the hit, miss, and invalidation counters, and the current size.
+
+        Returns:
+            typing.Dict[str, int]: The counters by name.
+        """
+
+converter_cache: Incomplete
 
 class DogCogConverter(ABC, commands.Converter, metaclass=abc.ABCMeta):
+    cache_scope: typing.ClassVar[CacheScope | None]
+    invalidated_by: typing.ClassVar[tuple[str, ...]]
     @staticmethod
     @abstractmethod
     async def parse(ctx: commands.Context, input: str) -> typing.Any: ...
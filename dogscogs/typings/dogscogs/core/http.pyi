@@ -0,0 +1,12 @@
+import aiohttp
+
+USER_AGENT: str
+
+async def get_session() -> aiohttp.ClientSession:
+    """Gets the pooled session shared by every dogscogs HTTP helper, creating it if needed.
+
+    Returns:
+        aiohttp.ClientSession: The shared session.
+    """
+async def close_session() -> None:
+    """Closes the shared session, e.g. when unloading the last cog that uses it."""
@@ -1,5 +1,13 @@
-from datetime import datetime as datetime
+import typing
+import zoneinfo
+from ..constants import TIMEZONE_ID as TIMEZONE_ID, regex as regex
+from _typeshed import Incomplete
+from datetime import datetime
 from itertools import permutations as permutations
+from redbot.core import commands
+
+TimezoneResolver: Incomplete
+K = typing.TypeVar('K')
 
 def duration_string(hours: int, minutes: int, seconds: int) -> str:
     """Converts hours, minutes, and seconds into a string duration.
@@ -9,15 +17,69 @@ def duration_string(hours: int, minutes: int, seconds: int) -> str:
         minutes (int): Integer number of minutes.
         seconds (int): Integer number of seconds.
 
+    Returns:
+        str: The completed string composing of the duration.
+    """
+def humanize_duration(seconds: int, *, short: bool = False, max_units: int | None = None) -> str:
+    """Converts a number of seconds into a multi-unit duration, e.g. `2 days, 4 hours and 30 seconds`.
+
+    Args:
+        seconds (int): Integer number of seconds.
+        short (bool, optional): Whether to use unit letters, e.g. `2d 4h 30s`. Defaults to False.
+        max_units (typing.Optional[int], optional): The most units to show, largest first. Defaults to all of them.
+
+    Raises:
+        ValueError: If `seconds` is negative.
+
     Returns:
         str: The completed string composing of the duration.
     """
 def parse_duration_string(input: str) -> int:
     """Parses a duration string into the number of seconds it composes.
 
+    Accepts clock forms (`H:MM:SS`, `MM:SS`) and unit forms (`90s`, `1h30m`, `2d 4h`, `1 hour and 5 minutes`).
+
     Args:
         input (str): The input string to parse.
 
+    Raises:
+        commands.BadArgument: If the string isn't a duration.
+
     Returns:
         int: The number of seconds in duration that string is.
     """
+def get_timezone(name: str) -> zoneinfo.ZoneInfo:
+    """Gets a cached timezone by its IANA name.
+
+    Args:
+        name (str): The timezone name, e.g. `US/Eastern`.
+
+    Raises:
+        zoneinfo.ZoneInfoNotFoundError: If the timezone doesn't exist.
+
+    Returns:
+        zoneinfo.ZoneInfo: The timezone.
+    """
+async def resolve_timezone(ctx: commands.Context | None, resolver: TimezoneResolver | None = None) -> zoneinfo.ZoneInfo:
+    """Resolves the timezone for a guild or user, falling back to `TIMEZONE_ID`.
+
+    Args:
+        ctx (typing.Optional[commands.Context]): The context to resolve for.
+        resolver (typing.Optional[TimezoneResolver], optional): Returns the timezone name for a context, if one is set. Defaults to None.
+
+    Returns:
+        zoneinfo.ZoneInfo: The resolved timezone.
+    """
+def birthdays_today(birthdays: typing.Mapping[K, datetime], *, now: datetime | None = None) -> list[K]:
+    """Finds every birthday that falls on today's date in its own timezone.
+
+    Today's date is computed once per distinct timezone. Naive birthdays use `TIMEZONE_ID`,
+    and February 29th birthdays fall on February 28th in non-leap years.
+
+    Args:
+        birthdays (typing.Mapping[K, datetime]): The stored birthdays by key, e.g. member id.
+        now (typing.Optional[datetime], optional): The current time. Defaults to now.
+
+    Returns:
+        typing.List[K]: The keys whose birthday is today.
+    """
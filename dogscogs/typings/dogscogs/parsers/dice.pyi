@@ -0,0 +1,40 @@
+import d20
+
+MAX_EXPRESSION_LENGTH: int
+MAX_DICE: int
+MAX_DEPTH: int
+
+class CompiledRoll(str):
+    """A validated dice expression that keeps its parsed tree, so rolling it never parses again.
+
+    It is still the normalized expression string, so it can be stored or passed to `d20.roll` as-is.
+    """
+    ast: d20.ast.Expression
+    dice: int
+    depth: int
+    def __new__(cls, expression: str, ast: d20.ast.Expression, dice: int, depth: int) -> CompiledRoll: ...
+    def roll(self, *, advantage: d20.AdvType = ..., stringifier: d20.Stringifier | None = None) -> d20.RollResult:
+        """Rolls the expression from its parsed tree.
+
+        Args:
+            advantage (d20.AdvType, optional): Rolls the leftmost 1d20 with advantage or disadvantage. Defaults to neither.
+            stringifier (typing.Optional[d20.Stringifier], optional): Formats the result. Defaults to d20's markdown.
+
+        Returns:
+            d20.RollResult: The result.
+        """
+
+def compile_dice(expression: str, *, max_dice: int = ..., max_depth: int = ...) -> CompiledRoll:
+    """Parses a dice expression once, enforcing complexity limits, and caches the result.
+
+    Args:
+        expression (str): The dice expression, e.g. `4d6kh3 + 2`.
+        max_dice (int, optional): The most dice the expression may roll. Defaults to MAX_DICE.
+        max_depth (int, optional): The deepest the parsed tree may nest. Defaults to MAX_DEPTH.
+
+    Raises:
+        commands.BadArgument: If the expression is invalid or over the limits.
+
+    Returns:
+        CompiledRoll: The compiled expression.
+    """
@@ -0,0 +1,123 @@
+import random
+import typing
+from .dice import CompiledRoll as CompiledRoll, compile_dice as compile_dice
+from _typeshed import Incomplete
+
+EXACT_WORK_LIMIT: int
+EXACT_SAMPLE_THRESHOLD: int
+SAMPLE_WORK_LIMIT: int
+
+class DiceTerm(typing.NamedTuple):
+    dice: int
+    sides: int
+    keep: typing.Literal['h', 'l'] | None
+    kept: int
+    sign: int
+
+class DicePlan(typing.NamedTuple):
+    """A dice expression reduced to dice terms and a flat modifier, e.g. `4d6kh3 - 1d4 + 2`."""
+    terms: tuple[DiceTerm, ...]
+    modifier: int
+    def roll(self, rng: random.Random) -> int: ...
+
+def compile_plan(roll: CompiledRoll) -> DicePlan | None:
+    """Reduces a compiled roll to dice terms and a modifier, if it only adds and subtracts dice, keeps, and integers.
+
+    Args:
+        roll (CompiledRoll): The compiled roll.
+
+    Returns:
+        typing.Optional[DicePlan]: The plan, or None if the roll needs d20 to evaluate it.
+    """
+
+class DiceDistribution:
+    """The distribution of a dice expression's totals, as counts of outcomes.
+
+    Exact distributions count every equally likely outcome; sampled ones count rolls.
+    """
+    values: Incomplete
+    counts: Incomplete
+    total: Incomplete
+    exact: Incomplete
+    cumulative: list[int]
+    cumulative_probabilities: Incomplete
+    def __init__(self, counts: typing.Mapping[int, int], *, exact: bool) -> None: ...
+    @property
+    def minimum(self) -> int: ...
+    @property
+    def maximum(self) -> int: ...
+    @property
+    def mean(self) -> float: ...
+    @property
+    def stdev(self) -> float: ...
+    def probability(self, value: int) -> float:
+        """Gets the chance of rolling exactly `value`."""
+    def probability_at_least(self, value: int) -> float:
+        """Gets the chance of rolling `value` or higher."""
+    def percentile(self, percent: float) -> int:
+        """Gets the lowest total that at least `percent` percent of rolls are at or below.
+
+        Args:
+            percent (float): The percentile, from 0 to 100.
+
+        Returns:
+            int: The total.
+        """
+    def sample(self, n: int, *, rng: random.Random | None = None) -> list[int]:
+        """Draws totals from the distribution.
+
+        Args:
+            n (int): How many totals to draw.
+            rng (typing.Optional[random.Random], optional): The random generator. Defaults to a shared one.
+
+        Returns:
+            typing.List[int]: The totals.
+        """
+
+def exact_distribution(expression: str | CompiledRoll) -> DiceDistribution | None:
+    """Computes the exact distribution of a dice expression made of dice, keep highest/lowest, and integers.
+
+    Args:
+        expression (typing.Union[str, CompiledRoll]): The dice expression.
+
+    Raises:
+        commands.BadArgument: If the expression is invalid.
+
+    Returns:
+        typing.Optional[DiceDistribution]: The distribution, or None if the expression is unsupported or too large.
+    """
+def roll_many(expression: str | CompiledRoll, n: int, *, rng: random.Random | None = None) -> list[int]:
+    """Rolls a dice expression many times.
+
+    At least `EXACT_SAMPLE_THRESHOLD` rolls are drawn from the exact distribution when there is
+    one. Fewer rolls, or expressions too large to compute exactly, are simulated from the dice,
+    and anything else is left to d20.
+
+    Args:
+        expression (typing.Union[str, CompiledRoll]): The dice expression.
+        n (int): How many times to roll.
+        rng (typing.Optional[random.Random], optional): The random generator. Defaults to a shared one. d20 rolls ignore it.
+
+    Raises:
+        commands.BadArgument: If the expression is invalid.
+
+    Returns:
+        typing.List[int]: The totals.
+    """
+def distribution(expression: str | CompiledRoll, *, samples: int = 100000, rng: random.Random | None = None) -> DiceDistribution:
+    """Gets the distribution of a dice expression, exactly if possible, otherwise from up to `samples` rolls.
+
+    Sampling rolls fewer times for larger expressions, so it never rolls more than about
+    `SAMPLE_WORK_LIMIT` dice in total.
+
+    Args:
+        expression (typing.Union[str, CompiledRoll]): The dice expression.
+        samples (int, optional): The most rolls to sample if it can't be computed exactly. Defaults to 100,000.
+        rng (typing.Optional[random.Random], optional): The random generator. Defaults to a shared one.
+
+    Raises:
+        commands.BadArgument: If the expression is invalid.
+
+    Returns:
+        DiceDistribution: The distribution. Check `exact` to see how it was made.
+    """
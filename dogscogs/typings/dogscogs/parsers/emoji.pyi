@@ -1,3 +1,29 @@
+import typing
+from ..constants import regex as regex
+
+class CustomEmoji(typing.NamedTuple):
+    animated: bool
+    name: str
+    id: int
+
+def iter_custom_emojis(content: str) -> typing.Iterator[CustomEmoji]:
+    """Lazily parses custom emojis, static `<:name:id>` and animated `<a:name:id>`, from a string.
+
+    Args:
+        content (str): The string content to parse emojis from.
+
+    Yields:
+        CustomEmoji: Each emoji, in the order it appears.
+    """
+def parse_custom_emojis(content: str) -> list[CustomEmoji]:
+    """Parses custom emojis from a string.
+
+    Args:
+        content (str): The string content to parse emojis from.
+
+    Returns:
+        typing.List[CustomEmoji]: A list of emojis.
+    """
 def parse_emoji_ids(content: str) -> list[int]:
     """Parses emoji ID's from a string.
 
@@ -5,5 +31,15 @@ def parse_emoji_ids(content: str) -> list[int]:
         content (str): The string content to parse emojis from.
 
     Returns:
-        typing.List[str]: A list of emojis.
+        typing.List[int]: A list of emoji ids.
+    """
+def count_emoji_ids(contents: typing.Iterable[str], counter: typing.Counter[int] | None = None) -> typing.Counter[int]:
+    """Counts how often each custom emoji is used across many strings.
+
+    Args:
+        contents (typing.Iterable[str]): The strings to scan, e.g. message contents.
+        counter (typing.Optional[typing.Counter[int]], optional): A counter to add to. Defaults to a new one.
+
+    Returns:
+        typing.Counter[int]: The number of uses by emoji id.
     """
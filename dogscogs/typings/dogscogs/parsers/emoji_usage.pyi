@@ -0,0 +1,59 @@
+import discord
+import typing
+from ..constants import regex as regex
+from _typeshed import Incomplete
+
+class EmojiUsage(typing.NamedTuple):
+    custom: dict[int, int]
+    unicode: dict[str, int]
+    messages: int
+    checkpoint: int | None
+EmojiUsageSink = typing.Callable[[EmojiUsage], typing.Awaitable[None]]
+
+class EmojiUsageAggregator:
+    """Counts custom and unicode emoji usage over a stream of messages, flushing counts to a sink.
+
+    Each flush hands the sink the counts since the previous flush, along with the newest message
+    id counted so far. Storing that id and passing it back as `checkpoint` resumes a scan without
+    counting any message twice. Messages may arrive in any order, but an interrupted scan only
+    resumes without gaps if they arrived oldest first.
+    """
+    sink: Incomplete
+    start: Incomplete
+    checkpoint: Incomplete
+    flush_every: Incomplete
+    custom: typing.Counter[int]
+    unicode: typing.Counter[str]
+    pending: int
+    total: int
+    def __init__(self, sink: EmojiUsageSink, *, checkpoint: int | None = None, flush_every: int = 1000) -> None: ...
+    def add(self, message: discord.Message) -> bool:
+        """Counts the emojis in a message's content.
+
+        Args:
+            message (discord.Message): The message to count.
+
+        Returns:
+            bool: Whether the message was counted, rather than skipped for being at or before the starting checkpoint.
+        """
+    async def flush(self) -> None:
+        """Sends the counts since the last flush to the sink, then resets them."""
+    async def consume(self, messages: typing.AsyncIterator[discord.Message]) -> int:
+        """Counts every message from an async iterator, flushing every `flush_every` messages and at the end.
+
+        Args:
+            messages (typing.AsyncIterator[discord.Message]): The messages, oldest first, e.g. `channel.history(oldest_first=True)`.
+
+        Returns:
+            int: The number of messages counted.
+        """
+    async def scan(self, channel: discord.abc.Messageable, *, limit: int | None = None) -> int:
+        """Counts a channel's history, starting after the checkpoint.
+
+        Args:
+            channel (discord.abc.Messageable): The channel to scan.
+            limit (typing.Optional[int], optional): The most messages to read. Defaults to all of them.
+
+        Returns:
+            int: The number of messages counted.
+        """
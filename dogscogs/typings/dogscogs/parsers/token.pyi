@@ -1,5 +1,6 @@
 import discord
 import typing
+from ..core.cache import TTLCache as TTLCache
 from _typeshed import Incomplete
 from datetime import datetime as datetime, timedelta as timedelta
 from enum import StrEnum
@@ -22,4 +23,58 @@ class MessageOptions(typing.TypedDict, total=False):
     embed: discord.Embed | None
     reactions: list[discord.Emoji | str] | None
 
+class EmojiSegment(typing.NamedTuple):
+    name: str
+TemplateSegment = str | Token | EmojiSegment
+
+class CompiledTemplate(typing.NamedTuple):
+    segments: tuple[TemplateSegment, ...]
+    reactions: tuple[str, ...]
+    weights: tuple[str, ...]
+
+def compile_template(text: str) -> CompiledTemplate:
+    """Parses a template string once into literal, token, and emoji segments.
+
+    Args:
+        text (str): The template string.
+
+    Returns:
+        CompiledTemplate: The parsed segments, along with any react(...) and weight(...) params.
+    """
+def get_emoji_map(guild: discord.Guild) -> dict[str, discord.Emoji]:
+    """Gets a cached name to emoji lookup for a guild.
+
+    Args:
+        guild (discord.Guild): The guild to look up emojis for.
+
+    Returns:
+        typing.Dict[str, discord.Emoji]: The first emoji for each name, matching `discord.utils.get`.
+    """
+def invalidate_emoji_map(guild: discord.Guild) -> None:
+    """Drops the cached emoji lookup for a guild. Call this from `on_guild_emojis_update` and `on_guild_remove`.
+
+    Args:
+        guild (discord.Guild): The guild whose emojis changed.
+    """
+def render_template(template: CompiledTemplate, *, member: discord.Member | None = None, guild: discord.Guild | None = None, action: ActionType | None = None, instigator: discord.Member | None = None, context: str | None = None, use_mentions: bool | None = False) -> str:
+    """Renders a compiled template in a single pass. Unresolved tokens are left as-is.
+
+    Args:
+        template (CompiledTemplate): The template from `compile_template`.
+
+    Returns:
+        str: The rendered text.
+    """
+def render_many(template: str | CompiledTemplate, *, members: typing.Iterable[discord.Member], guild: discord.Guild | None = None, action: ActionType | None = None, instigator: discord.Member | None = None, context: str | None = None, use_mentions: bool | None = False) -> typing.Iterator[MessageOptions]:
+    """Renders one template for many members, resolving everything but the member once.
+
+    Each result's content is identical to calling `replace_tokens` for that member.
+
+    Args:
+        template (typing.Union[str, CompiledTemplate]): The template string or compiled template.
+        members (typing.Iterable[discord.Member]): The members to render for, in order.
+
+    Yields:
+        MessageOptions: The rendered message for each member.
+    """
 def replace_tokens(text: str, *, member: discord.Member | None = None, guild: discord.Guild | None = None, action: ActionType | None = None, instigator: discord.Member | None = None, context: str | None = None, use_mentions: bool | None = False): ...
@@ -1,4 +1,5 @@
 import discord
+from ..constants import regex as regex
 
 def convert_color_name(input: str) -> discord.Color: ...
 def convert_hex_code(input: str) -> discord.Color: ...
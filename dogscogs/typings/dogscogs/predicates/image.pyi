@@ -0,0 +1,102 @@
+import aiohttp
+import typing
+from ..constants.discord import emoji as emoji
+from ..core.cache import TTLCache as TTLCache
+from ..core.http import USER_AGENT as USER_AGENT, get_session as get_session
+from _typeshed import Incomplete
+
+REFUSED_HEAD_STATUSES: Incomplete
+TRANSIENT_STATUSES: Incomplete
+content_type_cache: TTLCache[str, str | None]
+
+def is_definitive_status(status: int) -> bool:
+    """Checks whether a response status is a lasting answer worth caching, rather than a server or rate limit failure.
+
+    Args:
+        status (int): The HTTP status code.
+
+    Returns:
+        bool: Whether the status is a success or a client error other than a timeout or rate limit.
+    """
+def image_content_types(extensions: typing.Iterable[str]) -> set[str]:
+    """Gets the image MIME types allowed for a list of file extensions.
+
+    Args:
+        extensions (typing.Iterable[str]): File extensions, e.g. `png` or `jpg`.
+
+    Returns:
+        typing.Set[str]: The matching `image/*` content types.
+    """
+async def fetch_content_type(url: str, *, session: aiohttp.ClientSession | None = None, timeout: float = 10) -> str | None:
+    """Gets the content type a URL serves, without downloading its body.
+
+    Sends a HEAD request following redirects, and falls back to a one-byte range GET for servers that refuse HEAD.
+    Results are cached by URL, except for timeouts, connection errors, and 5xx or rate limited responses.
+
+    Args:
+        url (str): The URL to check.
+        session (typing.Optional[aiohttp.ClientSession], optional): The session to use. Defaults to the shared session.
+        timeout (float, optional): Seconds to wait for each request. Defaults to 10.
+
+    Returns:
+        typing.Optional[str]: The lowercase content type without parameters, or None if the URL couldn't be reached.
+    """
+async def validate_image_url(url: str, valid_extensions: typing.Iterable[str] = ('png', 'jpg', 'jpeg', 'gif'), *, session: aiohttp.ClientSession | None = None) -> bool:
+    """Checks that a URL serves an image of one of the given types.
+
+    Args:
+        url (str): The URL to check.
+        valid_extensions (typing.Iterable[str], optional): The allowed image extensions. Defaults to png, jpg, jpeg, and gif.
+        session (typing.Optional[aiohttp.ClientSession], optional): The session to use. Defaults to the shared session.
+
+    Returns:
+        bool: Whether the URL serves an allowed image type.
+    """
+
+class ImageProbe(typing.NamedTuple):
+    format: str | None
+    width: int | None
+    height: int | None
+    size: int | None
+    content_type: str | None
+
+IMAGE_SIGNATURES: list[tuple[str, typing.Callable[[bytes], bool], typing.Callable[[bytes], tuple[int, int] | None]]]
+
+def sniff_image(data: bytes) -> tuple[str | None, tuple[int, int] | None]:
+    """Identifies an image's format and dimensions from the first bytes of the file.
+
+    Args:
+        data (bytes): The start of the file.
+
+    Returns:
+        typing.Tuple[typing.Optional[str], typing.Optional[typing.Tuple[int, int]]]: The format (png, gif, jpeg or webp) and the (width, height), if found.
+    """
+
+image_probe_cache: TTLCache[str, ImageProbe | None]
+
+async def probe_image(url: str, *, session: aiohttp.ClientSession | None = None, read_limit: int = ..., timeout: float = 10) -> ImageProbe | None:
+    """Gets an image's real format, dimensions, and file size while downloading as little as possible.
+
+    Only the first few KB are requested, and reading stops as soon as the header is parsed or the
+    bytes turn out not to be an image. Results are cached by URL, except for timeouts, connection
+    errors, and 5xx or rate limited responses.
+
+    Args:
+        url (str): The URL of the image.
+        session (typing.Optional[aiohttp.ClientSession], optional): The session to use. Defaults to the shared session.
+        read_limit (int, optional): The most bytes to read looking for the header. Defaults to 64 KB.
+        timeout (float, optional): Seconds to wait for the request. Defaults to 10.
+
+    Returns:
+        typing.Optional[ImageProbe]: The probe result, or None if the URL couldn't be reached.
+    """
+async def validate_emoji_image(url: str, *, session: aiohttp.ClientSession | None = None) -> bool:
+    """Checks that a URL is an image Discord will accept as an emoji, without downloading it.
+
+    Args:
+        url (str): The URL of the image.
+        session (typing.Optional[aiohttp.ClientSession], optional): The session to use. Defaults to the shared session.
+
+    Returns:
+        bool: Whether the image is a known format with a known size within `emoji.MAX_FILE_SIZE`.
+    """
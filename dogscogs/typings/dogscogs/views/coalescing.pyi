@@ -0,0 +1,61 @@
+import asyncio
+import discord
+import typing
+from _typeshed import Incomplete
+
+EditRender = typing.Callable[[], typing.Awaitable[dict[str, typing.Any]]]
+EDIT_RATE_LIMIT: int
+EDIT_RATE_PERIOD: float
+log: Incomplete
+
+class PendingEdit:
+    """The newest requested state for a message, and the task that will send it."""
+    render: EditRender | None
+    task: asyncio.Task | None
+    sent: typing.Deque[float]
+    def __init__(self) -> None: ...
+
+class CoalescingEditMixin:
+    """Coalesces message edits so only the newest state is sent, within Discord's per-message rate limit.
+
+    Mix in before `discord.ui.View`. Edits queued while another is waiting replace it instead of
+    adding another request.
+    """
+    edit_delay: float
+    pending_edits: dict[int, PendingEdit]
+    edits_requested: int
+    edits_sent: int
+    edits_failed: int
+    def __init__(self, *args, **kwargs) -> None: ...
+    def queue_edit(self, message: discord.Message, render: EditRender | None = None, **kwargs):
+        """Queues an edit, replacing any edit still waiting for the same message.
+
+        Args:
+            message (discord.Message): The message to edit.
+            render (typing.Optional[EditRender], optional): Builds the edit arguments when the edit is sent, so it reflects the newest state. Defaults to sending `kwargs`.
+        """
+    async def defer_and_edit(self, interaction: discord.Interaction, message: discord.Message, render: EditRender | None = None, **kwargs):
+        """Acknowledges an interaction right away, then queues an edit for its message.
+
+        Args:
+            interaction (discord.Interaction): The interaction to defer.
+            message (discord.Message): The message to edit.
+            render (typing.Optional[EditRender], optional): Builds the edit arguments when the edit is sent. Defaults to sending `kwargs`.
+        """
+    async def on_edit_error(self, message: discord.Message, error: Exception):
+        """Called when building or sending a queued edit fails. Later edits are still sent.
+
+        The default implementation logs the error.
+
+        Args:
+            message (discord.Message): The message that was being edited.
+            error (Exception): The error raised.
+        """
+    def cancel_edits(self) -> None:
+        """Drops every queued edit that hasn't been sent yet."""
+    def edit_stats(self) -> dict[str, int]:
+        """Gets how many edits were requested, sent, failed, and coalesced away.
+
+        Returns:
+            typing.Dict[str, int]: The counters by name.
+        """
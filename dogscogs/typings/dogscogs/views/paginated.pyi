@@ -1,13 +1,50 @@
+import asyncio
 import discord
 import typing
+from ..constants.discord.views import MAX_SELECT_OPTIONS as MAX_SELECT_OPTIONS
+from ..core.cache import TTLCache as TTLCache
+from .coalescing import CoalescingEditMixin as CoalescingEditMixin
+from .prompts import NumberPromptModal as NumberPromptModal
 from _typeshed import Incomplete
 
+Page: Incomplete
+T = typing.TypeVar('T')
+PageFormatter: Incomplete
+
 class OnCallbackSelect(discord.ui.Select):
     on_callback: typing.Callable[[list[str]], typing.Awaitable[None]]
     def __init__(self, *args, callback: typing.Callable[[list[str]], typing.Awaitable[None]], **kwargs) -> None: ...
     async def callback(self, interaction: discord.Interaction) -> None: ...
 
-class PaginatedEmbed(discord.ui.View):
+class AsyncIteratorPageSource(typing.Generic[T]):
+    """Pages over an async iterator, consuming it only as far as the furthest page requested."""
+    iterator: Incomplete
+    results_per_page: Incomplete
+    format_page: Incomplete
+    items: list[T]
+    exhausted: bool
+    lock: Incomplete
+    def __init__(self, items: typing.AsyncIterator[T], *, results_per_page: int, format_page: PageFormatter[T]) -> None: ...
+    @property
+    def total_pages(self) -> int | None:
+        """The number of pages, or None until the iterator is exhausted."""
+    async def fill(self, count: int):
+        """Consumes the iterator until at least `count` items are loaded, or it runs out.
+
+        Args:
+            count (int): The number of items needed.
+        """
+    async def get_page(self, index: int) -> Page:
+        """Formats a page, loading one item past it to know whether another page follows.
+
+        Args:
+            index (int): The page index.
+
+        Returns:
+            Page: The page embed, and the total pages known so far.
+        """
+
+class PaginatedEmbed(CoalescingEditMixin, discord.ui.View):
     message: discord.Message
     original_message: discord.Message | None
     interaction: discord.Interaction | None
@@ -15,15 +52,86 @@ class PaginatedEmbed(discord.ui.View):
     get_page: typing.Callable[[int], typing.Awaitable[tuple[discord.Embed, int]]]
     total_pages: int
     index: int
-    def __init__(self, *args, message: discord.Message | None = None, interaction: discord.Interaction | None = None, get_page: typing.Callable[[int], typing.Awaitable[tuple[discord.Embed, int]]], **kwargs) -> None: ...
+    page_cache: TTLCache[int, Page] | None
+    prefetch: Incomplete
+    pending_pages: dict[int, asyncio.Task]
+    page_source: AsyncIteratorPageSource | None
+    navigation_threshold: Incomplete
+    edit_delay: Incomplete
+    page_select: Incomplete
+    def __init__(self, *args, message: discord.Message | None = None, interaction: discord.Interaction | None = None, get_page: typing.Callable[[int], typing.Awaitable[tuple[discord.Embed, int]]], cache_size: int = 0, prefetch: bool = True, navigation_threshold: int = 10, debounce: float = 0.3, **kwargs) -> None: ...
+    @classmethod
+    def from_async_iterator(cls, items: typing.AsyncIterator[T], *, results_per_page: int, format_page: PageFormatter[T], message: discord.Message | None = None, interaction: discord.Interaction | None = None, **kwargs) -> PaginatedEmbed:
+        """Creates a pagination over an async iterator, such as an audit log or message history.
+
+        Items are only pulled as far as the furthest page viewed, and the total shows as `?`
+        until the iterator runs out.
+
+        Args:
+            items (typing.AsyncIterator[T]): The items to page through.
+            results_per_page (int): The number of items on each page.
+            format_page (PageFormatter[T]): Builds the embed from a page's items, its index, and the total pages if known.
+
+        Returns:
+            PaginatedEmbed: The view, ready to `send`.
+        """
+    @property
+    def total_known(self) -> bool:
+        """Whether `total_pages` is final, rather than just the pages loaded so far."""
     async def interaction_check(self, interaction: discord.Interaction) -> bool: ...
+    async def load_page(self, index: int) -> Page:
+        """Gets a page, using the page cache when enabled.
+
+        Args:
+            index (int): The page index.
+
+        Returns:
+            Page: The page embed and the total number of pages.
+        """
+    def prefetch_neighbors(self):
+        """Loads the pages before and after the current one in the background, once every page is known.
+
+        Prefetching from an unfinished async iterator would pull items past the furthest page viewed.
+        """
+    def invalidate(self, index: int | None = None):
+        """Drops cached pages so they are loaded again, e.g. after the underlying data changes.
+
+        Args:
+            index (typing.Optional[int], optional): The page to drop. Defaults to every page.
+        """
+    async def load_current_page(self) -> discord.Embed:
+        """Loads the current page and sets `total_pages`, preferring the page source's final total.
+
+        Returns:
+            discord.Embed: The page embed.
+        """
     async def send(self) -> None: ...
+    async def render_page(self) -> dict[str, typing.Any]:
+        """Loads the current page and updates the controls for it.
+
+        Returns:
+            typing.Dict[str, typing.Any]: The arguments to edit the message with.
+        """
     async def edit_page(self) -> None: ...
+    def go_to(self, index: int):
+        """Moves to a page, rendering only the latest requested page once clicks settle.
+
+        Args:
+            index (int): The page index.
+        """
+    def page_window(self) -> range:
+        """Gets the block of pages, at most `MAX_SELECT_OPTIONS` long, that the current page falls in.
+
+        Returns:
+            range: The page indices to offer in the page select.
+        """
+    async def select_page(self, values: list[str]): ...
     def update_buttons(self) -> None: ...
     async def first(self, interaction: discord.Interaction, button: discord.ui.Button): ...
     async def previous(self, interaction: discord.Interaction, button: discord.ui.Button): ...
     async def next(self, interaction: discord.Interaction, button: discord.ui.Button): ...
     async def last(self, interaction: discord.Interaction, button: discord.ui.Button): ...
+    async def jump(self, interaction: discord.Interaction, button: discord.ui.Button): ...
     async def on_timeout(self) -> None: ...
     @staticmethod
     def compute_total_pages(total_results: int, results_per_page: int) -> int: ...
@@ -0,0 +1,74 @@
+import discord
+import typing
+from _typeshed import Incomplete
+from redbot.core.bot import Red as Red
+
+PersistentGetPage: Incomplete
+MAX_CUSTOM_ID_LENGTH: int
+PAGE_ACTIONS: Incomplete
+log: Incomplete
+
+class PersistentPageState(typing.NamedTuple):
+    name: str
+    action: str
+    page: int
+    author_id: int
+    data_key: str
+
+class PersistentPaginationRegistry:
+    """Paginations whose state lives entirely in their buttons' custom ids.
+
+    Each button encodes the page it leads to, the data key, and the author allowed to use it, so
+    no view object is kept per message and buttons keep working across restarts. A single
+    `on_interaction` listener renders whichever page was asked for.
+    """
+    prefix: Incomplete
+    sources: dict[str, PersistentGetPage]
+    def __init__(self, prefix: str = 'dogscogs') -> None: ...
+    def register(self, name: str, get_page: PersistentGetPage):
+        """Registers a page source under a name.
+
+        Args:
+            name (str): The name to store in custom ids. Must not contain `:`.
+            get_page (PersistentGetPage): Gets the embed and total pages for a data key and page index.
+        """
+    def attach(self, bot: Red):
+        """Starts routing button presses to this registry. Call this in `cog_load`."""
+    def detach(self, bot: Red):
+        """Stops routing button presses to this registry. Call this in `cog_unload`."""
+    def encode(self, state: PersistentPageState) -> str: ...
+    def decode(self, custom_id: str) -> PersistentPageState | None: ...
+    def build_view(self, name: str, data_key: str, index: int, total_pages: int, author_id: int = 0) -> discord.ui.View | None:
+        """Builds the navigation buttons for a page, or None if there is only one page.
+
+        The view is stopped before it is returned so discord.py never stores it.
+
+        Args:
+            name (str): The registered page source.
+            data_key (str): The key passed to the page source.
+            index (int): The current page index.
+            total_pages (int): The number of pages.
+            author_id (int, optional): The only user allowed to navigate. Defaults to anyone.
+
+        Returns:
+            typing.Optional[discord.ui.View]: The buttons to send with the page.
+        """
+    async def render(self, name: str, data_key: str, index: int = 0, author_id: int = 0) -> tuple[discord.Embed, discord.ui.View | None]:
+        """Gets a page and its navigation buttons.
+
+        Returns:
+            typing.Tuple[discord.Embed, typing.Optional[discord.ui.View]]: The arguments to send or edit the message with.
+        """
+    async def send(self, destination: discord.abc.Messageable, name: str, data_key: str, *, author: discord.abc.User | None = None) -> discord.Message:
+        """Sends the first page of a persistent pagination.
+
+        Args:
+            destination (discord.abc.Messageable): Where to send it.
+            name (str): The registered page source.
+            data_key (str): The key passed to the page source.
+            author (typing.Optional[discord.abc.User], optional): The only user allowed to navigate. Defaults to anyone.
+
+        Returns:
+            discord.Message: The sent message.
+        """
+    async def dispatch(self, interaction: discord.Interaction): ...
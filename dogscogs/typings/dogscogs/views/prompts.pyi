@@ -1,5 +1,7 @@
+import aiohttp
 import discord
 from ..converters.percent import Percent as Percent
+from ..predicates.image import validate_image_url as validate_image_url
 from _typeshed import Incomplete
 
 class ValidRoleTextInput(discord.ui.TextInput):
@@ -8,7 +10,8 @@ class ValidRoleTextInput(discord.ui.TextInput):
 
 class ValidImageURLTextInput(discord.ui.TextInput):
     valid_extensions: Incomplete
-    def __init__(self, *args, valid_extensions: list[str] = ['png', 'jpg', 'jpeg', 'gif'], **kwargs) -> None: ...
+    session: Incomplete
+    def __init__(self, *args, valid_extensions: list[str] = ['png', 'jpg', 'jpeg', 'gif'], session: aiohttp.ClientSession | None = None, **kwargs) -> None: ...
     async def interaction_check(self, interaction: discord.Interaction) -> bool: ...
 
 class NumberPromptTextInput(discord.ui.TextInput):
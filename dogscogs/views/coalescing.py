@@ -0,0 +1,153 @@
+import asyncio
+from collections import deque
+import logging
+import time
+import typing
+import discord
+
+EditRender = typing.Callable[[], typing.Awaitable[typing.Dict[str, typing.Any]]]
+
+# Discord allows 5 edits per 5 seconds on a single message.
+EDIT_RATE_LIMIT = 5
+EDIT_RATE_PERIOD = 5.0
+
+log = logging.getLogger("red.dogscogs.views.coalescing")
+
+
+class PendingEdit:
+    """The newest requested state for a message, and the task that will send it."""
+
+    def __init__(self):
+        self.render: typing.Optional[EditRender] = None
+        self.task: typing.Optional[asyncio.Task] = None
+        self.sent: typing.Deque[float] = deque(maxlen=EDIT_RATE_LIMIT)
+
+
+class CoalescingEditMixin:
+    """Coalesces message edits so only the newest state is sent, within Discord's per-message rate limit.
+
+    Mix in before `discord.ui.View`. Edits queued while another is waiting replace it instead of
+    adding another request.
+    """
+
+    edit_delay: float = 0.3
+
+    def __init__(self, *args, **kwargs):
+        self.pending_edits: typing.Dict[int, PendingEdit] = {}
+        self.edits_requested = 0
+        self.edits_sent = 0
+        self.edits_failed = 0
+        super().__init__(*args, **kwargs)
+
+    def queue_edit(
+        self,
+        message: discord.Message,
+        render: typing.Optional[EditRender] = None,
+        **kwargs,
+    ):
+        """Queues an edit, replacing any edit still waiting for the same message.
+
+        Args:
+            message (discord.Message): The message to edit.
+            render (typing.Optional[EditRender], optional): Builds the edit arguments when the edit is sent, so it reflects the newest state. Defaults to sending `kwargs`.
+        """
+        pending = self.pending_edits.get(message.id)
+        if pending is None:
+            pending = self.pending_edits[message.id] = PendingEdit()
+
+        if render is None:
+            async def render() -> typing.Dict[str, typing.Any]:
+                return kwargs
+
+        pending.render = render
+        self.edits_requested += 1
+
+        if pending.task is None or pending.task.done():
+            pending.task = asyncio.create_task(self._flush_edits(message, pending))
+
+    async def defer_and_edit(
+        self,
+        interaction: discord.Interaction,
+        message: discord.Message,
+        render: typing.Optional[EditRender] = None,
+        **kwargs,
+    ):
+        """Acknowledges an interaction right away, then queues an edit for its message.
+
+        Args:
+            interaction (discord.Interaction): The interaction to defer.
+            message (discord.Message): The message to edit.
+            render (typing.Optional[EditRender], optional): Builds the edit arguments when the edit is sent. Defaults to sending `kwargs`.
+        """
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+        self.queue_edit(message, render, **kwargs)
+
+    async def _flush_edits(self, message: discord.Message, pending: PendingEdit):
+        try:
+            while pending.render is not None:
+                delay = self.edit_delay
+                if len(pending.sent) == EDIT_RATE_LIMIT:
+                    delay = max(delay, pending.sent[0] + EDIT_RATE_PERIOD - time.monotonic())
+                await asyncio.sleep(delay)
+
+                render, pending.render = pending.render, None
+                if render is None:
+                    break
+
+                try:
+                    await message.edit(**await render())
+                except Exception as error:
+                    self.edits_failed += 1
+                    await self.on_edit_error(message, error)
+                    continue
+                pending.sent.append(time.monotonic())
+                self.edits_sent += 1
+        finally:
+            self._release_edit(message.id, pending)
+
+    def _release_edit(self, message_id: int, pending: PendingEdit):
+        # Idle entries are dropped so long-lived views don't keep one per message edited, but only
+        # once their sends have left the rate window, so a new burst still waits for it.
+        remaining = pending.sent[-1] + EDIT_RATE_PERIOD - time.monotonic() if pending.sent else 0.0
+        asyncio.get_running_loop().call_later(max(remaining, 0.0), self._drop_idle_edit, message_id, pending)
+
+    def _drop_idle_edit(self, message_id: int, pending: PendingEdit):
+        if self.pending_edits.get(message_id) is not pending or pending.render is not None:
+            return
+        if pending.task is not None and not pending.task.done():
+            return
+        del self.pending_edits[message_id]
+
+    async def on_edit_error(self, message: discord.Message, error: Exception):
+        """Called when building or sending a queued edit fails. Later edits are still sent.
+
+        The default implementation logs the error.
+
+        Args:
+            message (discord.Message): The message that was being edited.
+            error (Exception): The error raised.
+        """
+        log.error("Failed to edit message %s from %r", message.id, self, exc_info=error)
+
+    def cancel_edits(self):
+        """Drops every queued edit that hasn't been sent yet."""
+        for pending in self.pending_edits.values():
+            pending.render = None
+            if pending.task is not None:
+                pending.task.cancel()
+        self.pending_edits.clear()
+
+    def edit_stats(self) -> typing.Dict[str, int]:
+        """Gets how many edits were requested, sent, failed, and coalesced away.
+
+        Returns:
+            typing.Dict[str, int]: The counters by name.
+        """
+        waiting = sum(1 for pending in self.pending_edits.values() if pending.render is not None)
+        return {
+            "requested": self.edits_requested,
+            "sent": self.edits_sent,
+            "failed": self.edits_failed,
+            "coalesced": self.edits_requested - self.edits_sent - self.edits_failed - waiting,
+        }
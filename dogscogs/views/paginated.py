@@ -1,6 +1,20 @@
+import asyncio
+import inspect
 import typing
 import discord
 
+from ..constants.discord.views import MAX_SELECT_OPTIONS
+from ..core.cache import TTLCache
+from .coalescing import CoalescingEditMixin
+from .prompts import NumberPromptModal
+
+Page = typing.Tuple[discord.Embed, int]
+T = typing.TypeVar("T")
+PageFormatter = typing.Callable[
+    [typing.List[T], int, typing.Optional[int]],
+    typing.Union[discord.Embed, typing.Awaitable[discord.Embed]],
+]
+
 class OnCallbackSelect(discord.ui.Select):
     on_callback: typing.Callable[[typing.List[str]], typing.Awaitable[None]]
 
@@ -20,7 +34,67 @@ class OnCallbackSelect(discord.ui.Select):
         await self.on_callback(self.values)
         await interaction.response.defer()
 
-class PaginatedEmbed(discord.ui.View):
+class AsyncIteratorPageSource(typing.Generic[T]):
+    """Pages over an async iterator, consuming it only as far as the furthest page requested."""
+
+    def __init__(
+        self,
+        items: typing.AsyncIterator[T],
+        *,
+        results_per_page: int,
+        format_page: PageFormatter[T],
+    ):
+        self.iterator = items.__aiter__()
+        self.results_per_page = results_per_page
+        self.format_page = format_page
+        self.items : typing.List[T] = []
+        self.exhausted = False
+        self.lock = asyncio.Lock()
+
+    @property
+    def total_pages(self) -> typing.Optional[int]:
+        """The number of pages, or None until the iterator is exhausted."""
+        if not self.exhausted:
+            return None
+        return PaginatedEmbed.compute_total_pages(len(self.items), self.results_per_page)
+
+    async def fill(self, count: int):
+        """Consumes the iterator until at least `count` items are loaded, or it runs out.
+
+        Args:
+            count (int): The number of items needed.
+        """
+        async with self.lock:
+            while not self.exhausted and len(self.items) < count:
+                try:
+                    self.items.append(await self.iterator.__anext__())
+                except StopAsyncIteration:
+                    self.exhausted = True
+
+    async def get_page(self, index: int) -> Page:
+        """Formats a page, loading one item past it to know whether another page follows.
+
+        Args:
+            index (int): The page index.
+
+        Returns:
+            Page: The page embed, and the total pages known so far.
+        """
+        start = index * self.results_per_page
+        await self.fill(start + self.results_per_page + 1)
+
+        total = self.total_pages
+        embed = self.format_page(self.items[start:start + self.results_per_page], index, total)
+        if inspect.isawaitable(embed):
+            embed = await embed
+
+        if embed.footer.text is None:
+            embed.set_footer(text=f"Page {index + 1} of {total if total is not None else '?'}")
+
+        known_pages = PaginatedEmbed.compute_total_pages(len(self.items), self.results_per_page)
+        return embed, known_pages
+
+class PaginatedEmbed(CoalescingEditMixin, discord.ui.View):
     message : discord.Message
 
     def __init__(
@@ -29,6 +103,10 @@ class PaginatedEmbed(discord.ui.View):
             message : typing.Optional[discord.Message] = None,
             interaction : typing.Optional[discord.Interaction] = None,
             get_page: typing.Callable[[int], typing.Awaitable[typing.Tuple[discord.Embed, int]]],
+            cache_size: int = 0,
+            prefetch: bool = True,
+            navigation_threshold: int = 10,
+            debounce: float = 0.3,
             **kwargs
     ):
         self.original_message : typing.Optional[discord.Message] = message
@@ -45,8 +123,52 @@ class PaginatedEmbed(discord.ui.View):
         self.get_page : typing.Callable[[int], typing.Awaitable[typing.Tuple[discord.Embed, int]]] = get_page
         self.total_pages : int = 0
         self.index = 0
+
+        self.page_cache : typing.Optional[TTLCache[int, Page]] = TTLCache(maxsize=cache_size) if cache_size > 0 else None
+        self.prefetch = prefetch
+        self.pending_pages : typing.Dict[int, asyncio.Task] = {}
+        self.page_source : typing.Optional[AsyncIteratorPageSource] = None
+
+        self.navigation_threshold = navigation_threshold
+        self.edit_delay = debounce
         super().__init__(*args, **kwargs)
 
+        self.page_select = OnCallbackSelect(callback=self.select_page, row=1, placeholder="Select a page")
+
+    @classmethod
+    def from_async_iterator(
+        cls,
+        items: typing.AsyncIterator[T],
+        *,
+        results_per_page: int,
+        format_page: PageFormatter[T],
+        message : typing.Optional[discord.Message] = None,
+        interaction : typing.Optional[discord.Interaction] = None,
+        **kwargs,
+    ) -> "PaginatedEmbed":
+        """Creates a pagination over an async iterator, such as an audit log or message history.
+
+        Items are only pulled as far as the furthest page viewed, and the total shows as `?`
+        until the iterator runs out.
+
+        Args:
+            items (typing.AsyncIterator[T]): The items to page through.
+            results_per_page (int): The number of items on each page.
+            format_page (PageFormatter[T]): Builds the embed from a page's items, its index, and the total pages if known.
+
+        Returns:
+            PaginatedEmbed: The view, ready to `send`.
+        """
+        source = AsyncIteratorPageSource(items, results_per_page=results_per_page, format_page=format_page)
+        view = cls(message=message, interaction=interaction, get_page=source.get_page, **kwargs)
+        view.page_source = source
+        return view
+
+    @property
+    def total_known(self) -> bool:
+        """Whether `total_pages` is final, rather than just the pages loaded so far."""
+        return self.page_source is None or self.page_source.exhausted
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user == self.author:
             return True
@@ -54,65 +176,219 @@ class PaginatedEmbed(discord.ui.View):
             await interaction.response.send_message("You are not allowed to interact with this view.", ephemeral=True, delete_after=10)
             return False
         
+    async def load_page(self, index: int) -> Page:
+        """Gets a page, using the page cache when enabled.
+
+        Args:
+            index (int): The page index.
+
+        Returns:
+            Page: The page embed and the total number of pages.
+        """
+        if self.page_cache is None:
+            return await self.get_page(index)
+
+        page = self.page_cache.get(index)
+        if page is not None:
+            return page
+
+        pending = self.pending_pages.get(index)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # Only fall through when the prefetch itself was cancelled, e.g. by `invalidate`.
+                if not pending.cancelled():
+                    raise
+            except Exception:
+                pass
+
+        page = await self.get_page(index)
+        self._cache_page(index, page)
+        return page
+
+    def _cache_page(self, index: int, page: Page):
+        # Pages from an unfinished async iterator carry a provisional total and footer.
+        if self.page_cache is not None and self.total_known:
+            self.page_cache.set(index, page)
+
+    async def _prefetch_page(self, index: int) -> Page:
+        page = await self.get_page(index)
+        self._cache_page(index, page)
+        return page
+
+    def prefetch_neighbors(self):
+        """Loads the pages before and after the current one in the background, once every page is known.
+
+        Prefetching from an unfinished async iterator would pull items past the furthest page viewed.
+        """
+        if self.page_cache is None or not self.prefetch or not self.total_known or self.total_pages <= 1:
+            return
+
+        for index in ((self.index - 1) % self.total_pages, (self.index + 1) % self.total_pages):
+            if index in self.pending_pages or index in self.page_cache.entries:
+                continue
+            task = asyncio.create_task(self._prefetch_page(index))
+            self.pending_pages[index] = task
+            task.add_done_callback(lambda t, index=index: self._prefetch_done(index, t))
+
+    def _prefetch_done(self, index: int, task: asyncio.Task):
+        if self.pending_pages.get(index) is task:
+            del self.pending_pages[index]
+        if not task.cancelled():
+            task.exception()
+
+    def invalidate(self, index: typing.Optional[int] = None):
+        """Drops cached pages so they are loaded again, e.g. after the underlying data changes.
+
+        Args:
+            index (typing.Optional[int], optional): The page to drop. Defaults to every page.
+        """
+        if index is None:
+            for task in self.pending_pages.values():
+                task.cancel()
+            self.pending_pages.clear()
+            if self.page_cache is not None:
+                self.page_cache.clear()
+        else:
+            pending = self.pending_pages.pop(index, None)
+            if pending is not None:
+                pending.cancel()
+            if self.page_cache is not None:
+                self.page_cache.pop(index)
+
+    async def load_current_page(self) -> discord.Embed:
+        """Loads the current page and sets `total_pages`, preferring the page source's final total.
+
+        Returns:
+            discord.Embed: The page embed.
+        """
+        embed, total_pages = await self.load_page(self.index)
+        if self.page_source is not None and self.page_source.total_pages is not None:
+            total_pages = self.page_source.total_pages
+        self.total_pages = total_pages
+        return embed
+
     async def send(self):
-        embed, self.total_pages = await self.get_page(self.index)
+        embed = await self.load_current_page()
         if self.total_pages > 1:
             self.update_buttons()
             if self.original_message is not None:
                 self.message = await self.original_message.reply(embed=embed, view=self)
             elif self.interaction is not None:
                 self.message = await self.interaction.response.send_message(embed=embed, view=self)
+            self.prefetch_neighbors()
         else:
             if self.original_message is not None:
                 self.message = await self.original_message.reply(embed=embed, view=None)
             elif self.interaction is not None:
                 self.message = await self.interaction.response.send_message(embed=embed)
 
-    async def edit_page(self):
-        embed, self.total_pages = await self.get_page(self.index)
+    async def render_page(self) -> typing.Dict[str, typing.Any]:
+        """Loads the current page and updates the controls for it.
+
+        Returns:
+            typing.Dict[str, typing.Any]: The arguments to edit the message with.
+        """
+        embed = await self.load_current_page()
         self.update_buttons()
-        await self.message.edit(embed=embed, view=self)
+        self.prefetch_neighbors()
+        return {"embed": embed, "view": self}
+
+    async def edit_page(self):
+        await self.message.edit(**await self.render_page())
+
+    def go_to(self, index: int):
+        """Moves to a page, rendering only the latest requested page once clicks settle.
+
+        Args:
+            index (int): The page index.
+        """
+        self.index = index
+        self.queue_edit(self.message, self.render_page)
+
+    def page_window(self) -> range:
+        """Gets the block of pages, at most `MAX_SELECT_OPTIONS` long, that the current page falls in.
+
+        Returns:
+            range: The page indices to offer in the page select.
+        """
+        window = self.index // MAX_SELECT_OPTIONS
+        windows = self.compute_total_pages(self.total_pages, MAX_SELECT_OPTIONS)
+        start = min(window, windows - 1) * MAX_SELECT_OPTIONS
+        return range(start, min(start + MAX_SELECT_OPTIONS, self.total_pages))
+
+    async def select_page(self, values: typing.List[str]):
+        self.go_to(int(values[0]))
 
     def update_buttons(self):
         self.children[0].disabled = self.index == 0
-        self.children[3].disabled = self.index == self.total_pages - 1
-        pass
+        self.children[3].disabled = self.index == self.total_pages - 1 or not self.total_known
+
+        if self.total_pages >= self.navigation_threshold:
+            total = self.total_pages if self.total_known else "?"
+            self.page_select.placeholder = f"Page {self.index + 1} of {total}"
+            self.page_select.options = [
+                discord.SelectOption(label=f"Page {i + 1}", value=str(i), default=i == self.index)
+                for i in self.page_window()
+            ]
+            if self.jump not in self.children:
+                self.add_item(self.jump)
+            if self.page_select not in self.children:
+                self.add_item(self.page_select)
+        else:
+            self.remove_item(self.jump)
+            self.remove_item(self.page_select)
 
     @discord.ui.button(emoji="⏪", style=discord.ButtonStyle.secondary)
     async def first(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.index > 0:
-            self.index = 0
-            await self.edit_page()
         await interaction.response.defer()
+        if self.index > 0:
+            self.go_to(0)
 
     @discord.ui.button(emoji="◀️", style=discord.ButtonStyle.blurple)
     async def previous(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.index > 0:
-            self.index -= 1
-            await self.edit_page()
-        elif self.index == 0:
-            self.index = self.total_pages - 1
-            await self.edit_page()
         await interaction.response.defer()
+        if self.index > 0:
+            self.go_to(self.index - 1)
+        elif self.index == 0 and self.total_known:
+            self.go_to(self.total_pages - 1)
 
     @discord.ui.button(emoji="▶️", style=discord.ButtonStyle.blurple)
     async def next(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.index < self.total_pages - 1:
-            self.index += 1
-            await self.edit_page()
-        elif self.index == self.total_pages - 1:
-            self.index = 0
-            await self.edit_page()
         await interaction.response.defer()
+        if self.index < self.total_pages - 1:
+            self.go_to(self.index + 1)
+        elif self.index == self.total_pages - 1 and self.total_known:
+            self.go_to(0)
 
     @discord.ui.button(emoji="⏩", style=discord.ButtonStyle.secondary)
     async def last(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if self.index < self.total_pages - 1:
-            self.index = self.total_pages - 1
-            await self.edit_page()
         await interaction.response.defer()
+        if self.index < self.total_pages - 1:
+            self.go_to(self.total_pages - 1)
+
+    @discord.ui.button(emoji="🔢", style=discord.ButtonStyle.secondary)
+    async def jump(self, interaction: discord.Interaction, button: discord.ui.Button):
+        modal = NumberPromptModal(
+            author=self.author,
+            title="Jump to page",
+            label=f"Page (1-{self.total_pages})",
+            placeholder=str(self.index + 1),
+            custom_id="page",
+            min=1,
+            max=self.total_pages,
+        )
+        await interaction.response.send_modal(modal)
+
+        if await modal.wait():
+            return
+
+        self.go_to(int(float(modal.item.value)) - 1)
 
     async def on_timeout(self):
+        self.invalidate()
+        self.cancel_edits()
         await self.message.edit(view=None)
 
     @staticmethod
@@ -0,0 +1,182 @@
+import logging
+import typing
+import discord
+from redbot.core.bot import Red
+
+PersistentGetPage = typing.Callable[[str, int], typing.Awaitable[typing.Tuple[discord.Embed, int]]]
+
+MAX_CUSTOM_ID_LENGTH = 100
+PAGE_ACTIONS = ("first", "previous", "next", "last")
+
+log = logging.getLogger("red.dogscogs.views.persistent")
+
+
+class PersistentPageState(typing.NamedTuple):
+    name: str
+    action: str
+    page: int
+    author_id: int
+    data_key: str
+
+
+class PersistentPaginationRegistry:
+    """Paginations whose state lives entirely in their buttons' custom ids.
+
+    Each button encodes the page it leads to, the data key, and the author allowed to use it, so
+    no view object is kept per message and buttons keep working across restarts. A single
+    `on_interaction` listener renders whichever page was asked for.
+    """
+
+    def __init__(self, prefix: str = "dogscogs"):
+        self.prefix = prefix
+        self.sources: typing.Dict[str, PersistentGetPage] = {}
+
+    def register(self, name: str, get_page: PersistentGetPage):
+        """Registers a page source under a name.
+
+        Args:
+            name (str): The name to store in custom ids. Must not contain `:`.
+            get_page (PersistentGetPage): Gets the embed and total pages for a data key and page index.
+        """
+        if ":" in name:
+            raise ValueError("Page source names cannot contain ':'.")
+        self.sources[name] = get_page
+
+    def attach(self, bot: Red):
+        """Starts routing button presses to this registry. Call this in `cog_load`."""
+        bot.add_listener(self.dispatch, "on_interaction")
+
+    def detach(self, bot: Red):
+        """Stops routing button presses to this registry. Call this in `cog_unload`."""
+        bot.remove_listener(self.dispatch, "on_interaction")
+
+    def encode(self, state: PersistentPageState) -> str:
+        custom_id = ":".join(
+            (self.prefix, state.name, state.action, str(state.page), str(state.author_id), state.data_key)
+        )
+        if len(custom_id) > MAX_CUSTOM_ID_LENGTH:
+            raise ValueError(f"Custom id is longer than {MAX_CUSTOM_ID_LENGTH} characters: {custom_id}")
+        return custom_id
+
+    def decode(self, custom_id: str) -> typing.Optional[PersistentPageState]:
+        parts = custom_id.split(":", 5)
+        if len(parts) != 6 or parts[0] != self.prefix or parts[1] not in self.sources:
+            return None
+        try:
+            return PersistentPageState(parts[1], parts[2], int(parts[3]), int(parts[4]), parts[5])
+        except ValueError:
+            return None
+
+    def build_view(
+        self,
+        name: str,
+        data_key: str,
+        index: int,
+        total_pages: int,
+        author_id: int = 0,
+    ) -> typing.Optional[discord.ui.View]:
+        """Builds the navigation buttons for a page, or None if there is only one page.
+
+        The view is stopped before it is returned so discord.py never stores it.
+
+        Args:
+            name (str): The registered page source.
+            data_key (str): The key passed to the page source.
+            index (int): The current page index.
+            total_pages (int): The number of pages.
+            author_id (int, optional): The only user allowed to navigate. Defaults to anyone.
+
+        Returns:
+            typing.Optional[discord.ui.View]: The buttons to send with the page.
+        """
+        if total_pages <= 1:
+            return None
+
+        targets = {
+            "first": 0,
+            "previous": index - 1 if index > 0 else total_pages - 1,
+            "next": index + 1 if index < total_pages - 1 else 0,
+            "last": total_pages - 1,
+        }
+        emojis = {"first": "⏪", "previous": "◀️", "next": "▶️", "last": "⏩"}
+        styles = {
+            "first": discord.ButtonStyle.secondary,
+            "previous": discord.ButtonStyle.blurple,
+            "next": discord.ButtonStyle.blurple,
+            "last": discord.ButtonStyle.secondary,
+        }
+
+        view = discord.ui.View(timeout=None)
+        for action in PAGE_ACTIONS:
+            view.add_item(
+                discord.ui.Button(
+                    emoji=emojis[action],
+                    style=styles[action],
+                    custom_id=self.encode(
+                        PersistentPageState(name, action, targets[action], author_id, data_key)
+                    ),
+                    disabled=(action == "first" and index == 0)
+                    or (action == "last" and index == total_pages - 1),
+                )
+            )
+        view.stop()
+        return view
+
+    async def render(
+        self,
+        name: str,
+        data_key: str,
+        index: int = 0,
+        author_id: int = 0,
+    ) -> typing.Tuple[discord.Embed, typing.Optional[discord.ui.View]]:
+        """Gets a page and its navigation buttons.
+
+        Returns:
+            typing.Tuple[discord.Embed, typing.Optional[discord.ui.View]]: The arguments to send or edit the message with.
+        """
+        embed, total_pages = await self.sources[name](data_key, index)
+        return embed, self.build_view(name, data_key, index, total_pages, author_id)
+
+    async def send(
+        self,
+        destination: discord.abc.Messageable,
+        name: str,
+        data_key: str,
+        *,
+        author: typing.Optional[discord.abc.User] = None,
+    ) -> discord.Message:
+        """Sends the first page of a persistent pagination.
+
+        Args:
+            destination (discord.abc.Messageable): Where to send it.
+            name (str): The registered page source.
+            data_key (str): The key passed to the page source.
+            author (typing.Optional[discord.abc.User], optional): The only user allowed to navigate. Defaults to anyone.
+
+        Returns:
+            discord.Message: The sent message.
+        """
+        embed, view = await self.render(name, data_key, 0, author.id if author is not None else 0)
+        if view is None:
+            return await destination.send(embed=embed)
+        return await destination.send(embed=embed, view=view)
+
+    async def dispatch(self, interaction: discord.Interaction):
+        if interaction.type != discord.InteractionType.component or interaction.data is None:
+            return
+
+        state = self.decode(str(interaction.data.get("custom_id", "")))
+        if state is None:
+            return
+
+        if state.author_id != 0 and interaction.user.id != state.author_id:
+            await interaction.response.send_message("You are not allowed to interact with this view.", ephemeral=True, delete_after=10)
+            return
+
+        try:
+            embed, view = await self.render(state.name, state.data_key, state.page, state.author_id)
+        except Exception as error:
+            log.error("Failed to render page %s of %s for %r", state.page, state.name, state.data_key, exc_info=error)
+            await interaction.response.send_message("❌ Couldn't load that page.", ephemeral=True, delete_after=10)
+            return
+        await interaction.response.edit_message(embed=embed, view=view)
@@ -1,10 +1,11 @@
 import typing
+import aiohttp
 import discord
-import requests
 
 from discord.ext import commands
 
 from ..converters.percent import Percent
+from ..predicates.image import validate_image_url
 
 class ValidRoleTextInput(discord.ui.TextInput):
     role: typing.Union[None, discord.Role] = None
@@ -34,10 +35,12 @@ class ValidImageURLTextInput(discord.ui.TextInput):
         self,
         *args,
         valid_extensions: typing.List[str] = ["png", "jpg", "jpeg", "gif"],
+        session: typing.Optional[aiohttp.ClientSession] = None,
         **kwargs
     ):
         super().__init__(*args, **kwargs)
         self.valid_extensions = valid_extensions
+        self.session = session
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         extension = self.value.lower().split(".")[-1]
@@ -46,21 +49,12 @@ class ValidImageURLTextInput(discord.ui.TextInput):
             await interaction.response.send_message(f"❌ ERROR: Only the following image extensions are supported: {', '.join(self.valid_extensions)}.", ephemeral=True, delete_after=15)
             return False
 
-        try: 
-            image_formats = (
-                f"image/{ext}" for ext in self.valid_extensions
-            )
-            r = requests.head(self.value, headers={
-                "User-Agent": "Mozilla/5.0 (compatible; DiscordBot/1.0)"
-            }, timeout=10)
-            if r.headers["content-type"] not in image_formats:
-                await interaction.response.send_message("❌ ERROR: Please enter a valid image URL.", ephemeral=True, delete_after=15)
-                return False
-            return True
-        except:
+        if not await validate_image_url(self.value, self.valid_extensions, session=self.session):
             await interaction.response.send_message("❌ ERROR: Please enter a valid image URL.", ephemeral=True, delete_after=15)
             return False
 
+        return True
+
 
 class NumberPromptTextInput(discord.ui.TextInput):
     def __init__(
@@ -0,0 +1,36 @@
+import time
+
+from dogscogs.core.cache import TTLCache
+
+
+def test_lookups_count_hits_and_misses():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.get("b", 0) == 0
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_membership_does_not_touch_stats_or_order():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert "a" in cache
+    assert "c" not in cache
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 2}
+
+    # "a" is still the least recently used, so it is evicted first.
+    cache.set("c", 3)
+    assert "a" not in cache
+    assert list(cache.entries) == ["b", "c"]
+
+
+def test_expired_entries_are_not_contained():
+    cache: TTLCache[str, int] = TTLCache(ttl=0.01)
+    cache.set("a", 1)
+    assert "a" in cache
+    time.sleep(0.02)
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.stats() == {"hits": 0, "misses": 1, "size": 0}
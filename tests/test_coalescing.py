@@ -0,0 +1,188 @@
+import asyncio
+import typing
+
+import pytest
+
+from dogscogs.views import coalescing
+from dogscogs.views.coalescing import EDIT_RATE_LIMIT, CoalescingEditMixin
+
+real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Stands in for `time` in the coalescing module; sleeping advances it instead of waiting."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps: typing.List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float):
+        self.sleeps.append(delay)
+        self.now += max(delay, 0)
+        await real_sleep(0)
+
+
+class FakeMessage:
+    def __init__(self, id: int = 1, clock: typing.Optional[FakeClock] = None):
+        self.id = id
+        self.clock = clock
+        self.edits: typing.List[typing.Dict[str, typing.Any]] = []
+        self.edited_at: typing.List[float] = []
+        self.failing = False
+
+    async def edit(self, **kwargs: typing.Any):
+        if self.failing:
+            raise RuntimeError("edit failed")
+        self.edits.append(kwargs)
+        if self.clock is not None:
+            self.edited_at.append(self.clock.now)
+
+
+class View(CoalescingEditMixin):
+    def __init__(self):
+        super().__init__()
+        self.errors: typing.List[Exception] = []
+
+    async def on_edit_error(self, message, error: Exception):
+        self.errors.append(error)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    fake = FakeClock()
+    monkeypatch.setattr(coalescing, "time", fake)
+    monkeypatch.setattr(asyncio, "sleep", fake.sleep)
+    return fake
+
+
+async def settle(view: CoalescingEditMixin):
+    for _ in range(1000):
+        if all(pending.task is None or pending.task.done() for pending in view.pending_edits.values()):
+            return
+        await real_sleep(0)
+    raise AssertionError("Edits never settled.")
+
+
+def test_rapid_edits_collapse_to_the_newest(clock: FakeClock):
+    async def run():
+        view = View()
+        message: typing.Any = FakeMessage(clock=clock)
+        for i in range(10):
+            view.queue_edit(message, content=i)
+        await settle(view)
+
+        assert message.edits == [{"content": 9}]
+        assert view.edit_stats() == {"requested": 10, "sent": 1, "failed": 0, "coalesced": 9}
+
+    asyncio.run(run())
+
+
+def test_render_runs_when_the_edit_is_sent(clock: FakeClock):
+    async def run():
+        view = View()
+        message: typing.Any = FakeMessage(clock=clock)
+        state = {"page": 0}
+
+        async def render() -> typing.Dict[str, typing.Any]:
+            return {"content": state["page"]}
+
+        view.queue_edit(message, render)
+        state["page"] = 3
+        await settle(view)
+        assert message.edits == [{"content": 3}]
+
+    asyncio.run(run())
+
+
+def test_edits_respect_the_rate_limit(clock: FakeClock):
+    async def run():
+        view = View()
+        message: typing.Any = FakeMessage(clock=clock)
+        for i in range(EDIT_RATE_LIMIT * 3):
+            view.queue_edit(message, content=i)
+            await settle(view)
+
+        times = message.edited_at
+        assert len(times) == EDIT_RATE_LIMIT * 3
+        for first, sixth in zip(times, times[EDIT_RATE_LIMIT:]):
+            assert sixth - first >= coalescing.EDIT_RATE_PERIOD
+        # The first burst only waits for the debounce.
+        assert times[EDIT_RATE_LIMIT - 1] - times[0] < coalescing.EDIT_RATE_PERIOD
+
+    asyncio.run(run())
+
+
+def test_failed_edits_reach_on_edit_error(clock: FakeClock):
+    async def run():
+        view = View()
+        message: typing.Any = FakeMessage(clock=clock)
+
+        async def broken() -> typing.Dict[str, typing.Any]:
+            raise ValueError("render failed")
+
+        view.queue_edit(message, broken)
+        await settle(view)
+        message.failing = True
+        view.queue_edit(message, content="lost")
+        await settle(view)
+        message.failing = False
+        view.queue_edit(message, content="sent")
+        await settle(view)
+
+        assert [type(error) for error in view.errors] == [ValueError, RuntimeError]
+        assert message.edits == [{"content": "sent"}]
+        assert view.edit_stats() == {"requested": 3, "sent": 1, "failed": 2, "coalesced": 0}
+
+    asyncio.run(run())
+
+
+def test_default_on_edit_error_logs(clock: FakeClock, caplog: pytest.LogCaptureFixture):
+    async def run():
+        view = CoalescingEditMixin()
+        message: typing.Any = FakeMessage(clock=clock)
+        message.failing = True
+        view.queue_edit(message, content="x")
+        await settle(view)
+
+    asyncio.run(run())
+    assert "Failed to edit message 1" in caplog.text
+
+
+def test_cancel_edits(clock: FakeClock):
+    async def run():
+        view = View()
+        messages: typing.List[typing.Any] = [FakeMessage(id, clock) for id in (1, 2)]
+        for message in messages:
+            view.queue_edit(message, content="never")
+        view.cancel_edits()
+        await real_sleep(0)
+        await real_sleep(0)
+
+        assert [message.edits for message in messages] == [[], []]
+        assert view.pending_edits == {}
+        assert view.edit_stats() == {"requested": 2, "sent": 0, "failed": 0, "coalesced": 2}
+
+    asyncio.run(run())
+
+
+def test_idle_entries_are_dropped_after_the_rate_window(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(coalescing, "EDIT_RATE_PERIOD", 0.2)
+
+    async def run():
+        view = View()
+        view.edit_delay = 0
+        messages: typing.List[typing.Any] = [FakeMessage(id) for id in range(5)]
+        for message in messages:
+            view.queue_edit(message, content="x")
+        await settle(view)
+
+        # Kept while their sends still count towards the rate limit.
+        assert len(view.pending_edits) == 5
+        await real_sleep(0.3)
+        assert view.pending_edits == {}
+        assert [message.edits for message in messages] == [[{"content": "x"}]] * 5
+
+    asyncio.run(run())
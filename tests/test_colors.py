@@ -0,0 +1,57 @@
+import itertools
+import random
+import typing
+
+import pytest
+
+from dogscogs.constants.colors import ColorIndex, delta_e, get_palette, min_palette_diff, rgb_to_lab
+
+
+@pytest.mark.parametrize("seed", [0, 1, 42])
+def test_palette_is_deterministic(seed: int):
+    palette = list(get_palette(seed=seed))
+    assert len(palette) == 100
+    assert len(set(palette)) == 100
+    assert list(get_palette(seed=seed)) == palette
+
+
+@pytest.mark.parametrize("seed", [None, 0, 1, 42])
+def test_palette_spread(seed: typing.Optional[int]):
+    palette = list(get_palette(seed=seed))
+    # The spread the farthest-point selection reached when it replaced the random restarts.
+    assert min_palette_diff(palette) >= 242
+    labs = [rgb_to_lab(color) for color in palette]
+    assert min(delta_e(a, b) for a, b in itertools.combinations(labs, 2)) >= 2.0
+
+
+def test_palette_bounds():
+    assert list(get_palette(0)) == []
+    assert len(list(get_palette(20, seed=0))) == 20
+    with pytest.raises(ValueError):
+        get_palette(-1)
+    with pytest.raises(ValueError):
+        get_palette(10_000)
+
+
+def test_index_ties_go_to_the_first_entry():
+    color = (120, 40, 200)
+    index = ColorIndex([("a", color), ("b", color), ("c", (0, 0, 0)), ("d", color)])
+    for query in ((255, 255, 255), (0, 0, 0), (120, 40, 200), (121, 40, 200), (119, 40, 200)):
+        assert [match.name for match in index.nearest(query, 3)] == (
+            ["c", "a", "b"] if query == (0, 0, 0) else ["a", "b", "d"]
+        )
+        assert index.nearest_many([query])[0][0].name == ("c" if query == (0, 0, 0) else "a")
+
+
+def test_index_matches_linear_scan():
+    rng = random.Random(0)
+    # Coarse channels, so many entries share a color.
+    colors = [(str(i), tuple(rng.randrange(0, 256, 64) for _ in range(3))) for i in range(300)]
+    index = ColorIndex(colors)  # type: ignore[arg-type]
+    labs = [rgb_to_lab(color) for _, color in colors]  # type: ignore[arg-type]
+
+    for _ in range(100):
+        query = tuple(rng.randrange(256) for _ in range(3))
+        lab = rgb_to_lab(query)  # type: ignore[arg-type]
+        expected = sorted(range(len(colors)), key=lambda i: (delta_e(lab, labs[i]), i))[:5]
+        assert [match.name for match in index.nearest(query, 5)] == [str(i) for i in expected]
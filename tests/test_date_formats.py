@@ -0,0 +1,97 @@
+import calendar
+import datetime
+import itertools
+import typing
+
+import pytest
+
+from dogscogs.converters.date import date_formats, parse_month_day
+
+
+def strptime_month_day(argument: str) -> typing.Optional[typing.Tuple[int, int]]:
+    # The loop `BirthdayConverter.parse` used before `parse_month_day`.
+    for fmt in date_formats():
+        try:
+            parsed = datetime.datetime.strptime(argument, fmt)
+        except ValueError:
+            continue
+        return parsed.month, parsed.day
+    return None
+
+
+DAYS = ("1", "01", " 1", "10", "29", "30", "31", "32", "0")
+MONTHS = {
+    "%m": ("1", "02", "4", "12", "13", "0"),
+    "%b": ("Feb", "apr", "Sept", "foo"),
+    "%B": ("February", "APRIL", "febuary"),
+}
+YEARS = {
+    "%Y": ("1980", "1900", "2023", "0000", "999"),
+    "%y": ("80", "00", "69", "7", "123"),
+}
+
+
+def sample_inputs(fmt: str) -> typing.Iterator[str]:
+    separator = "/" if "/" in fmt else " "
+    fields = fmt.split(separator)
+    choices = [
+        DAYS if field == "%d" else MONTHS.get(field) or YEARS[field]
+        for field in fields
+    ]
+    for values in itertools.product(*choices):
+        yield separator.join(values)
+
+
+EDGE_CASES = (
+    "",
+    " ",
+    "feb 29",
+    "29 feb",
+    "feb 29 1980",
+    "feb 29 1981",
+    "29/2/2000",
+    "29/2/1900",
+    "2/29/00",
+    "31 apr",
+    "apr 31 1980",
+    "jan  1",
+    "jan\t1",
+    "1 / 2",
+    "1//2",
+    "1/2/",
+    "/1/2",
+    "jan_1",
+    "jan 1 1980 extra",
+    "12/12/12",
+    "1/1/1",
+    "5 may 20",
+    "20 5 may",
+)
+
+
+@pytest.mark.parametrize("fmt", list(dict.fromkeys(date_formats())))
+def test_matches_strptime_for_every_format(fmt: str):
+    accepted = 0
+    for argument in sample_inputs(fmt):
+        expected = strptime_month_day(argument)
+        assert parse_month_day(argument) == expected, argument
+        accepted += expected is not None
+    assert accepted > 0, f"no sample input was accepted for {fmt!r}"
+
+
+@pytest.mark.parametrize("argument", EDGE_CASES)
+def test_matches_strptime_for_edge_cases(argument: str):
+    assert parse_month_day(argument) == strptime_month_day(argument)
+
+
+def test_matches_strptime_for_every_calendar_day():
+    for month in range(1, 13):
+        for day in range(1, calendar.monthrange(1980, month)[1] + 1):
+            for argument in (
+                f"{calendar.month_abbr[month]} {day}",
+                f"{day} {calendar.month_name[month]}",
+                f"{month}/{day}",
+                f"{day:02}/{month:02}/1980",
+                f"1980 {calendar.month_abbr[month]} {day}",
+            ):
+                assert parse_month_day(argument) == strptime_month_day(argument), argument
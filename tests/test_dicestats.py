@@ -0,0 +1,162 @@
+from collections import Counter
+import itertools
+import math
+import random
+import time
+import typing
+
+import pytest
+
+from dogscogs.parsers.dice import compile_dice
+from dogscogs.parsers.dicestats import (
+    EXACT_SAMPLE_THRESHOLD,
+    SAMPLE_WORK_LIMIT,
+    DiceDistribution,
+    DiceTerm,
+    compile_plan,
+    distribution,
+    exact_distribution,
+    roll_many,
+)
+
+
+def brute_force(dice: int, sides: int, keep: str, kept: int, sign: int) -> Counter:
+    # Enumerates every outcome of a single dice term.
+    totals: Counter = Counter()
+    for faces in itertools.product(range(1, sides + 1), repeat=dice):
+        ordered = sorted(faces)
+        chosen = ordered[dice - kept:] if keep == "h" else ordered[:kept] if keep == "l" else ordered
+        totals[sign * sum(chosen)] += 1
+    return totals
+
+
+def convolve(left: Counter, right: Counter) -> Counter:
+    result: Counter = Counter()
+    for a, ways_a in left.items():
+        for b, ways_b in right.items():
+            result[a + b] += ways_a * ways_b
+    return result
+
+
+def chi_square_passes(observed: typing.Sequence[int], expected: DiceDistribution) -> bool:
+    """Pearson's chi-square test at p = 0.001, pooling totals expected fewer than 5 times."""
+    n = len(observed)
+    counts = Counter(observed)
+    bins: typing.List[typing.Tuple[float, int]] = []
+    pooled_expected, pooled_observed = 0.0, 0
+    for value, ways in zip(expected.values, expected.counts):
+        pooled_expected += n * ways / expected.total
+        pooled_observed += counts.pop(value, 0)
+        if pooled_expected >= 5:
+            bins.append((pooled_expected, pooled_observed))
+            pooled_expected, pooled_observed = 0.0, 0
+    if bins and pooled_expected > 0:
+        last_expected, last_observed = bins.pop()
+        bins.append((last_expected + pooled_expected, last_observed + pooled_observed))
+
+    assert not counts, f"Rolled totals outside the distribution: {sorted(counts)}"
+    statistic = sum((o - e) ** 2 / e for e, o in bins)
+    df = len(bins) - 1
+    # Wilson-Hilferty approximation of the chi-square critical value, with z for p = 0.001.
+    critical = df * (1 - 2 / (9 * df) + 3.09 * math.sqrt(2 / (9 * df))) ** 3
+    return statistic < critical
+
+
+@pytest.mark.parametrize(
+    "expression, terms, modifier",
+    [
+        ("3d6", [(3, 6, "", 3, 1)], 0),
+        ("1d20 + 5", [(1, 20, "", 1, 1)], 5),
+        ("4d6kh3", [(4, 6, "h", 3, 1)], 0),
+        ("5d4kl2", [(5, 4, "l", 2, 1)], 0),
+        ("2d20kh1 - 1d4 + 2", [(2, 20, "h", 1, 1), (1, 4, "", 1, -1)], 2),
+        ("-(2d6) + 3d3kl2", [(2, 6, "", 2, -1), (3, 3, "l", 2, 1)], 0),
+        ("2d6kh2", [(2, 6, "", 2, 1)], 0),
+    ],
+)
+def test_exact_counts_match_brute_force(
+    expression: str, terms: typing.List[typing.Tuple[int, int, str, int, int]], modifier: int
+):
+    exact = exact_distribution(expression)
+    assert exact is not None and exact.exact
+
+    expected = Counter({modifier: 1})
+    for term in terms:
+        expected = convolve(expected, brute_force(*term))
+    assert dict(zip(exact.values, exact.counts)) == dict(expected)
+
+
+def test_compile_plan():
+    plan = compile_plan(compile_dice("4d6kh3 - 1d4 + 2"))
+    assert plan is not None
+    assert sorted(plan.terms) == [DiceTerm(1, 4, None, 1, -1), DiceTerm(4, 6, "h", 3, 1)]
+    assert plan.modifier == 2
+
+    assert compile_plan(compile_dice("1d20ro1")) is None
+    assert compile_plan(compile_dice("2d6 * 2")) is None
+
+
+@pytest.mark.parametrize("expression", ["3d6", "4d6kh3 + 2", "2d20kh1 - 1d4", "10d10kl3"])
+def test_roll_many_matches_exact_distribution(expression: str):
+    exact = exact_distribution(expression)
+    assert exact is not None
+    roll = compile_dice(expression)
+    plan = compile_plan(roll)
+    assert plan is not None
+
+    rng = random.Random(expression)
+    # Above the threshold rolls come from the exact distribution, below it they are simulated.
+    assert chi_square_passes(roll_many(expression, EXACT_SAMPLE_THRESHOLD * 20, rng=rng), exact)
+    assert chi_square_passes(roll_many(expression, EXACT_SAMPLE_THRESHOLD - 1, rng=rng), exact)
+    assert chi_square_passes([plan.roll(rng) for _ in range(5000)], exact)
+    assert chi_square_passes([roll.roll().total for _ in range(2000)], exact)
+
+
+def test_distribution_statistics():
+    dist = exact_distribution("2d6")
+    assert dist is not None
+    assert (dist.minimum, dist.maximum) == (2, 12)
+    assert dist.mean == pytest.approx(7)
+    assert dist.stdev == pytest.approx(math.sqrt(35 / 6))
+    assert dist.probability(7) == pytest.approx(6 / 36)
+    assert dist.probability(13) == 0
+    assert dist.probability_at_least(10) == pytest.approx(6 / 36)
+    assert dist.probability_at_least(0) == 1
+    assert [dist.percentile(p) for p in (0, 50, 100)] == [2, 7, 12]
+
+    with pytest.raises(ValueError):
+        dist.percentile(101)
+
+
+def test_large_expressions_fall_back_to_sampling():
+    for expression in ("223d100", "100d500"):
+        assert exact_distribution(expression) is None
+        totals = roll_many(expression, 10, rng=random.Random(0))
+        assert len(totals) == 10
+
+    sampled = distribution("223d100", samples=200, rng=random.Random(0))
+    assert not sampled.exact
+    assert sampled.total == 200
+    assert 223 <= sampled.minimum <= sampled.maximum <= 22300
+
+    rerolled = roll_many("1d20ro1", 50)
+    assert all(1 <= total <= 20 for total in rerolled)
+
+
+@pytest.mark.parametrize("expression", ["40d6kh20", "120d6", "200d200", "1000d1000", "1d20ro1", "100d6ro1"])
+def test_sampled_distributions_stay_bounded(expression: str):
+    start = time.perf_counter()
+    sampled = distribution(expression, rng=random.Random(0))
+    elapsed = time.perf_counter() - start
+    print(f"{expression}: {sampled.total} samples in {elapsed * 1000:.0f}ms")
+
+    assert not sampled.exact
+    roll = compile_dice(expression)
+    assert sampled.total * roll.dice <= SAMPLE_WORK_LIMIT
+    assert elapsed < 1.5
+
+
+def test_d20_fallback_returns_ints():
+    totals = roll_many("1d20 / 3 + 0.5", 50)
+    assert all(type(total) is int for total in totals)
+    assert all(0 <= total <= 7 for total in totals)
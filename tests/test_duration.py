@@ -0,0 +1,92 @@
+import random
+import re
+from time import strptime
+import typing
+
+import pytest
+from redbot.core import commands
+
+from dogscogs.parsers.date import humanize_duration, parse_duration_string
+
+
+def strptime_duration(input: str) -> int:
+    # The clock-form parser `parse_duration_string` replaced.
+    if re.match(r"^\d+:[0-5][0-9]:[0-5][0-9]$", input):
+        hours, rest = input.split(":", 1)
+        t = strptime(rest, "%M:%S")
+        return int(hours) * 60 * 60 + t.tm_min * 60 + t.tm_sec
+    elif re.match(r"^[0-9]?[0-9]:[0-5][0-9]$", input):
+        t = strptime(input, "%M:%S")
+        return t.tm_min * 60 + t.tm_sec
+    else:
+        raise commands.BadArgument("Could not parse the duration.")
+
+
+def random_seconds(rng: random.Random, count: int) -> typing.Iterator[int]:
+    # Spread samples over every unit size, not just the largest.
+    for _ in range(count):
+        yield rng.randrange(10 ** rng.randint(1, 8))
+
+
+@pytest.mark.parametrize("short", [False, True])
+@pytest.mark.parametrize("max_units", [None, 1, 2])
+def test_humanize_round_trip(short: bool, max_units: typing.Optional[int]):
+    rng = random.Random(f"{short}-{max_units}")
+    for seconds in random_seconds(rng, 5000):
+        text = humanize_duration(seconds, short=short, max_units=max_units)
+        parsed = parse_duration_string(text)
+        if max_units is None:
+            assert parsed == seconds, text
+        else:
+            assert parsed <= seconds, text
+            assert humanize_duration(parsed, short=short) == text
+
+
+def test_clock_forms_match_strptime():
+    inputs = [f"{m}:{s:02}" for m in range(100) for s in range(60)]
+    inputs += [f"{m:02}:{s:02}" for m in range(60) for s in range(0, 60, 7)]
+    inputs += [f"{h}:{m:02}:{s:02}" for h in (0, 1, 9, 10, 99, 123456) for m in range(60) for s in range(0, 60, 11)]
+    inputs += ["", "1", ":30", "1:60", "1:5", "100:00", "1:00:60", "1:60:00", "a:bc", " 1:30", "1:30 ", "-1:30"]
+
+    for input in inputs:
+        try:
+            expected = strptime_duration(input)
+        except (ValueError, commands.BadArgument):
+            # strptime let minutes of 60 or more escape as ValueError; both now raise BadArgument.
+            with pytest.raises(commands.BadArgument):
+                parse_duration_string(input)
+        else:
+            assert parse_duration_string(input) == expected, input
+
+
+@pytest.mark.parametrize(
+    "input, seconds",
+    [
+        ("90s", 90),
+        ("1h30m", 5400),
+        ("2d 4h", 187200),
+        ("1 hour and 5 minutes", 3900),
+        ("1 week, 2 days and 3 secs", 777603),
+        ("5 MINS", 300),
+    ],
+)
+def test_unit_forms(input: str, seconds: int):
+    assert parse_duration_string(input) == seconds
+
+
+@pytest.mark.parametrize("input", ["", "   ", "5", "5x", "h", "1h 5", "1h and", "1.5h"])
+def test_invalid_unit_forms(input: str):
+    with pytest.raises(commands.BadArgument):
+        parse_duration_string(input)
+
+
+def test_humanize_duration():
+    assert humanize_duration(0) == "0 seconds"
+    assert humanize_duration(0, short=True) == "0s"
+    assert humanize_duration(1) == "1 second"
+    assert humanize_duration(187230) == "2 days, 4 hours and 30 seconds"
+    assert humanize_duration(187230, short=True) == "2d 4h 30s"
+    assert humanize_duration(187230, max_units=2) == "2 days and 4 hours"
+
+    with pytest.raises(ValueError):
+        humanize_duration(-5)
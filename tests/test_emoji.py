@@ -0,0 +1,127 @@
+import asyncio
+from collections import Counter
+import re
+import timeit
+import typing
+
+import pytest
+
+from dogscogs.parsers.emoji import CustomEmoji, count_emoji_ids, iter_custom_emojis, parse_custom_emojis, parse_emoji_ids
+from dogscogs.parsers.emoji_usage import EmojiUsage, EmojiUsageAggregator
+
+MIXED = (
+    "hi <:wave:111> there <a:party:222>! 👋🏽 <:wave:111> 🇯🇵 and 1️⃣ "
+    "👨‍👩‍👧 <a:party:222><:wave:111> ❤️ not <:broken:> or <wave:333> or :wave: 👋🏽"
+)
+
+
+def legacy_parse_emoji_ids(content: str) -> typing.List[int]:
+    # The split-based parser `CUSTOM_EMOJI_REGEX` replaced; it only knew static emojis.
+    found_emojis: typing.List[str] = re.findall(r"<:\w*:\d*>", content)
+    result = [e.split(":")[2].replace(">", "") for e in found_emojis]
+    return [int(r) for r in result]
+
+
+class FakeMessage:
+    def __init__(self, id: int, content: str):
+        self.id = id
+        self.content = content
+
+
+def test_parse_custom_emojis():
+    assert parse_custom_emojis(MIXED) == [
+        CustomEmoji(False, "wave", 111),
+        CustomEmoji(True, "party", 222),
+        CustomEmoji(False, "wave", 111),
+        CustomEmoji(True, "party", 222),
+        CustomEmoji(False, "wave", 111),
+    ]
+    assert list(iter_custom_emojis(MIXED)) == parse_custom_emojis(MIXED)
+    assert parse_emoji_ids(MIXED) == [111, 222, 111, 222, 111]
+    assert parse_custom_emojis("no emojis :here:") == []
+
+
+def test_parse_emoji_ids_matches_legacy_for_static_emojis():
+    for content in ("", "<:a:1>", "x <:a_b:12> y <:C9:345><:a:1>", "<:a:1> :b:2 <b:3>"):
+        assert parse_emoji_ids(content) == legacy_parse_emoji_ids(content)
+    # The old parser crashed on a missing id.
+    with pytest.raises(ValueError):
+        legacy_parse_emoji_ids("<:x:>")
+    assert parse_emoji_ids("<:x:>") == []
+
+
+def test_count_emoji_ids():
+    counter = count_emoji_ids([MIXED, "<:wave:111>", ""])
+    assert counter == Counter({111: 4, 222: 2})
+    assert count_emoji_ids(["<a:party:222>"], counter) is counter
+    assert counter[222] == 3
+
+
+def test_usage_aggregator_counts_mixed_text():
+    async def run():
+        flushed: typing.List[EmojiUsage] = []
+
+        async def sink(usage: EmojiUsage):
+            flushed.append(usage)
+
+        aggregator = EmojiUsageAggregator(sink, flush_every=2)
+
+        async def messages() -> typing.AsyncIterator[typing.Any]:
+            for id, content in enumerate((MIXED, "plain", "👋🏽 <:wave:111>"), start=10):
+                yield FakeMessage(id, content)
+
+        assert await aggregator.consume(messages()) == 3
+        return flushed
+
+    flushed = asyncio.run(run())
+    assert [usage.messages for usage in flushed] == [2, 1]
+    assert [usage.checkpoint for usage in flushed] == [11, 12]
+
+    custom: Counter = Counter()
+    unicode: Counter = Counter()
+    for usage in flushed:
+        custom.update(usage.custom)
+        unicode.update(usage.unicode)
+    assert custom == Counter({111: 4, 222: 2})
+    assert unicode == Counter({"👋🏽": 3, "🇯🇵": 1, "1️⃣": 1, "👨‍👩‍👧": 1, "❤️": 1})
+
+
+@pytest.mark.parametrize("ids", [[1, 2, 3, 4, 5], [5, 4, 3, 2, 1], [3, 1, 5, 2, 4]])
+def test_usage_aggregator_resumes_from_checkpoint(ids: typing.List[int]):
+    async def run():
+        flushed: typing.List[EmojiUsage] = []
+
+        async def sink(usage: EmojiUsage):
+            flushed.append(usage)
+
+        aggregator = EmojiUsageAggregator(sink, checkpoint=2)
+
+        async def messages() -> typing.AsyncIterator[typing.Any]:
+            for id in ids:
+                yield FakeMessage(id, "<:wave:111>")
+
+        counted = await aggregator.consume(messages())
+        return counted, flushed
+
+    counted, flushed = asyncio.run(run())
+    assert counted == 3
+    assert flushed == [EmojiUsage({111: 3}, {}, 3, 5)]
+
+
+def test_emoji_parsing_benchmark():
+    # Parsing animated emojis and reading match groups must not cost more than the old split-based
+    # parser; locally the two are within noise of each other.
+    contents = [f"hello <:wave:{i}> there <:party:{i + 1}> and <:cat:{i + 2}> x" for i in range(1000)]
+
+    def compiled():
+        count_emoji_ids(contents)
+
+    def legacy():
+        counter: Counter = Counter()
+        for content in contents:
+            counter.update(legacy_parse_emoji_ids(content))
+
+    compiled_time = min(timeit.repeat(compiled, number=5, repeat=5))
+    legacy_time = min(timeit.repeat(legacy, number=5, repeat=5))
+    print(f"5k messages: count_emoji_ids {compiled_time * 1000:.2f}ms, legacy {legacy_time * 1000:.2f}ms")
+    assert compiled_time < legacy_time * 1.5
@@ -0,0 +1,154 @@
+import asyncio
+import contextlib
+import typing
+
+import aiohttp
+from aiohttp import web
+
+from dogscogs.predicates import image
+
+PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+    + (640).to_bytes(4, "big")
+    + (480).to_bytes(4, "big")
+    + b"\x08\x06\x00\x00\x00"
+    + b"\x00" * 1024
+)
+GIF = b"GIF89a" + (32).to_bytes(2, "little") + (16).to_bytes(2, "little") + b"\x00" * 100
+
+
+class StandInServer:
+    """A local HTTP server whose responses can be switched between requests."""
+
+    def __init__(self):
+        self.hits: typing.Dict[str, int] = {}
+        self.failing: typing.Set[str] = set()
+        self.slow: typing.Set[str] = set()
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        path = request.path
+        self.hits[path] = self.hits.get(path, 0) + 1
+
+        if path in self.slow:
+            await asyncio.sleep(1)
+        if path in self.failing:
+            return web.Response(status=503)
+        if path in ("/image.png", "/flaky.png", "/slow.png"):
+            return web.Response(body=PNG, content_type="image/png")
+        if path == "/no-head.gif":
+            if request.method == "HEAD":
+                return web.Response(status=405)
+            return web.Response(body=GIF, headers={"Content-Type": "image/gif; charset=binary"})
+        if path == "/redirect.png":
+            raise web.HTTPFound("/image.png")
+        if path == "/page.png":
+            return web.Response(body=b"<html></html>", content_type="text/html")
+        if path == "/limited.png":
+            return web.Response(status=429)
+        return web.Response(status=404)
+
+
+@contextlib.asynccontextmanager
+async def serve() -> typing.AsyncIterator[typing.Tuple[StandInServer, str, aiohttp.ClientSession]]:
+    server = StandInServer()
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+    image.content_type_cache.clear()
+    image.image_probe_cache.clear()
+    try:
+        async with aiohttp.ClientSession() as session:
+            yield server, f"http://127.0.0.1:{port}", session
+    finally:
+        await runner.cleanup()
+
+
+def test_validate_image_url():
+    async def run():
+        async with serve() as (server, base, session):
+            assert await image.validate_image_url(f"{base}/image.png", session=session)
+            assert await image.validate_image_url(f"{base}/redirect.png", session=session)
+            assert await image.validate_image_url(f"{base}/no-head.gif", session=session)
+            assert not await image.validate_image_url(f"{base}/no-head.gif", ("png",), session=session)
+            assert not await image.validate_image_url(f"{base}/page.png", session=session)
+            assert not await image.validate_image_url(f"{base}/missing.png", session=session)
+
+    asyncio.run(run())
+
+
+def test_jpg_allows_jpeg_content_type():
+    assert image.image_content_types(["jpg"]) == {"image/jpg", "image/jpeg"}
+
+
+def test_definitive_answers_are_cached():
+    async def run():
+        async with serve() as (server, base, session):
+            for _ in range(3):
+                await image.fetch_content_type(f"{base}/image.png", session=session)
+                await image.fetch_content_type(f"{base}/missing.png", session=session)
+            assert server.hits["/image.png"] == 1
+            assert server.hits["/missing.png"] == 1
+
+    asyncio.run(run())
+
+
+def test_transient_failures_are_not_cached():
+    async def run():
+        async with serve() as (server, base, session):
+            server.failing.add("/flaky.png")
+            assert await image.fetch_content_type(f"{base}/flaky.png", session=session) is None
+            server.failing.clear()
+            assert await image.fetch_content_type(f"{base}/flaky.png", session=session) == "image/png"
+
+            assert await image.fetch_content_type(f"{base}/limited.png", session=session) is None
+            assert await image.fetch_content_type(f"{base}/limited.png", session=session) is None
+            assert server.hits["/limited.png"] == 2
+
+            server.slow.add("/slow.png")
+            assert await image.fetch_content_type(f"{base}/slow.png", session=session, timeout=0.1) is None
+            server.slow.clear()
+            assert await image.fetch_content_type(f"{base}/slow.png", session=session) == "image/png"
+
+    asyncio.run(run())
+
+
+def test_probe_image():
+    async def run():
+        async with serve() as (server, base, session):
+            probe = await image.probe_image(f"{base}/image.png", session=session)
+            assert probe is not None
+            assert (probe.format, probe.width, probe.height, probe.content_type) == ("png", 640, 480, "image/png")
+            assert probe.size == len(PNG)
+            assert await image.validate_emoji_image(f"{base}/image.png", session=session)
+
+            probe = await image.probe_image(f"{base}/page.png", session=session)
+            assert probe is not None and probe.format is None
+            assert not await image.validate_emoji_image(f"{base}/page.png", session=session)
+
+    asyncio.run(run())
+
+
+def test_probe_image_caches_only_definitive_answers():
+    async def run():
+        async with serve() as (server, base, session):
+            await image.probe_image(f"{base}/missing.png", session=session)
+            await image.probe_image(f"{base}/missing.png", session=session)
+            assert server.hits["/missing.png"] == 1
+
+            server.failing.add("/flaky.png")
+            assert await image.probe_image(f"{base}/flaky.png", session=session) is None
+            server.failing.clear()
+            probe = await image.probe_image(f"{base}/flaky.png", session=session)
+            assert probe is not None and probe.format == "png"
+
+            server.slow.add("/slow.png")
+            assert await image.probe_image(f"{base}/slow.png", session=session, timeout=0.1) is None
+            server.slow.clear()
+            assert await image.probe_image(f"{base}/slow.png", session=session) is not None
+
+    asyncio.run(run())
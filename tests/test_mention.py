@@ -0,0 +1,150 @@
+import asyncio
+import timeit
+import typing
+
+import discord
+import pytest
+from redbot.core import commands
+
+from dogscogs.converters import mention
+from dogscogs.converters.mention import Mention
+
+GUILD_ID = 100000000000000000
+OTHER_GUILD_ID = 200000000000000000
+
+
+class FakeTextChannel(discord.TextChannel):
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
+
+
+class FakeVoiceChannel:
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
+
+
+class FakeMember:
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
+
+
+class FakeRole:
+    def __init__(self, id: int, name: str):
+        self.id = id
+        self.name = name
+
+
+class FakeGuild:
+    def __init__(self, chunked: bool = True):
+        self.id = GUILD_ID
+        self.chunked = chunked
+        self.text_channels = [FakeTextChannel(GUILD_ID + 1, "general"), FakeTextChannel(GUILD_ID + 2, "shared")]
+        self.voice_channels = [FakeVoiceChannel(GUILD_ID + 3, "voice")]
+        self.members = [FakeMember(GUILD_ID + 4, "rex"), FakeMember(GUILD_ID + 5, "shared")]
+        self.roles = [FakeRole(GUILD_ID + 6, "mods"), FakeRole(GUILD_ID + 7, "shared")]
+
+    def get_channel(self, id: int):
+        channels: typing.List[typing.Any] = [*self.text_channels, *self.voice_channels]
+        return next((c for c in channels if c.id == id), None)
+
+    def get_member(self, id: int):
+        return next((m for m in self.members if m.id == id), None)
+
+    def get_member_named(self, name: str):
+        return next((m for m in self.members if m.name == name), None)
+
+    def get_role(self, id: int):
+        return next((r for r in self.roles if r.id == id), None)
+
+
+class FakeContext:
+    def __init__(self, guild: FakeGuild):
+        self.guild = guild
+
+
+@pytest.fixture
+def fetched(monkeypatch: pytest.MonkeyPatch) -> typing.List[str]:
+    # Stands in for the gateway member query, which only finds "fetched" members.
+    calls: typing.List[str] = []
+
+    async def fetch_member(ctx: typing.Any, input: str):
+        calls.append(input)
+        return FakeMember(GUILD_ID + 9, "fetched") if "fetched" in input or str(GUILD_ID + 9) in input else None
+
+    monkeypatch.setattr(mention, "_fetch_member", fetch_member)
+    return calls
+
+
+def parse(input: str, guild: typing.Optional[FakeGuild] = None) -> typing.Any:
+    ctx: typing.Any = FakeContext(guild or FakeGuild())
+    return asyncio.run(Mention.parse(ctx, input))
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (f"<#{GUILD_ID + 1}>", ("channel", GUILD_ID + 1)),
+        (f"<@{GUILD_ID + 4}>", ("member", GUILD_ID + 4)),
+        (f"<@!{GUILD_ID + 4}>", ("member", GUILD_ID + 4)),
+        (f"<@&{GUILD_ID + 6}>", ("role", GUILD_ID + 6)),
+        (str(GUILD_ID + 2), ("channel", GUILD_ID + 2)),
+        (str(GUILD_ID + 5), ("member", GUILD_ID + 5)),
+        (str(GUILD_ID + 7), ("role", GUILD_ID + 7)),
+        ("general", ("channel", GUILD_ID + 1)),
+        ("rex", ("member", GUILD_ID + 4)),
+        ("mods", ("role", GUILD_ID + 6)),
+        # A name shared by all three resolves in the old try-all order.
+        ("shared", ("channel", GUILD_ID + 2)),
+    ],
+)
+def test_each_mention_kind(input: str, expected: typing.Tuple[str, int], fetched: typing.List[str]):
+    kinds = {FakeTextChannel: "channel", FakeMember: "member", FakeRole: "role"}
+    result = parse(input)
+    assert (kinds[type(result)], result.id) == expected
+    assert fetched == []
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        f"<#{OTHER_GUILD_ID + 1}>",
+        f"<#{GUILD_ID + 3}>",  # A voice channel.
+        f"<@{OTHER_GUILD_ID + 4}>",
+        f"<@&{OTHER_GUILD_ID + 6}>",
+        str(OTHER_GUILD_ID + 1),
+        "12345",
+        "nobody",
+        "<@>",
+        "<#general>",
+    ],
+)
+def test_unknown_and_foreign_ids(input: str, fetched: typing.List[str]):
+    with pytest.raises(commands.BadArgument):
+        parse(input)
+
+
+def test_members_missing_from_the_cache_are_fetched(fetched: typing.List[str]):
+    assert parse(f"<@{GUILD_ID + 9}>").name == "fetched"
+    assert parse(str(GUILD_ID + 9)).name == "fetched"
+    assert parse("fetched", FakeGuild(chunked=False)).name == "fetched"
+    with pytest.raises(commands.BadArgument):
+        parse("fetched")
+    # Channel and role mentions never reach the member query, and names only do in unchunked guilds.
+    with pytest.raises(commands.BadArgument):
+        parse(f"<@&{OTHER_GUILD_ID + 9}>")
+    assert fetched == [f"<@{GUILD_ID + 9}>", str(GUILD_ID + 9), "fetched"]
+
+
+def test_mention_benchmark(fetched: typing.List[str]):
+    ctx: typing.Any = FakeContext(FakeGuild())
+    loop = asyncio.new_event_loop()
+    try:
+        for input in (f"<#{GUILD_ID + 1}>", f"<@{GUILD_ID + 4}>", f"<@&{GUILD_ID + 6}>", str(GUILD_ID + 7), "mods"):
+            seconds = min(timeit.repeat(lambda: loop.run_until_complete(Mention.parse(ctx, input)), number=200, repeat=3))
+            print(f"{input}: {seconds / 200 * 1e6:.1f}us per call")
+            assert seconds / 200 < 0.001
+    finally:
+        loop.close()
@@ -0,0 +1,47 @@
+import asyncio
+import typing
+
+import discord
+
+from dogscogs.views.paginated import PaginatedEmbed
+
+
+class FakeInteraction:
+    user = object()
+
+
+def test_async_iterator_totals_are_not_cached_stale():
+    async def run():
+        pulled: typing.List[int] = []
+
+        async def items() -> typing.AsyncIterator[int]:
+            for item in range(70):
+                pulled.append(item)
+                yield item
+
+        view = PaginatedEmbed.from_async_iterator(
+            items(),
+            results_per_page=10,
+            format_page=lambda page, index, total: discord.Embed(title=str(index)),
+            interaction=FakeInteraction(),  # type: ignore[arg-type]
+            cache_size=16,
+        )
+
+        seen = []
+        for index in (0, 1, 6, 0, 5):
+            view.index = index
+            edit = await view.render_page()
+            await asyncio.sleep(0)
+            seen.append((view.total_pages, view.total_known, edit["embed"].footer.text, len(pulled)))
+
+        assert seen == [
+            # Only one item past the page viewed is pulled; nothing is prefetched ahead.
+            (2, False, "Page 1 of ?", 11),
+            (3, False, "Page 2 of ?", 21),
+            (7, True, "Page 7 of 7", 70),
+            (7, True, "Page 1 of 7", 70),
+            (7, True, "Page 6 of 7", 70),
+        ]
+        view.stop()
+
+    asyncio.run(run())
@@ -0,0 +1,129 @@
+import re
+import timeit
+import typing
+
+import pytest
+
+from dogscogs.constants import regex
+
+# The patterns before their escapes were fixed. Inside raw strings, `\\.` and `\\d` only match a
+# literal backslash followed by `.` or `d`.
+LEGACY_IP_ADDRESS = r"(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)"
+LEGACY_PORT = r"""(?:
+  (?![7-9]\\d\\d\\d\\d) #Ignrore anything above 7....
+  (?!6[6-9]\\d\\d\\d)  #Ignore anything abovr 69...
+  (?!65[6-9]\\d\\d)   #etc...
+  (?!655[4-9]\\d)
+  (?!6553[6-9])
+  (?!0+)            #ignore complete 0(s)
+  (?P<Port>\\d{1,5})
+)"""
+LEGACY_IMAGE = r"(http)?s?:?(\\/\\/[^\"']*\\.(?:png|jpg|jpeg|gif|png|svg))"
+
+SAMPLES = [
+    "",
+    "hello",
+    "Hello, World!",
+    "abc_123",
+    "emoji name",
+    "<#123456789012345678>",
+    "123456789012345678",
+    "<@123456789012345678>",
+    "<@!123456789012345678>",
+    "<@&123456789012345678>",
+    "255, 0, 128",
+    "rgb(255, 0, 128)",
+    "https://cdn.discordapp.com/emojis/1.png",
+    "http://example.com/a b.gif",
+    "ftp://example.com/image.jpg",
+    "192.168.0.1",
+    "8080",
+    "0",
+    "70000",
+]
+
+
+def match(pattern: typing.Union[str, typing.Pattern[str]], text: str, flags: int = 0):
+    found = pattern.match(text) if isinstance(pattern, re.Pattern) else re.match(pattern, text, flags)
+    return found.group() if found is not None else None
+
+
+@pytest.mark.parametrize(
+    "name", ["TRIGGER", "EMOJI_NAME", "EMOJI_URL", "CHANNEL_MENTION", "USER_MENTION", "NOT_RGB"]
+)
+def test_compiled_patterns_match_their_source(name: str):
+    pattern = getattr(regex, name)
+    compiled = getattr(regex, f"{name}_REGEX")
+    for text in SAMPLES:
+        assert match(compiled, text) == match(pattern, text), text
+        assert compiled.findall(text) == re.findall(pattern, text), text
+        assert compiled.sub("", text) == re.sub(pattern, "", text), text
+
+
+@pytest.mark.parametrize(
+    "legacy, compiled, flags, matched",
+    [
+        (LEGACY_IP_ADDRESS, regex.IP_ADDRESS_REGEX, 0, ["192.168.0.1"]),
+        (LEGACY_PORT, regex.PORT_REGEX, re.X, ["123456789012345678", "255, 0, 128", "192.168.0.1", "8080"]),
+        (LEGACY_IMAGE, regex.IMAGE_REGEX, 0, ["https://cdn.discordapp.com/emojis/1.png", "http://example.com/a b.gif"]),
+    ],
+)
+def test_escape_fixes(legacy: str, compiled: typing.Pattern[str], flags: int, matched: typing.List[str]):
+    # The double-escaped patterns matched none of the samples; the fixed ones match the expected ones.
+    assert [text for text in SAMPLES if re.match(legacy, text, flags)] == []
+    assert [text for text in SAMPLES if compiled.match(text)] == matched
+
+
+def test_ip_address_escape_fix():
+    assert match(regex.IP_ADDRESS_REGEX, "192.168.0.1") == "192.168.0.1"
+    assert match(regex.IP_ADDRESS_REGEX, "256.1.1.1") is None
+    assert match(regex.IP_ADDRESS_REGEX, "192x168x0x1") is None
+    assert match(LEGACY_IP_ADDRESS, "192.168.0.1") is None
+    assert match(LEGACY_IP_ADDRESS, "192\\.168\\.0\\.1") == "192\\.168\\.0\\.1"
+
+
+@pytest.mark.parametrize(
+    "port, expected", [("1", "1"), ("8080", "8080"), ("65535", "65535"), ("65536", None), ("70000", None), ("0", None)]
+)
+def test_port_escape_fix(port: str, expected: typing.Optional[str]):
+    found = regex.PORT_REGEX.fullmatch(port)
+    assert (found.group("Port") if found is not None else None) == expected
+    assert re.fullmatch(LEGACY_PORT, port, re.X) is None
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://cdn.discordapp.com/attachments/1/2/cat.png",
+        "http://example.com/a.jpeg",
+        "//example.com/a.svg",
+        "https://example.com/a.gif?size=64",
+    ],
+)
+def test_image_escape_fix(url: str):
+    assert regex.IMAGE_REGEX.match(url) is not None
+    assert re.match(LEGACY_IMAGE, url) is None
+    assert re.match(LEGACY_IMAGE, url.replace("/", "\\/").replace(".", "\\.")) is not None
+
+
+def test_image_rejects_non_images():
+    for url in ("https://example.com/a.txt", "https://example.com/png", "cat.png"):
+        assert regex.IMAGE_REGEX.match(url) is None, url
+
+
+def test_compiled_patterns_benchmark():
+    # Precompiled patterns skip `re`'s cache lookup on every call.
+    texts = ["<@!123456789012345678>", "hello", "255, 0, 128"] * 100
+
+    def compiled():
+        for text in texts:
+            regex.USER_MENTION_REGEX.match(text)
+
+    def uncompiled():
+        for text in texts:
+            re.match(regex.USER_MENTION, text)
+
+    compiled_time = min(timeit.repeat(compiled, number=20, repeat=5))
+    uncompiled_time = min(timeit.repeat(uncompiled, number=20, repeat=5))
+    print(f"6k matches: compiled {compiled_time * 1000:.2f}ms, re.match {uncompiled_time * 1000:.2f}ms")
+    assert compiled_time < uncompiled_time